@@ -0,0 +1,58 @@
+import argparse
+
+
+def add_benchmark_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--data-dir",
+                        help="Directory of the XML shards (default: SERVER_FAULTS_DATA_DIR or C:/Data)")
+    parser.add_argument("--generate", type=int, metavar="ROWS",
+                        help="Write a synthetic dump of about ROWS rows to --data-dir first")
+    parser.add_argument("--rows-per-shard", type=int, default=1_000_000)
+    parser.add_argument("--skew", type=float, default=3.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="benchmark.json", help="JSON file for the results")
+    parser.add_argument("--fault-batches", default="1000,100000",
+                        help="Comma-separated sizes of the handle_faults batches")
+    parser.add_argument("--single-faults", type=int, default=1_000)
+    parser.add_argument("--lookup-rows", type=int, default=1_000,
+                        help="Comment and author lookups timed by boolean scan and through the id indexes")
+    parser.add_argument("--group-rows", type=int, default=5_000,
+                        help="Comments used to train the grouping models, 0 for all of them")
+    parser.add_argument("--workers", type=int, help="Processes used by the importers")
+    parser.add_argument("--no-memory", action="store_true", help="Skip tracing peak memory")
+    parser.add_argument("--trace", metavar="PATH", help="Write a Chrome trace of every stage to PATH")
+
+
+def run_benchmark_program(arguments: argparse.Namespace) -> None:
+    # Imported here so building the command line parser stays cheap
+    from Domain.Constants.XmlPaths import DATA_DIR
+    from Services.BenchmarkServices.BenchmarkService import run_benchmarks
+    from Services.SyntheticDataServices.SyntheticDumpGeneratorService import generate_dump, scale_row_counts
+    from Services.TracingServices.TracingService import disable_tracing, enable_tracing
+
+    data_dir = arguments.data_dir or DATA_DIR
+    if arguments.trace:
+        enable_tracing(arguments.trace, trace_memory=not arguments.no_memory)
+
+    if arguments.generate:
+        print(f"\n🏗️ Generating a synthetic dump of {arguments.generate:,} rows in {data_dir}...")
+        generate_dump(data_dir, **scale_row_counts(arguments.generate),
+                      rows_per_shard=arguments.rows_per_shard, skew=arguments.skew, seed=arguments.seed)
+
+    run_benchmarks(
+        data_dir,
+        arguments.output,
+        fault_batch_sizes=[int(size) for size in arguments.fault_batches.split(",") if size],
+        single_faults=arguments.single_faults,
+        lookup_rows=arguments.lookup_rows,
+        group_rows=arguments.group_rows or None,
+        trace_memory=not arguments.no_memory,
+        max_workers=arguments.workers,
+        seed=arguments.seed
+    )
+    disable_tracing()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the import, preprocessing and simulation pipeline.")
+    add_benchmark_arguments(parser)
+    run_benchmark_program(parser.parse_args())
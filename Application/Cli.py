@@ -0,0 +1,252 @@
+import argparse
+import os
+import sys
+import time
+
+from Application.BenchmarkProgram import add_benchmark_arguments, run_benchmark_program
+
+# The command line only imports argparse at start-up. Every command imports what it needs,
+# so rendering a saved run never loads pandas, scikit-learn or SciPy.
+
+GC_MODES = ("off", "generational", "every_n_faults")
+RENDER_MODES = ("auto", "grid", "heatmap")
+
+
+def _apply_common_options(arguments: argparse.Namespace) -> None:
+    # XmlPaths reads the data directory when it is first imported
+    if getattr(arguments, 'data_dir', None):
+        os.environ["SERVER_FAULTS_DATA_DIR"] = arguments.data_dir
+    if getattr(arguments, 'trace', None):
+        from Services.TracingServices.TracingService import enable_tracing
+        enable_tracing(arguments.trace)
+
+
+def _cache_dir(arguments: argparse.Namespace):
+    # Caches and trained models of an explicit --data-dir are kept under it, apart from other dumps
+    if getattr(arguments, 'data_dir', None):
+        return os.path.join(arguments.data_dir, "cache")
+    return None
+
+
+def _data_cache(arguments: argparse.Namespace):
+    from Services.DataCacheServices.DataCacheService import DataCache
+
+    cache_dir = _cache_dir(arguments)
+    return DataCache(cache_dir) if cache_dir else DataCache()
+
+
+def _artifact_store(arguments: argparse.Namespace):
+    from Services.DataCacheServices.GroupingArtifactStoreService import GroupingArtifactStore
+
+    cache_dir = _cache_dir(arguments)
+    return GroupingArtifactStore(os.path.join(cache_dir, "grouping")) if cache_dir else GroupingArtifactStore()
+
+
+def command_import(arguments: argparse.Namespace) -> None:
+    from Domain.Constants.XmlColumns import (COMMENTS_PREPROCESS_COLUMNS, POSTS_PREPROCESS_COLUMNS,
+                                             USERS_PREPROCESS_COLUMNS)
+    from Services.DataImporterServices.CommentsImporterService import load_comments_data
+    from Services.DataImporterServices.PostsImporterService import load_posts_data
+    from Services.DataImporterServices.UsersImporterService import load_users_data
+
+    loaders = {
+        'users': lambda: load_users_data(columns=USERS_PREPROCESS_COLUMNS, discover=True,
+                                         max_workers=arguments.workers),
+        'posts': lambda: load_posts_data(columns=POSTS_PREPROCESS_COLUMNS, discover=True,
+                                         max_workers=arguments.workers),
+        'comments': lambda: load_comments_data(columns=COMMENTS_PREPROCESS_COLUMNS, discover=True,
+                                               max_workers=arguments.workers)
+    }
+    unknown = [dataset for dataset in arguments.datasets if dataset not in loaders]
+    if unknown:
+        raise SystemExit(f"❌ Unknown datasets: {', '.join(unknown)}")
+
+    for dataset in arguments.datasets or loaders:
+        started = time.perf_counter()
+        frame = loaders[dataset]()
+        print(f"✅ Imported {len(frame):,} {dataset} in {time.perf_counter() - started:.2f}s")
+
+
+def command_preprocess(arguments: argparse.Namespace):
+    from Application.MainProgram import load_preprocessed_data
+
+    started = time.perf_counter()
+    users_data, posts_data, comments_data = load_preprocessed_data(data_cache=_data_cache(arguments),
+                                                                   stream_users=arguments.stream_users)
+    print(f"✅ Preprocessed {len(users_data):,} users, {len(posts_data):,} posts and "
+          f"{len(comments_data):,} comments in {time.perf_counter() - started:.2f}s")
+    return users_data, posts_data, comments_data
+
+
+def command_train(arguments: argparse.Namespace) -> None:
+    from Services.ServerWorkSimulationWithFaultsServices.ServerWorkSimulationWithFaultsService import (
+        FaultSimulator)
+
+    users_data, posts_data, comments_data = command_preprocess(arguments)
+    simulator = FaultSimulator(_artifact_store(arguments), seed=arguments.seed, verbose=False)
+    started = time.perf_counter()
+    simulator.group_similar_comments(comments_data, voting=arguments.voting, epochs=arguments.epochs)
+    print(f"✅ Grouping models ready in {time.perf_counter() - started:.2f}s")
+    simulator.cleanup()
+
+
+# Options of the single-process runners that the parallel mode does not support
+SERIAL_ONLY_OPTIONS = ("gc", "gc_every", "metrics_port", "metrics_json", "speed")
+
+
+def _validate_simulate_options(arguments: argparse.Namespace) -> None:
+    # Checked before the dump is preprocessed, so a bad command line fails at once
+    if arguments.interval <= 0:
+        raise SystemExit("❌ --interval must be positive")
+    if arguments.fault_log is not None:
+        if arguments.duration is None:
+            raise SystemExit("❌ --fault-log requires --duration")
+        # The virtual runner only logs the batches of its vectorized path
+        if arguments.workers is None and arguments.faults_per_tick <= 1:
+            raise SystemExit("❌ --fault-log requires --faults-per-tick above 1")
+    if arguments.workers is not None:
+        if arguments.duration is None:
+            raise SystemExit("❌ --workers requires --duration")
+        unsupported = [option for option in SERIAL_ONLY_OPTIONS if getattr(arguments, option) is not None]
+        if unsupported:
+            raise SystemExit("❌ --workers does not support " +
+                             ", ".join("--" + option.replace("_", "-") for option in unsupported))
+
+
+def command_simulate(arguments: argparse.Namespace) -> None:
+    _validate_simulate_options(arguments)
+
+    from Application.MainProgram import SERVER_NAMES
+    from Domain.Models.ServerFleet import ServerFleet
+    from Services.GarbageCollectionServices.GcPolicyService import GcPolicy
+    from Services.ServerMonitorServices.ServerMonitorService import run_simulation, run_virtual_simulation
+
+    users_data, posts_data, comments_data = command_preprocess(arguments)
+    servers_cluster = ServerFleet.generate(arguments.servers) if arguments.servers else ServerFleet(SERVER_NAMES)
+    options = {
+        'artifact_store': _artifact_store(arguments),
+        'seed': arguments.seed,
+        'gc_policy': GcPolicy(**{name: value for name, value in
+                                 (('mode', arguments.gc), ('collect_every', arguments.gc_every))
+                                 if value is not None}),
+        'metrics_port': arguments.metrics_port,
+        'metrics_json_path': arguments.metrics_json
+    }
+
+    if arguments.workers is not None:
+        from Services.ParallelSimulationServices.ParallelFaultSimulationService import run_parallel_simulation
+
+        # The workers handle the expected number of faults of the duration in vectorized batches
+        n_faults = int(arguments.duration / arguments.interval) * arguments.faults_per_tick
+        run_parallel_simulation(users_data, posts_data, comments_data, servers_cluster, n_faults,
+                                n_workers=arguments.workers or None, artifact_store=options['artifact_store'],
+                                seed=arguments.seed, fault_log_path=arguments.fault_log)
+        return
+
+    if arguments.duration is None:
+        run_simulation(users_data, posts_data, comments_data, servers_cluster, arguments.interval, **options)
+        return
+
+    run_virtual_simulation(
+        users_data, posts_data, comments_data, servers_cluster, arguments.duration,
+        fault_interval=arguments.interval,
+        faults_per_tick=arguments.faults_per_tick,
+        realtime=arguments.speed is not None,
+        speed=arguments.speed or 1.0,
+        fault_log_path=arguments.fault_log,
+        **options
+    )
+
+
+def command_status(arguments: argparse.Namespace) -> None:
+    from Services.FaultLogServices.FaultLogService import show_fault_log_status
+
+    show_fault_log_status(arguments.fault_log, arguments.mode)
+
+
+def command_replay(arguments: argparse.Namespace) -> None:
+    from Services.FaultLogServices.FaultLogService import replay_fault_log
+
+    replay_fault_log(arguments.fault_log, arguments.frame_faults, arguments.frame_interval, arguments.mode)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="server_faults", description="Server fault simulation pipeline.")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+
+    # Options shared by the commands that read the dump
+    data_options = argparse.ArgumentParser(add_help=False)
+    data_options.add_argument("--data-dir",
+                              help="Directory of the XML shards, with their caches in <dir>/cache "
+                                   "(overrides SERVER_FAULTS_DATA_DIR)")
+    data_options.add_argument("--trace", metavar="PATH", help="Write a Chrome trace of every stage to PATH")
+    data_options.add_argument("--seed", type=int)
+
+    # Options of the commands that preprocess the dump
+    preprocess_options = argparse.ArgumentParser(add_help=False)
+    preprocess_options.add_argument("--stream-users", action="store_true",
+                                    help="Reduce the users in chunks with bounded memory (IncrementalPCA)")
+
+    import_parser = subcommands.add_parser("import", parents=[data_options], help="Parse the XML shards")
+    import_parser.add_argument("datasets", nargs="*", metavar="DATASET",
+                               help="users, posts or comments, all three by default")
+    import_parser.add_argument("--workers", type=int, help="Parser processes, one per CPU core by default")
+    import_parser.set_defaults(handler=command_import)
+
+    preprocess_parser = subcommands.add_parser("preprocess", parents=[data_options, preprocess_options],
+                                               help="Import and preprocess the dump into the data cache")
+    preprocess_parser.set_defaults(handler=command_preprocess)
+
+    train_parser = subcommands.add_parser("train", parents=[data_options, preprocess_options],
+                                          help="Train the comment grouping models into the artifact store")
+    train_parser.add_argument("--voting", choices=["hard", "soft"], default="hard")
+    train_parser.add_argument("--epochs", type=int, default=1)
+    train_parser.set_defaults(handler=command_train)
+
+    simulate_parser = subcommands.add_parser("simulate", parents=[data_options, preprocess_options],
+                                             help="Run the fault simulation")
+    simulate_parser.add_argument("--duration", type=float,
+                                 help="Simulated seconds on a virtual clock; "
+                                      "runs in real time until stopped if omitted")
+    simulate_parser.add_argument("--interval", type=float, default=7, help="Seconds between faults")
+    simulate_parser.add_argument("--faults-per-tick", type=int, default=1)
+    simulate_parser.add_argument("--speed", type=float, help="Pace a virtual run at this many times real time")
+    simulate_parser.add_argument("--servers", type=int, help="Simulate a generated fleet of this many servers")
+    simulate_parser.add_argument("--fault-log", help="Save the handled faults of a virtual run for replay (.npz)")
+    simulate_parser.add_argument("--workers", type=int,
+                                 help="Split the fleet between this many processes, 0 for one per CPU core")
+    simulate_parser.add_argument("--gc", choices=GC_MODES, help="Garbage collection policy (default: generational)")
+    simulate_parser.add_argument("--gc-every", type=int, help="Faults between collections (default: 10000)")
+    simulate_parser.add_argument("--metrics-port", type=int, help="Serve Prometheus metrics on this local port")
+    simulate_parser.add_argument("--metrics-json", help="Write the metrics to this JSON file at shutdown")
+    simulate_parser.set_defaults(handler=command_simulate)
+
+    bench_parser = subcommands.add_parser("bench", help="Benchmark every pipeline stage")
+    add_benchmark_arguments(bench_parser)
+    bench_parser.set_defaults(handler=run_benchmark_program)
+
+    status_parser = subcommands.add_parser("status", help="Show the servers' status at the end of a saved run")
+    status_parser.add_argument("fault_log")
+    status_parser.add_argument("--mode", choices=RENDER_MODES, default="auto")
+    status_parser.set_defaults(handler=command_status)
+
+    replay_parser = subcommands.add_parser("replay", help="Replay a saved run on the terminal")
+    replay_parser.add_argument("fault_log")
+    replay_parser.add_argument("--frame-faults", type=int, default=1000, help="Faults added per frame")
+    replay_parser.add_argument("--frame-interval", type=float, default=0.05, help="Seconds between frames")
+    replay_parser.add_argument("--mode", choices=RENDER_MODES, default="auto")
+    replay_parser.set_defaults(handler=command_replay)
+
+    return parser
+
+
+def main(argv=None) -> int:
+    arguments = build_parser().parse_args(argv)
+    if arguments.handler is not run_benchmark_program:
+        _apply_common_options(arguments)
+    arguments.handler(arguments)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,36 +1,104 @@
-from Domain.Models.Server import Server
+from Domain.Constants.XmlColumns import (COMMENTS_PREPROCESS_COLUMNS, POSTS_PREPROCESS_COLUMNS,
+                                         USERS_PREPROCESS_COLUMNS)
+from Domain.Constants.XmlPaths import COMMENTS_XML_PATH, POSTS_XML_PATH, USERS_XML_PATH
+from Domain.Models.ServerFleet import ServerFleet
+from Services.DataCacheServices.DataCacheService import DataCache
+from Services.DataCacheServices.GroupingArtifactStoreService import GroupingArtifactStore
 from Services.DataImporterServices.CommentsImporterService import load_comments_data
 from Services.DataImporterServices.PostsImporterService import load_posts_data
-from Services.DataImporterServices.UsersImporterService import load_users_data
+from Services.DataImporterServices.ShardLoaderService import discover_shards
+from Services.DataImporterServices.UsersImporterService import iter_users_data, load_users_data
+from Services.DataImporterServices.XmlColumnReaderService import RowFilter
 from Services.DataPreprocessServices.CommentsDataPreprocessService import preprocess_comments_data
 from Services.DataPreprocessServices.PostsDataPreprocessService import preprocess_posts_data
-from Services.DataPreprocessServices.UserDataPreprocessService import preprocess_users_data
+from Services.DataPreprocessServices.UserDataPreprocessService import (preprocess_users_data,
+                                                                      preprocess_users_data_streaming)
+from Services.MetricsServices.SimulationMetricsService import DEFAULT_METRICS_PORT
 from Services.ServerMonitorServices.ServerMonitorService import run_simulation
 
-if __name__ == "__main__":
-    # Load and preprocess data
-    users_df = load_users_data()
-    posts_df = load_posts_data()
-    comments_df = load_comments_data()
+# Servers of the simulated cluster
+SERVER_NAMES = [
+    "Lenovo ThinkCentre MQ 7i",
+    "Dell OptiFlex 70D",
+    "HP OmniRun 2V",
+    "Lenovo ThinkStation P350",
+    "Dell PowerEdge T40",
+    "HP ProLant DL360",
+    "Lenovo ThinkEdge SE50",
+    "Dell Latitude 7520",
+    "HP ZBook Firefly G9",
+    "Lenovo Legion T5 28IMB05"
+]
+
+
+def load_preprocessed_data(data_cache: DataCache = None, stream_users: bool = False):
+    """
+    Imports and preprocesses every shard of the users, posts and comments dumps,
+    reusing the cached frames when the shards and parameters are unchanged.
+
+    Args:
+        data_cache (DataCache, optional): Cache of the preprocessed frames.
+        stream_users (bool): Reduce the users chunk by chunk with preprocess_users_data_streaming,
+                             for users dumps larger than RAM.
 
-    users_data = preprocess_users_data(users_df)
+    Returns:
+        tuple: (users, posts, comments) DataFrames.
+    """
+    # Preprocessed frames are cached on disk, keyed by the source shards and the preprocessing parameters
+    data_cache = data_cache or DataCache()
+    users_shards = discover_shards(USERS_XML_PATH)
+    posts_shards = discover_shards(POSTS_XML_PATH)
+    comments_shards = discover_shards(COMMENTS_XML_PATH)
+    users_params = {'columns': USERS_PREPROCESS_COLUMNS, 'min_reputation': 50, 'n_components': 1,
+                    'streaming': stream_users}
+    posts_params = {'columns': POSTS_PREPROCESS_COLUMNS, 'post_type_ids': [1, 2], 'users': users_params}
+    comments_params = {'columns': COMMENTS_PREPROCESS_COLUMNS}
+
+    # Load every shard found on disk in parallel. Users are preprocessed first
+    # so the reputation filter can be pushed into the posts import
+    def build_users_data():
+        if stream_users:
+            return preprocess_users_data_streaming(
+                iter_users_data(columns=USERS_PREPROCESS_COLUMNS, discover=True),
+                min_reputation=users_params['min_reputation'],
+                n_components=users_params['n_components']
+            )
+        return preprocess_users_data(
+            load_users_data(columns=USERS_PREPROCESS_COLUMNS, discover=True),
+            min_reputation=users_params['min_reputation'],
+            n_components=users_params['n_components']
+        )
+
+    users_data = data_cache.get_or_build('users', users_shards, users_params, build_users_data)
     reputable_user_ids = users_data['AccountId'].tolist()
-    posts_data = preprocess_posts_data(posts_df, reputable_user_ids)
-    comments_data = preprocess_comments_data(comments_df)
+
+    posts_data = data_cache.get_or_build(
+        'posts', users_shards + posts_shards, posts_params,
+        lambda: preprocess_posts_data(
+            load_posts_data(
+                columns=POSTS_PREPROCESS_COLUMNS,
+                predicate=RowFilter({'PostTypeId': posts_params['post_type_ids'], 'OwnerUserId': reputable_user_ids}),
+                discover=True
+            ),
+            reputable_user_ids
+        )
+    )
+
+    comments_data = data_cache.get_or_build(
+        'comments', comments_shards, comments_params,
+        lambda: preprocess_comments_data(load_comments_data(columns=COMMENTS_PREPROCESS_COLUMNS, discover=True))
+    )
+
+    return users_data, posts_data, comments_data
+
+
+if __name__ == "__main__":
+    users_data, posts_data, comments_data = load_preprocessed_data()
 
     # Initialize servers
-    servers_cluster = [
-        Server("Lenovo ThinkCentre MQ 7i"),
-        Server("Dell OptiFlex 70D"),
-        Server("HP OmniRun 2V"),
-        Server("Lenovo ThinkStation P350"),
-        Server("Dell PowerEdge T40"),
-        Server("HP ProLant DL360"),
-        Server("Lenovo ThinkEdge SE50"),
-        Server("Dell Latitude 7520"),
-        Server("HP ZBook Firefly G9"),
-        Server("Lenovo Legion T5 28IMB05")
-    ]
-
-    # Run simulation with proper resource management
-    run_simulation(users_data, posts_data, comments_data, servers_cluster)
\ No newline at end of file
+    servers_cluster = ServerFleet(SERVER_NAMES)
+
+    # Run simulation with proper resource management, reusing trained grouping models across restarts.
+    # Metrics are served on localhost in the Prometheus text format while it runs
+    run_simulation(users_data, posts_data, comments_data, servers_cluster, artifact_store=GroupingArtifactStore(),
+                   metrics_port=DEFAULT_METRICS_PORT)
\ No newline at end of file
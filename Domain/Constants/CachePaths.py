@@ -0,0 +1,7 @@
+import os
+
+from Domain.Constants.XmlPaths import DATA_DIR
+
+# Caches live next to the data they were built from unless SERVER_FAULTS_CACHE_DIR points elsewhere
+DATA_CACHE_DIR = os.environ.get("SERVER_FAULTS_CACHE_DIR", DATA_DIR + "/cache").rstrip("/\\")
+GROUPING_ARTIFACTS_DIR = DATA_CACHE_DIR + "/grouping"
@@ -0,0 +1,50 @@
+import pandas as pd
+
+# Pandas dtypes of the attributes of each Stack Exchange dump, mirroring the fields of Domain/Models.
+# Ids are nullable Int64, scores and counts nullable Int32 and dates datetime64.
+# Text attributes are not listed and keep the dtype they were parsed into.
+ID_DTYPE = "Int64"
+COUNT_DTYPE = "Int32"
+DATE_DTYPE = "datetime64[ms]"
+
+# Question, Answer, OrphanedTagWiki, TagWikiExcerpt, TagWiki, ModeratorNomination, WikiPlaceholder, PrivilegeWiki
+POST_TYPE_DTYPE = pd.CategoricalDtype(categories=range(1, 9))
+
+USERS_SCHEMA = {
+    "Id": ID_DTYPE,
+    "Reputation": COUNT_DTYPE,
+    "CreationDate": DATE_DTYPE,
+    "LastAccessDate": DATE_DTYPE,
+    "Views": COUNT_DTYPE,
+    "UpVotes": COUNT_DTYPE,
+    "DownVotes": COUNT_DTYPE,
+    "AccountId": ID_DTYPE,
+}
+
+POSTS_SCHEMA = {
+    "Id": ID_DTYPE,
+    "PostTypeId": POST_TYPE_DTYPE,
+    "AcceptedAnswerId": ID_DTYPE,
+    "ParentId": ID_DTYPE,
+    "CreationDate": DATE_DTYPE,
+    "DeletionDate": DATE_DTYPE,
+    "Score": COUNT_DTYPE,
+    "ViewCount": COUNT_DTYPE,
+    "OwnerUserId": ID_DTYPE,
+    "LastEditorUserId": ID_DTYPE,
+    "LastEditDate": DATE_DTYPE,
+    "LastActivityDate": DATE_DTYPE,
+    "AnswerCount": COUNT_DTYPE,
+    "CommentCount": COUNT_DTYPE,
+    "FavoriteCount": COUNT_DTYPE,
+    "ClosedDate": DATE_DTYPE,
+    "CommunityOwnedDate": DATE_DTYPE,
+}
+
+COMMENTS_SCHEMA = {
+    "Id": ID_DTYPE,
+    "PostId": ID_DTYPE,
+    "Score": COUNT_DTYPE,
+    "CreationDate": DATE_DTYPE,
+    "UserId": ID_DTYPE,
+}
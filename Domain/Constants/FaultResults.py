@@ -0,0 +1,22 @@
+import numpy as np
+
+# Outcomes of resolve_fault
+FAULT_RESOLVED = "resolved"
+FAULT_PARTIALLY_RESOLVED = "partially_resolved"
+FAULT_UNRESOLVED = "unresolved"
+
+# Status codes of the batch results of handle_faults
+STATUS_UNRESOLVED = 0
+STATUS_PARTIALLY_RESOLVED = 1
+STATUS_RESOLVED = 2
+
+# Outcome of each status code, indexed by the code
+STATUS_OUTCOMES = (FAULT_UNRESOLVED, FAULT_PARTIALLY_RESOLVED, FAULT_RESOLVED)
+
+FAULT_RESULT_DTYPE = np.dtype([
+    ('post_id', np.int64),
+    ('server_index', np.int64),
+    ('comment_id', np.int64),
+    ('user_row', np.int64),
+    ('status', np.int8)
+])
@@ -0,0 +1,59 @@
+# Attributes of each Stack Exchange dump, mapped to the kind of buffer they are parsed into
+USERS_COLUMNS = {
+    "Id": "int",
+    "Reputation": "int",
+    "CreationDate": "str",
+    "DisplayName": "str",
+    "LastAccessDate": "str",
+    "WebsiteUrl": "str",
+    "Location": "str",
+    "AboutMe": "str",
+    "Views": "int",
+    "UpVotes": "int",
+    "DownVotes": "int",
+    "ProfileImageUrl": "str",
+    "EmailHash": "str",
+    "AccountId": "int",
+}
+
+POSTS_COLUMNS = {
+    "Id": "int",
+    "PostTypeId": "int",
+    "AcceptedAnswerId": "int",
+    "ParentId": "int",
+    "CreationDate": "str",
+    "DeletionDate": "str",
+    "Score": "int",
+    "ViewCount": "int",
+    "Body": "str",
+    "OwnerUserId": "int",
+    "OwnerDisplayName": "str",
+    "LastEditorUserId": "int",
+    "LastEditorDisplayName": "str",
+    "LastEditDate": "str",
+    "LastActivityDate": "str",
+    "Title": "str",
+    "Tags": "str",
+    "AnswerCount": "int",
+    "CommentCount": "int",
+    "FavoriteCount": "int",
+    "ClosedDate": "str",
+    "CommunityOwnedDate": "str",
+    "ContentLicense": "str",
+}
+
+COMMENTS_COLUMNS = {
+    "Id": "int",
+    "PostId": "int",
+    "Score": "int",
+    "Text": "str",
+    "CreationDate": "str",
+    "UserDisplayName": "str",
+    "UserId": "int",
+    "ContentLicense": "str",
+}
+
+# Columns actually used by the preprocessing services
+USERS_PREPROCESS_COLUMNS = ["AccountId", "DisplayName", "Reputation", "UpVotes"]
+POSTS_PREPROCESS_COLUMNS = ["Id", "PostTypeId", "Score", "Title", "OwnerUserId", "AnswerCount", "Body"]
+COMMENTS_PREPROCESS_COLUMNS = ["Id", "PostId", "Score", "Text", "UserId"]
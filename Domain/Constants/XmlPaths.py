@@ -1,3 +1,8 @@
-COMMENTS_XML_PATH = "C:/Data/Comments-{}.xml"
-POSTS_XML_PATH = "C:/Data/Posts-{}.xml"
-USERS_XML_PATH = "C:/Data/Users-{}.xml"
\ No newline at end of file
+import os
+
+# Directory of the Stack Exchange dump shards, overridable to point at another dump or a synthetic one
+DATA_DIR = os.environ.get("SERVER_FAULTS_DATA_DIR", "C:/Data").rstrip("/\\")
+
+COMMENTS_XML_PATH = DATA_DIR + "/Comments-{}.xml"
+POSTS_XML_PATH = DATA_DIR + "/Posts-{}.xml"
+USERS_XML_PATH = DATA_DIR + "/Users-{}.xml"
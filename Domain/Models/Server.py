@@ -1,17 +1,63 @@
 import uuid
 
 class Server:
+    """
+    A single server. Standalone servers keep their own data; servers obtained from a
+    ServerFleet are lightweight views over the fleet's columnar arrays.
+    """
+    __slots__ = ('_fleet', '_index', '_id_servera', '_naziv', '_lista_otkaza')
+
     def __init__(self, naziv, lista_otkaza=None):
-        self.id_servera = str(uuid.uuid4())
-        self.naziv = naziv
-        self.lista_otkaza = lista_otkaza if lista_otkaza is not None else []
+        self._fleet = None
+        self._index = -1
+        self._id_servera = str(uuid.uuid4())
+        self._naziv = naziv
+        self._lista_otkaza = lista_otkaza if lista_otkaza is not None else []
+
+    @classmethod
+    def fleet_view(cls, fleet, index):
+        server = cls.__new__(cls)
+        server._fleet = fleet
+        server._index = index
+        server._id_servera = None
+        server._naziv = None
+        server._lista_otkaza = None
+        return server
+
+    @property
+    def id_servera(self):
+        if self._fleet is not None:
+            return self._fleet.server_id(self._index)
+        return self._id_servera
+
+    @property
+    def naziv(self):
+        if self._fleet is not None:
+            return self._fleet.server_name(self._index)
+        return self._naziv
+
+    @property
+    def lista_otkaza(self):
+        # A fleet view returns a copy as a list; faults are added with dodaj_otkaz
+        if self._fleet is not None:
+            return self._fleet.fault_ids(self._index).tolist()
+        return self._lista_otkaza
+
+    @property
+    def broj_otkaza(self):
+        if self._fleet is not None:
+            return self._fleet.fault_count(self._index)
+        return len(self._lista_otkaza)
 
     def dodaj_otkaz(self, otkaz_id):
         if isinstance(otkaz_id, int):
-            self.lista_otkaza.append(otkaz_id)
+            if self._fleet is not None:
+                self._fleet.add_fault(self._index, otkaz_id)
+            else:
+                self._lista_otkaza.append(otkaz_id)
         else:
             raise ValueError("ID must be primary key!")
 
     def __str__(self):
         return ("ID: " + self.id_servera + "\n" + self.naziv
-                + "\nFaulty Times: " + len(self.lista_otkaza).__str__() + "\n")
\ No newline at end of file
+                + "\nFaulty Times: " + self.broj_otkaza.__str__() + "\n")
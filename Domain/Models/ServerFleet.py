@@ -0,0 +1,170 @@
+import os
+import uuid
+
+import numpy as np
+
+from Domain.Models.Server import Server
+
+
+class ServerFleet:
+    """
+    Columnar container for a cluster of servers.
+
+    Server ids (rows of 16 raw uuid bytes), names and fault counts are kept in NumPy arrays, and
+    the fault ids of all servers go into a single append-only int64 log next to the index
+    of the faulty server. A copy of the log grouped by server is kept up to date lazily
+    when a server's fault list is requested: only the faults appended since the last request
+    are sorted and merged in. Indexing or iterating the fleet yields Server views, so code
+    written against a list of Server objects keeps working.
+    """
+    def __init__(self, names, server_ids=None):
+        self._names = np.array(list(names), dtype=str)
+        n = len(self._names)
+
+        if server_ids is None:
+            # Random version 4 uuids generated in one vectorized pass
+            raw = np.frombuffer(os.urandom(16 * n), dtype=np.uint8).reshape(n, 16).copy()
+            raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40
+            raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80
+            self._ids = raw
+        else:
+            raw_ids = b"".join(uuid.UUID(str(server_id)).bytes for server_id in server_ids)
+            self._ids = np.frombuffer(raw_ids, dtype=np.uint8).reshape(-1, 16).copy()
+            if len(self._ids) != n:
+                raise ValueError("server_ids must have one id per name")
+
+        self.fault_counts = np.zeros(n, dtype=np.int64)
+
+        self._log_size = 0
+        self._log_fault_ids = np.empty(1024, dtype=np.int64)
+        self._log_servers = np.empty(1024, dtype=np.int32 if n < 2 ** 31 else np.int64)
+
+        self._offsets = np.zeros(n + 1, dtype=np.int64)
+        self._grouped_fault_ids = np.empty(0, dtype=np.int64)
+        self._grouped_log_size = 0
+
+    @classmethod
+    def generate(cls, n_servers: int, name_prefix: str = "Server"):
+        """
+        Creates a fleet of n_servers servers named "<name_prefix> <number>".
+        """
+        return cls([f"{name_prefix} {i + 1}" for i in range(n_servers)])
+
+    @classmethod
+    def from_servers(cls, servers):
+        """
+        Copies existing Server objects, with their ids and faults, into a new fleet.
+        """
+        servers = list(servers)
+        fleet = cls([server.naziv for server in servers], [server.id_servera for server in servers])
+        for index, server in enumerate(servers):
+            fault_ids = np.asarray(server.lista_otkaza, dtype=np.int64)
+            fleet.add_faults(np.full(len(fault_ids), index), fault_ids)
+        return fleet
+
+    def __len__(self):
+        return len(self._names)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [Server.fleet_view(self, i) for i in range(*index.indices(len(self)))]
+        index = int(index)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Server index out of range")
+        return Server.fleet_view(self, index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield Server.fleet_view(self, index)
+
+    @property
+    def total_faults(self) -> int:
+        return self._log_size
+
+    @property
+    def names(self) -> np.ndarray:
+        return self._names
+
+    def server_id(self, index: int) -> str:
+        return str(uuid.UUID(bytes=self._ids[index].tobytes()))
+
+    def server_name(self, index: int) -> str:
+        return str(self._names[index])
+
+    def fault_count(self, index: int) -> int:
+        return int(self.fault_counts[index])
+
+    def _reserve(self, extra: int) -> None:
+        required = self._log_size + extra
+        if required > len(self._log_fault_ids):
+            capacity = max(required, 2 * len(self._log_fault_ids))
+            self._log_fault_ids = np.resize(self._log_fault_ids, capacity)
+            self._log_servers = np.resize(self._log_servers, capacity)
+
+    def add_fault(self, index: int, fault_id: int) -> None:
+        self._reserve(1)
+        self._log_fault_ids[self._log_size] = fault_id
+        self._log_servers[self._log_size] = index
+        self._log_size += 1
+        self.fault_counts[index] += 1
+
+    def add_faults(self, server_indices, fault_ids) -> None:
+        """
+        Appends many faults at once; server_indices[i] is the server of fault_ids[i].
+        """
+        server_indices = np.asarray(server_indices, dtype=np.int64)
+        fault_ids = np.asarray(fault_ids, dtype=np.int64)
+        if len(server_indices) != len(fault_ids):
+            raise ValueError("server_indices and fault_ids must have the same length")
+
+        self._reserve(len(fault_ids))
+        end = self._log_size + len(fault_ids)
+        self._log_fault_ids[self._log_size:end] = fault_ids
+        self._log_servers[self._log_size:end] = server_indices
+        self._log_size = end
+        self.fault_counts += np.bincount(server_indices, minlength=len(self))
+
+    def _merge_new_faults(self) -> None:
+        start, end = self._grouped_log_size, self._log_size
+        tail_servers = self._log_servers[start:end].astype(np.int64)
+        order = np.argsort(tail_servers, kind='stable')
+        tail_servers = tail_servers[order]
+        tail_counts = np.bincount(tail_servers, minlength=len(self))
+
+        offsets = np.zeros(len(self) + 1, dtype=np.int64)
+        np.cumsum(self.fault_counts, out=offsets[1:])
+        grouped = np.empty(end, dtype=np.int64)
+
+        # Every server's earlier faults move by the number of new faults of the servers before it
+        shifts = offsets[:-1] - self._offsets[:-1]
+        grouped[np.arange(start) + np.repeat(shifts, np.diff(self._offsets))] = self._grouped_fault_ids
+
+        # The new faults go, in the order they were added, behind their server's earlier faults
+        tail_starts = np.cumsum(tail_counts) - tail_counts
+        tail_positions = offsets[1:][tail_servers] - tail_counts[tail_servers] + np.arange(len(order)) \
+            - tail_starts[tail_servers]
+        grouped[tail_positions] = self._log_fault_ids[start:end][order]
+
+        grouped.flags.writeable = False
+        self._grouped_fault_ids = grouped
+        self._offsets = offsets
+        self._grouped_log_size = end
+
+    def fault_ids(self, index: int) -> np.ndarray:
+        """
+        Returns the fault ids of a server in the order they were added, as a read-only view.
+        """
+        if self._grouped_log_size != self._log_size:
+            self._merge_new_faults()
+        return self._grouped_fault_ids[self._offsets[index]:self._offsets[index + 1]]
+
+
+def fault_counts_of(servers) -> np.ndarray:
+    """
+    Returns the fault count of every server of a ServerFleet or of a list of Server objects.
+    """
+    if isinstance(servers, ServerFleet):
+        return servers.fault_counts
+    return np.fromiter((server.broj_otkaza for server in servers), dtype=np.int64, count=len(servers))
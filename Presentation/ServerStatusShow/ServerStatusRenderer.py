@@ -0,0 +1,173 @@
+import shutil
+import sys
+from typing import Optional, TextIO
+
+import numpy as np
+
+from Domain.Models.ServerFleet import fault_counts_of
+from Presentation.ServerStatusShow.ServerStatusUI import (
+    CARD_SPACING, CARD_WIDTH, SERVER_ART_LINES, fault_label, grid_columns, server_card_lines)
+
+# Render modes
+MODE_AUTO = "auto"
+MODE_GRID = "grid"
+MODE_HEATMAP = "heatmap"
+
+# Card lines: the ASCII art, ID, name and fault count, then a blank line between rows
+CARD_HEIGHT = len(SERVER_ART_LINES) + 4
+FAULT_LINE_OFFSET = len(SERVER_ART_LINES) + 2
+HEADER_LINES = 2
+
+# Heat map shades for 0, 1-9, 10-99, 100-999 and 1000+ faults
+HEATMAP_SHADES = "·░▒▓█"
+
+
+class ServerStatusRenderer:
+    """
+    Incremental terminal view of a server fleet.
+
+    The first frame clears the screen and draws every cell. Later frames move the
+    cursor with ANSI escape codes and rewrite only the cells whose value changed since
+    the previous frame, so a redraw costs in proportion to the changes rather than to
+    the fleet size.
+
+    Fleets that fit on the screen are drawn as a grid of server cards sized to the
+    terminal. Larger fleets, or mode='heatmap', are drawn as a heat map with one
+    character per server, or per group of neighbouring servers showing the group's
+    highest fault count when the fleet is larger than the screen.
+    """
+    def __init__(self, servers, mode: str = MODE_AUTO, stream: Optional[TextIO] = None,
+                 terminal_size: Optional[tuple] = None):
+        if mode not in (MODE_AUTO, MODE_GRID, MODE_HEATMAP):
+            raise ValueError(f"Unknown render mode: {mode}")
+
+        self.servers = servers
+        self.mode = mode
+        self.stream = stream or sys.stdout
+        self._terminal_size = terminal_size
+        self._layout = None
+        self._cell_values = None
+
+    def _plan_layout(self) -> dict:
+        columns, lines = self._terminal_size or shutil.get_terminal_size()
+        n_servers = len(self.servers)
+        body_lines = max(1, lines - HEADER_LINES - 1)
+
+        card_columns = grid_columns(columns)
+        card_capacity = card_columns * max(1, body_lines // CARD_HEIGHT)
+        mode = self.mode
+        if mode == MODE_AUTO:
+            mode = MODE_GRID if n_servers <= card_capacity else MODE_HEATMAP
+
+        if mode == MODE_GRID:
+            n_cells = min(n_servers, card_capacity)
+            return {
+                'mode': mode,
+                'terminal': (columns, lines),
+                'n_servers': n_servers,
+                'columns': card_columns,
+                'n_cells': n_cells,
+                'servers_per_cell': 1,
+                'body_lines': -(-n_cells // card_columns) * CARD_HEIGHT
+            }
+
+        # Heat map with one line kept for the legend
+        heatmap_cells = columns * max(1, body_lines - 1)
+        servers_per_cell = max(1, -(-n_servers // heatmap_cells))
+        n_cells = -(-n_servers // servers_per_cell)
+        return {
+            'mode': mode,
+            'terminal': (columns, lines),
+            'n_servers': n_servers,
+            'columns': columns,
+            'n_cells': n_cells,
+            'servers_per_cell': servers_per_cell,
+            'body_lines': -(-n_cells // columns) + 1
+        }
+
+    def _cell_values_for(self, fault_counts: np.ndarray) -> np.ndarray:
+        layout = self._layout
+        if layout['mode'] == MODE_GRID or len(fault_counts) == 0:
+            return fault_counts[:layout['n_cells']].copy()
+
+        # Highest fault count of each group of servers, bucketed by order of magnitude
+        group_max = np.maximum.reduceat(fault_counts, np.arange(0, len(fault_counts), layout['servers_per_cell']))
+        return np.minimum(np.ceil(np.log10(group_max + 1.0)), len(HEATMAP_SHADES) - 1).astype(np.int64)
+
+    def _cell_position(self, cell: int) -> tuple:
+        # 1-based terminal (line, column) of the text that shows a cell's value
+        layout = self._layout
+        row, column = divmod(cell, layout['columns'])
+        if layout['mode'] == MODE_GRID:
+            return (HEADER_LINES + row * CARD_HEIGHT + FAULT_LINE_OFFSET + 1,
+                    column * (CARD_WIDTH + CARD_SPACING) + 1)
+        return HEADER_LINES + row + 1, column + 1
+
+    def _cell_text(self, value: int) -> str:
+        if self._layout['mode'] == MODE_GRID:
+            return fault_label(int(value)).center(CARD_WIDTH)
+        return HEATMAP_SHADES[value]
+
+    def _header(self, fault_counts: np.ndarray) -> str:
+        layout = self._layout
+        header = (f"📡 {layout['n_servers']:,} servers | {int(fault_counts.sum()):,} faults | "
+                  f"max {int(fault_counts.max(initial=0)):,} per server")
+        if layout['mode'] == MODE_HEATMAP and layout['servers_per_cell'] > 1:
+            header += f" | {layout['servers_per_cell']} servers per cell"
+        elif layout['n_cells'] < layout['n_servers']:
+            header += f" | showing {layout['n_cells']:,}"
+        return header
+
+    def _full_frame(self) -> list[str]:
+        layout = self._layout
+        parts = ["\x1b[2J\x1b[H", "\n" * HEADER_LINES]
+        if layout['mode'] == MODE_GRID:
+            lines = []
+            for row_start in range(0, layout['n_cells'], layout['columns']):
+                row_cards = [server_card_lines(self.servers[index])
+                             for index in range(row_start, min(row_start + layout['columns'], layout['n_cells']))]
+                for line_parts in zip(*row_cards):
+                    lines.append((" " * CARD_SPACING).join(line_parts))
+                lines.append("")
+        else:
+            shades = np.array(list(HEATMAP_SHADES))[self._cell_values]
+            lines = ["".join(shades[row_start:row_start + layout['columns']])
+                     for row_start in range(0, layout['n_cells'], layout['columns'])]
+            lines.append("  ".join(f"{shade} {label}" for shade, label in
+                                   zip(HEATMAP_SHADES, ("0", "1-9", "10-99", "100-999", "1000+ faults"))))
+        parts.append("\n".join(lines))
+        return parts
+
+    def render(self, force_full: bool = False) -> int:
+        """
+        Draws the next frame.
+
+        Returns:
+            int: Number of cells that were drawn.
+        """
+        fault_counts = fault_counts_of(self.servers)
+        terminal = self._terminal_size or tuple(shutil.get_terminal_size())
+        full = (force_full or self._layout is None or self._layout['terminal'] != terminal
+                or self._layout['n_servers'] != len(self.servers))
+
+        if full:
+            self._layout = self._plan_layout()
+            self._cell_values = self._cell_values_for(fault_counts)
+            parts = self._full_frame()
+            drawn = self._layout['n_cells']
+        else:
+            cell_values = self._cell_values_for(fault_counts)
+            changed = np.flatnonzero(cell_values != self._cell_values)
+            self._cell_values = cell_values
+            parts = []
+            for cell in changed:
+                line, column = self._cell_position(int(cell))
+                parts.append(f"\x1b[{line};{column}H{self._cell_text(cell_values[cell])}")
+            drawn = len(changed)
+
+        # The header is rewritten every frame, then the cursor is parked below the frame
+        parts.append(f"\x1b[1;1H\x1b[2K{self._header(fault_counts)}")
+        parts.append(f"\x1b[{HEADER_LINES + self._layout['body_lines'] + 1};1H")
+        self.stream.write("".join(parts))
+        self.stream.flush()
+        return drawn
@@ -1,57 +1,66 @@
+import shutil
+
 from Domain.Models.Server import Server
 
+# ASCII art for the server
+SERVER_ART_LINES = (
+    " ---------- ",
+    " | SERVER | ",
+    " ---------- ",
+)
+CARD_WIDTH = len(SERVER_ART_LINES[0])
+CARD_SPACING = 2
+
+# Layout of the rows of small clusters
+PYRAMID_ROW_LAYOUT = [4, 3, 2, 1]
+
+
+def fault_label(fault_count: int) -> str:
+    label = f"{fault_count} faults"
+    return label if len(label) <= CARD_WIDTH else str(fault_count)
+
+
+def server_card_lines(server: Server) -> list[str]:
+    """
+    Returns the lines of one server's card: the ASCII art followed by the centered
+    first 8 characters of its ID, its name and its fault count.
+    """
+    info_lines = [
+        server.id_servera[0:8],
+        server.naziv.split(' ')[0],
+        fault_label(server.broj_otkaza),
+    ]
+    return list(SERVER_ART_LINES) + [line.center(CARD_WIDTH) for line in info_lines]
+
+
+def grid_columns(terminal_columns: int) -> int:
+    return max(1, (terminal_columns + CARD_SPACING) // (CARD_WIDTH + CARD_SPACING))
+
 
 def show_servers_status(serveri: list[Server]):
-    # ASCII art for the server
-    ascii_server = (
-        " ---------- \n"
-        " | SERVER | \n"
-        " ---------- \n"
-    )
-
-    # Define the layout for rows
-    row_layouts = [4, 3, 2, 1]
-    row_count = 0
-
-    result = ""
-    server_index = 0
+    """
+    Prints every server's card. Up to 10 servers are laid out in rows of 4, 3, 2 and 1;
+    larger fleets are laid out in a grid as wide as the terminal.
+    """
+    if len(serveri) <= sum(PYRAMID_ROW_LAYOUT):
+        row_sizes = PYRAMID_ROW_LAYOUT
+    else:
+        columns = grid_columns(shutil.get_terminal_size().columns)
+        row_sizes = [columns] * -(-len(serveri) // columns)
 
-    for row_size in row_layouts:
+    lines = []
+    server_index = 0
+    for row_size in row_sizes:
         if server_index >= len(serveri):
             break
 
-        # Collect ASCII art for the current row
-        row_ascii_art = []
-        for i in range(row_size):
-            if server_index >= len(serveri):
-                break
-
-            server = serveri[server_index]
-
-            # Generate centered info
-            info_lines = [
-                server.id_servera[0:8],  # First 8 chars of id_servera
-                server.naziv.split(' ')[0],  # Server name
-                f"{len(server.lista_otkaza)} faults",  # Fault count
-            ]
-            # Calculate maximum width of ASCII art for centering
-            max_width = len(ascii_server.splitlines()[0])
-            centered_info = "\n".join(
-                line.center(max_width) for line in info_lines
-            )
-            # Combine ASCII art and centered info
-            server_ascii = ascii_server + centered_info
-            row_ascii_art.append(server_ascii)
-            server_index += 1
-
-        # Append the row to the result
-        max_lines = max(len(s.splitlines()) for s in row_ascii_art)
-        for line_num in range(max_lines):
-            result += "  ".join(
-                server.splitlines()[line_num] if line_num < len(server.splitlines()) else " " * 10
-                for server in row_ascii_art
-            ) + "\n"
-
-        result += "\n"  # Add space between rows
-
-    print(result)
+        # Cards of the current row, joined line by line
+        row_cards = [server_card_lines(serveri[index])
+                     for index in range(server_index, min(server_index + row_size, len(serveri)))]
+        server_index += len(row_cards)
+        for line_parts in zip(*row_cards):
+            lines.append((" " * CARD_SPACING).join(line_parts))
+
+        lines.append("")  # Add space between rows
+
+    print("\n".join(lines) + "\n")
@@ -0,0 +1,219 @@
+import gc
+import json
+import os
+import platform
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from Domain.Constants.XmlColumns import (COMMENTS_PREPROCESS_COLUMNS, POSTS_PREPROCESS_COLUMNS,
+                                         USERS_PREPROCESS_COLUMNS)
+from Domain.Models.ServerFleet import ServerFleet
+from Services.DataImporterServices.CommentsImporterService import load_comments_data
+from Services.DataImporterServices.PostsImporterService import load_posts_data
+from Services.DataImporterServices.UsersImporterService import load_users_data
+from Services.DataPreprocessServices.CommentsDataPreprocessService import preprocess_comments_data
+from Services.DataPreprocessServices.PostsDataPreprocessService import preprocess_posts_data
+from Services.DataPreprocessServices.UserDataPreprocessService import preprocess_users_data
+from Services.ServerWorkSimulationWithFaultsServices.IdIndexService import IdIndex
+from Services.ServerWorkSimulationWithFaultsServices.ServerWorkSimulationWithFaultsService import FaultSimulator
+from Services.TracingServices.TracingService import span
+
+
+def _max_rss_bytes() -> Optional[int]:
+    if resource is None:
+        return None
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if platform.system() == "Darwin" else max_rss * 1024
+
+
+def _cpu_seconds() -> float:
+    # Own CPU time plus that of finished worker processes
+    times = os.times()
+    return time.process_time() + times.children_user + times.children_system
+
+
+def measure_stage(stages: list, name: str, func: Callable, rows: Optional[int] = None,
+                  trace_memory: bool = True):
+    """
+    Runs one benchmark stage and appends its record to stages.
+
+    The record holds the wall and CPU seconds, the throughput when the stage's row count
+    is known and, with trace_memory, the peak of the memory traced by tracemalloc during
+    the stage, which covers NumPy and pandas buffers but not worker processes. When the
+    run is traced, the stage is also a span and its memory is left to the tracer.
+
+    Returns:
+        Whatever func returns.
+    """
+    gc.collect()
+    trace_memory = trace_memory and not tracemalloc.is_tracing()
+    if trace_memory:
+        tracemalloc.start()
+    cpu_start = _cpu_seconds()
+    wall_start = time.perf_counter()
+    try:
+        with span(f"benchmark.{name}"):
+            result = func()
+    finally:
+        wall_seconds = time.perf_counter() - wall_start
+        cpu_seconds = _cpu_seconds() - cpu_start
+        peak_memory = None
+        if trace_memory:
+            peak_memory = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+    if rows is None and hasattr(result, '__len__'):
+        rows = len(result)
+    record = {
+        'stage': name,
+        'rows': rows,
+        'wall_seconds': wall_seconds,
+        'cpu_seconds': cpu_seconds,
+        'rows_per_second': rows / wall_seconds if rows and wall_seconds > 0 else None,
+        'peak_memory_bytes': peak_memory,
+        'max_rss_bytes': _max_rss_bytes()
+    }
+    stages.append(record)
+
+    summary = f"⏱️ {name}: {wall_seconds:.3f}s wall, {cpu_seconds:.3f}s CPU"
+    if record['rows_per_second'] is not None:
+        summary += f", {record['rows_per_second']:,.0f} rows/s"
+    if peak_memory is not None:
+        summary += f", peak {peak_memory / 2 ** 20:,.1f} MiB"
+    print(summary)
+    return result
+
+
+def run_benchmarks(data_dir: str, output_path: str, fault_batch_sizes: Sequence[int] = (1_000, 100_000),
+                   single_faults: int = 1_000, lookup_rows: int = 1_000, group_rows: Optional[int] = 5_000,
+                   n_servers: int = 10,
+                   trace_memory: bool = True, max_workers: Optional[int] = None, seed: int = 0) -> dict:
+    """
+    Times and memory-profiles every stage of the pipeline on the dump in data_dir and
+    writes the results as JSON, so runs of different versions can be compared.
+
+    Stages: each importer, each preprocess function, group_similar_comments, building
+    the lookup indexes, lookup_rows comment and author lookups by boolean scan and through
+    IdIndex, handle_fault called single_faults times and one handle_faults batch per size
+    in fault_batch_sizes.
+
+    Args:
+        data_dir (str): Directory with Users-N, Posts-N and Comments-N XML shards.
+        output_path (str): JSON file the results are written to.
+        fault_batch_sizes (Sequence[int]): Sizes of the vectorized fault batches.
+        single_faults (int): Number of faults handled one at a time.
+        lookup_rows (int): Number of comment and author lookups timed per lookup method.
+        group_rows (int): Comments the grouping models are trained on; None for all of them.
+        n_servers (int): Size of the simulated fleet.
+        trace_memory (bool): Trace peak memory, at the cost of slower stages.
+        max_workers (int): Processes used by the importers.
+        seed (int): Seed of the fault simulator.
+
+    Returns:
+        dict: The results written to output_path.
+    """
+    stages = []
+    users_path = os.path.join(data_dir, "Users-{}.xml")
+    posts_path = os.path.join(data_dir, "Posts-{}.xml")
+    comments_path = os.path.join(data_dir, "Comments-{}.xml")
+
+    print(f"\n🏋️ Benchmarking the pipeline on {data_dir}...")
+    users_raw = measure_stage(stages, 'import_users', lambda: load_users_data(
+        columns=USERS_PREPROCESS_COLUMNS, xml_path=users_path, discover=True, max_workers=max_workers
+    ), trace_memory=trace_memory)
+    posts_raw = measure_stage(stages, 'import_posts', lambda: load_posts_data(
+        columns=POSTS_PREPROCESS_COLUMNS, xml_path=posts_path, discover=True, max_workers=max_workers
+    ), trace_memory=trace_memory)
+    comments_raw = measure_stage(stages, 'import_comments', lambda: load_comments_data(
+        columns=COMMENTS_PREPROCESS_COLUMNS, xml_path=comments_path, discover=True, max_workers=max_workers
+    ), trace_memory=trace_memory)
+
+    users = measure_stage(stages, 'preprocess_users', lambda: preprocess_users_data(users_raw),
+                          rows=len(users_raw), trace_memory=trace_memory)
+    reputable_user_ids = users['AccountId'].tolist()
+    posts = measure_stage(stages, 'preprocess_posts', lambda: preprocess_posts_data(posts_raw, reputable_user_ids),
+                          rows=len(posts_raw), trace_memory=trace_memory)
+    comments = measure_stage(stages, 'preprocess_comments', lambda: preprocess_comments_data(comments_raw),
+                             rows=len(comments_raw), trace_memory=trace_memory)
+    del users_raw, posts_raw, comments_raw
+
+    simulator = FaultSimulator(seed=seed, verbose=False)
+    training_comments = comments if group_rows is None else comments.iloc[:group_rows]
+    grouped_comments = measure_stage(stages, 'group_similar_comments',
+                                     lambda: simulator.group_similar_comments(training_comments),
+                                     rows=len(training_comments), trace_memory=trace_memory)
+
+    def build_indexes():
+        simulator.build_candidate_index(comments)
+        simulator.build_lookup_indexes(users, comments, posts)
+
+    measure_stage(stages, 'build_indexes', build_indexes, rows=len(comments), trace_memory=trace_memory)
+
+    # The comment and author lookups of handle_fault, by boolean scan as before IdIndex and through IdIndex
+    lookup_ids = comments['Id'].sample(min(lookup_rows, len(comments)), random_state=seed).tolist()
+    comment_index = IdIndex(comments['Id'])
+    user_index = IdIndex(users['AccountId'])
+
+    def scan_lookups():
+        for comment_id in lookup_ids:
+            comment_info = comments[comments['Id'] == comment_id].iloc[0]
+            users[users['AccountId'] == comment_info['UserId']].head(1)
+
+    def indexed_lookups():
+        for comment_id in lookup_ids:
+            comment_info = comments.iloc[comment_index.lookup(comment_id)]
+            user_row = user_index.lookup(comment_info['UserId'])
+            if user_row >= 0:
+                users.iloc[user_row]
+
+    measure_stage(stages, 'id_lookup_scan', scan_lookups, rows=len(lookup_ids), trace_memory=trace_memory)
+    measure_stage(stages, 'id_lookup_indexed', indexed_lookups, rows=len(lookup_ids), trace_memory=trace_memory)
+
+    servers = ServerFleet.generate(n_servers)
+
+    def handle_single_faults():
+        for _ in range(single_faults):
+            simulator.handle_fault(users, comments, posts, servers, grouped_comments)
+
+    measure_stage(stages, 'handle_fault', handle_single_faults, rows=single_faults, trace_memory=trace_memory)
+    for batch_size in fault_batch_sizes:
+        measure_stage(stages, f'handle_faults_batch_{batch_size}',
+                      lambda: simulator.handle_faults(users, comments, posts, servers, n_faults=batch_size),
+                      trace_memory=trace_memory)
+    simulator.cleanup()
+
+    results = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'data_dir': os.path.abspath(data_dir),
+        'rows': {'users': len(users), 'posts': len(posts), 'comments': len(comments)},
+        'parameters': {
+            'fault_batch_sizes': list(fault_batch_sizes),
+            'single_faults': single_faults,
+            'lookup_rows': lookup_rows,
+            'group_rows': group_rows,
+            'n_servers': n_servers,
+            'trace_memory': trace_memory,
+            'max_workers': max_workers,
+            'seed': seed
+        },
+        'stages': stages
+    }
+    with open(output_path, "w", encoding="utf-8") as json_file:
+        json.dump(results, json_file, indent=2)
+    print(f"✅ Benchmark results written to {output_path}")
+    return results
@@ -0,0 +1,160 @@
+import glob
+import hashlib
+import json
+import os
+import pickle
+import struct
+
+from Domain.Constants.CachePaths import DATA_CACHE_DIR
+
+# Bump when the on-disk layout or the preprocessing code changes incompatibly
+CACHE_FORMAT_VERSION = 2
+
+_MAGIC = b"SFDCACHE"
+_HEADER = struct.Struct("<8sIQQ")  # magic, format version, pickle length, buffer count
+_LENGTH = struct.Struct("<Q")
+
+
+def source_fingerprint(source_paths):
+    """
+    Describes the source files by path, size and modification time.
+
+    Args:
+        source_paths (list): Paths of the files the cached data is derived from.
+
+    Returns:
+        list: One [path, size, mtime_ns] entry per source file.
+    """
+    fingerprint = []
+    for path in source_paths:
+        stat = os.stat(path)
+        fingerprint.append([os.path.abspath(path), stat.st_size, stat.st_mtime_ns])
+    return fingerprint
+
+
+def cache_key(source_paths, params=None):
+    """
+    Computes the cache key of a dataset from its source files and preprocessing parameters.
+
+    Args:
+        source_paths (list): Paths of the source files.
+        params (dict, optional): JSON-serializable preprocessing parameters.
+
+    Returns:
+        str: Hex digest that changes whenever a source file or a parameter changes.
+    """
+    payload = json.dumps(
+        {"version": CACHE_FORMAT_VERSION, "sources": source_fingerprint(source_paths), "params": params or {}},
+        sort_keys=True,
+        default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+class DataCache:
+    """
+    On-disk cache of preprocessed DataFrames.
+
+    Frames are written with pickle protocol 5 and their NumPy column buffers are stored
+    out-of-band right after the pickle stream, so loading is a single read of the file
+    with no per-value deserialization of the numeric columns.
+    """
+    def __init__(self, cache_dir: str = DATA_CACHE_DIR):
+        self.cache_dir = cache_dir
+
+    def _entry_path(self, name: str, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{name}-{key}.cache")
+
+    def load(self, name: str, key: str):
+        """
+        Returns the cached object for the name and key, or None when there is no valid entry.
+        """
+        path = self._entry_path(name, key)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, "rb") as cache_file:
+                data = bytearray(os.fstat(cache_file.fileno()).st_size)
+                cache_file.readinto(data)
+
+            magic, version, pickle_length, buffer_count = _HEADER.unpack_from(data, 0)
+            if magic != _MAGIC or version != CACHE_FORMAT_VERSION:
+                return None
+
+            # Slice the pickle stream and the out-of-band buffers without copying them
+            view = memoryview(data)
+            offset = _HEADER.size
+            buffer_lengths = []
+            for _ in range(buffer_count):
+                buffer_lengths.append(_LENGTH.unpack_from(data, offset)[0])
+                offset += _LENGTH.size
+
+            pickle_data = view[offset:offset + pickle_length]
+            offset += pickle_length
+
+            buffers = []
+            for length in buffer_lengths:
+                buffers.append(view[offset:offset + length])
+                offset += length
+
+            return pickle.loads(pickle_data, buffers=buffers)
+        except Exception as e:
+            # Unpickling can fail in many ways, e.g. with AttributeError or ModuleNotFoundError
+            # after a class was renamed, so any failure is a stale entry to rebuild
+            print(f"⚠️ Removing unreadable cache entry {path}: {str(e)}")
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+
+    def store(self, name: str, key: str, value) -> None:
+        """
+        Writes the object under the name and key and removes stale entries of the same name.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        buffers = []
+        pickle_data = pickle.dumps(value, protocol=5, buffer_callback=buffers.append)
+        raw_buffers = [buffer.raw() for buffer in buffers]
+
+        # Write to a temporary file first so an interrupted run never leaves a partial entry
+        path = self._entry_path(name, key)
+        temp_path = path + ".tmp"
+        with open(temp_path, "wb") as cache_file:
+            cache_file.write(_HEADER.pack(_MAGIC, CACHE_FORMAT_VERSION, len(pickle_data), len(raw_buffers)))
+            for raw_buffer in raw_buffers:
+                cache_file.write(_LENGTH.pack(raw_buffer.nbytes))
+            cache_file.write(pickle_data)
+            for raw_buffer in raw_buffers:
+                cache_file.write(raw_buffer)
+        os.replace(temp_path, path)
+
+        for stale_path in glob.glob(os.path.join(glob.escape(self.cache_dir), f"{glob.escape(name)}-*.cache")):
+            if os.path.abspath(stale_path) != os.path.abspath(path):
+                os.remove(stale_path)
+
+    def get_or_build(self, name: str, source_paths, params, builder):
+        """
+        Loads a cached dataset, or builds and caches it when the sources or parameters changed.
+
+        Args:
+            name (str): Dataset name, e.g. "users".
+            source_paths (list): Paths of the files the dataset is derived from.
+            params (dict): Preprocessing parameters that affect the result.
+            builder (callable): Called without arguments to build the dataset on a cache miss.
+
+        Returns:
+            The cached or freshly built dataset.
+        """
+        key = cache_key(source_paths, params)
+
+        value = self.load(name, key)
+        if value is not None:
+            print(f"⚡ Loaded cached {name} data")
+            return value
+
+        value = builder()
+        self.store(name, key, value)
+        return value
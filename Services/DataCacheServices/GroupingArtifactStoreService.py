@@ -0,0 +1,117 @@
+import hashlib
+import json
+import os
+import pickle
+import shutil
+
+import numpy as np
+import pandas as pd
+
+from Domain.Constants.CachePaths import GROUPING_ARTIFACTS_DIR
+
+# Bumped whenever the layout of a stored entry changes, so older entries are never looked up
+ARTIFACT_FORMAT_VERSION = 2
+
+# Columns of the comments frame the grouping models are trained on
+FINGERPRINT_COLUMNS = ['Id', 'PostId', 'Score', 'UserId']
+
+_GROUPS_FILE = "groups.npy"
+_SCORES_FILE = "scores.npy"
+_MODELS_FILE = "models.pkl"
+
+
+class GroupingArtifactStore:
+    """
+    Stores the trained comment-grouping ensemble, its label encoders, the resulting
+    group labels and per-comment ensemble scores, keyed by a fingerprint of the comments data and the hyperparameters.
+
+    Group labels and scores are saved as .npy files and memory-mapped on load, models and encoders
+    are pickled, so a restart can skip retraining entirely.
+    """
+    def __init__(self, store_dir: str = GROUPING_ARTIFACTS_DIR):
+        self.store_dir = store_dir
+
+    @staticmethod
+    def fingerprint(comments: pd.DataFrame, params: dict) -> str:
+        """
+        Computes the artifact key from the comment columns used for training and the hyperparameters.
+        The artifact format and scikit-learn versions are part of the key, since pickled models
+        are not compatible across scikit-learn releases.
+
+        Args:
+            comments (pd.DataFrame): The comments data the models are trained on.
+            params (dict): Training and model hyperparameters.
+
+        Returns:
+            str: Hex digest identifying the artifacts.
+        """
+        digest = hashlib.sha256()
+        columns = [column for column in FINGERPRINT_COLUMNS if column in comments.columns]
+        row_hashes = pd.util.hash_pandas_object(comments[columns], index=False).to_numpy()
+        digest.update(np.ascontiguousarray(row_hashes).tobytes())
+        # Imported here so the store stays cheap to import when no models are trained
+        import sklearn
+
+        versions = {'format': ARTIFACT_FORMAT_VERSION, 'sklearn': sklearn.__version__}
+        digest.update(json.dumps({'versions': versions, 'params': params}, sort_keys=True,
+                                 default=str).encode("utf-8"))
+        return digest.hexdigest()[:32]
+
+    def _entry_dir(self, key: str) -> str:
+        return os.path.join(self.store_dir, key)
+
+    def load(self, key: str):
+        """
+        Loads the artifacts stored under the key.
+
+        Returns:
+            dict or None: 'groups' and 'scores' (memory-mapped arrays), 'models' and 'label_encoders',
+                          or None when no complete entry exists.
+        """
+        entry_dir = self._entry_dir(key)
+        groups_path = os.path.join(entry_dir, _GROUPS_FILE)
+        scores_path = os.path.join(entry_dir, _SCORES_FILE)
+        models_path = os.path.join(entry_dir, _MODELS_FILE)
+        if not all(os.path.exists(path) for path in (groups_path, scores_path, models_path)):
+            return None
+
+        try:
+            with open(models_path, "rb") as models_file:
+                stored = pickle.load(models_file)
+            return {
+                'groups': np.load(groups_path, mmap_mode='r'),
+                'scores': np.load(scores_path, mmap_mode='r'),
+                'models': stored['models'],
+                'label_encoders': stored['label_encoders']
+            }
+        except Exception as e:
+            # Unpickling can fail in many ways, e.g. with AttributeError or ModuleNotFoundError
+            # after a class was renamed, so any failure is a stale entry to retrain
+            print(f"⚠️ Removing unreadable grouping artifacts {entry_dir}: {str(e)}")
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            return None
+
+    def save(self, key: str, groups: np.ndarray, models: dict, label_encoders: dict,
+             scores: np.ndarray) -> None:
+        """
+        Saves the artifacts under the key and removes entries stored under other keys.
+        """
+        os.makedirs(self.store_dir, exist_ok=True)
+
+        # Write into a temporary directory first so a crash never leaves a partial entry
+        entry_dir = self._entry_dir(key)
+        temp_dir = entry_dir + ".tmp"
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        os.makedirs(temp_dir)
+
+        np.save(os.path.join(temp_dir, _GROUPS_FILE), np.asarray(groups))
+        np.save(os.path.join(temp_dir, _SCORES_FILE), np.asarray(scores))
+        with open(os.path.join(temp_dir, _MODELS_FILE), "wb") as models_file:
+            pickle.dump({'models': models, 'label_encoders': label_encoders}, models_file, protocol=5)
+
+        shutil.rmtree(entry_dir, ignore_errors=True)
+        os.replace(temp_dir, entry_dir)
+
+        for name in os.listdir(self.store_dir):
+            if name != key:
+                shutil.rmtree(os.path.join(self.store_dir, name), ignore_errors=True)
@@ -1,7 +1,18 @@
-from sklearn.decomposition import PCA
+from sklearn.decomposition import PCA, IncrementalPCA
 import numpy as np
 import pandas as pd
+from Services.TracingServices.TracingService import traced
 
+
+def pca_column_names(n_components):
+    """
+    Names of the principal component columns. The first component keeps the name 'Reputation',
+    which the rest of the pipeline reads, and the following ones are 'PC2', 'PC3', ...
+    """
+    return ['Reputation'] + [f'PC{component}' for component in range(2, n_components + 1)]
+
+
+@traced(rows=len)
 def apply_pca_on_user_df(scaled_data, account_ids, n_components=2):
     """
     Applies PCA on the preprocessed data and reduces its dimensions to n_components, while retaining AccountId.
@@ -31,7 +42,56 @@ def apply_pca_on_user_df(scaled_data, account_ids, n_components=2):
     users_reduced = pca.fit_transform(scaled_data)
 
     # Create a DataFrame from the PCA result, with 'AccountId' retained
-    users_reduced_df = pd.DataFrame(users_reduced, columns=['Reputation'])
+    users_reduced_df = pd.DataFrame(users_reduced, columns=pca_column_names(n_components))
     users_reduced_df['AccountId'] = account_ids.values
 
     return users_reduced_df
+
+
+def _batch_bounds(n_rows, batch_size, min_rows):
+    # Batch boundaries, with a short last batch merged into the previous one
+    # since IncrementalPCA needs at least as many rows per batch as it has components
+    starts = list(range(0, n_rows, batch_size))
+    if len(starts) > 1 and n_rows - starts[-1] < min_rows:
+        starts.pop()
+    return list(zip(starts, starts[1:] + [n_rows]))
+
+
+@traced(rows=len)
+def apply_incremental_pca_on_user_features(features, account_ids, moments, n_components=1, batch_size=100_000):
+    """
+    Fits IncrementalPCA batch by batch on standardized user features, then transforms them
+    in a second pass, so only one batch is ever imputed and scaled at a time.
+
+    Args:
+        features (np.ndarray or np.memmap): Raw features (without 'AccountId'), NaN for missing values.
+        account_ids (np.ndarray): The AccountId of each row.
+        moments (RunningMoments): Imputation and scaling statistics of the features.
+        n_components (int): The number of principal components to keep.
+        batch_size (int): Rows per IncrementalPCA batch.
+
+    Returns:
+        pd.DataFrame: The data transformed to the new PCA space with reduced dimensions, and includes 'AccountId'.
+    """
+    n_rows, n_features = features.shape
+    if n_components > n_features:
+        raise ValueError(f"n_components cannot be greater than the number of features ({n_features}) in the data.")
+    if n_rows < n_features:
+        raise ValueError(f"At least {n_features} users are needed to fit the principal components.")
+
+    # Truncating the components between batches loses the variance of the dropped ones, so every
+    # component of the few user features is tracked while fitting and only n_components are kept
+    bounds = _batch_bounds(n_rows, max(batch_size, n_features), n_features)
+    pca = IncrementalPCA(n_components=n_features)
+    for start, end in bounds:
+        pca.partial_fit(moments.standardize(features[start:end]))
+
+    # Write the kept components of every batch straight into the result
+    users_reduced = np.empty((n_rows, n_components), dtype=np.float64)
+    for start, end in bounds:
+        users_reduced[start:end] = pca.transform(moments.standardize(features[start:end]))[:, :n_components]
+
+    users_reduced_df = pd.DataFrame(users_reduced, columns=pca_column_names(n_components), copy=False)
+    users_reduced_df['AccountId'] = pd.array(account_ids, dtype="Int64")
+
+    return users_reduced_df
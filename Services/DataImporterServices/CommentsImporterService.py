@@ -1,26 +1,43 @@
 import pandas as pd
+from Domain.Constants.DataSchemas import COMMENTS_SCHEMA
+from Domain.Constants.XmlColumns import COMMENTS_COLUMNS
 from Domain.Constants.XmlPaths import COMMENTS_XML_PATH
+from Services.DataImporterServices.ShardLoaderService import discover_shards, load_shards, shard_paths_in_range
+from Services.DataImporterServices.XmlColumnReaderService import read_xml_columns, select_column_kinds
+from Services.TracingServices.TracingService import traced
 
-def load_comments_data():
+@traced(rows=len)
+def load_comments_data(columns=None, predicate=None, xml_path=COMMENTS_XML_PATH, discover=False, max_workers=None):
     """
     Loads the data from multiple Comments XML files and returns them as a single pandas DataFrame.
 
     This method reads multiple Comments XML files (e.g., Comments-1.xml, Comments-2.xml, ...)
     and concatenates them into one DataFrame.
 
+    Args:
+        columns (list, optional): Attributes to keep. When given, only these attributes are parsed.
+        predicate (callable, optional): Row filter applied to the raw attributes before a row is
+                                        materialized (e.g. a RowFilter).
+        xml_path (str): Shard path template with a '{}' placeholder for the shard number.
+        discover (bool): When True, every shard matching xml_path is found on disk and the shards
+                         are parsed in parallel worker processes instead of the fixed shard range.
+        max_workers (int, optional): Worker processes used in discovery mode, None for one per CPU core.
+
     Returns:
-        pd.DataFrame: A DataFrame containing all the comments data combined.
+        pd.DataFrame: A DataFrame containing all the comments data combined, typed with COMMENTS_SCHEMA.
     """
-    # Initialize an empty list to store DataFrames
-    all_comments_data = []
-
-    # Read multiple Comments XML files
-    for i in range(1, 2):
-        comments_df = pd.read_xml(COMMENTS_XML_PATH.format(i))
-        all_comments_data.append(comments_df)
+    # Collect the Comments XML files to read
+    if discover:
+        shard_paths = discover_shards(xml_path)
+    else:
+        shard_paths = shard_paths_in_range(xml_path, range(1, 2))
+        max_workers = 1
 
-    # Concatenate all the data into a single DataFrame
-    combined_comments_df = pd.concat(all_comments_data, ignore_index=True)
+    # Push the projection and the row filter down into the XML parsing when requested
+    if columns is not None or predicate is not None:
+        column_kinds = select_column_kinds(COMMENTS_COLUMNS, columns)
+        return load_shards(shard_paths, read_xml_columns, column_kinds, predicate,
+                           max_workers=max_workers, schema=COMMENTS_SCHEMA)
 
-    # Return the combined DataFrame
-    return combined_comments_df
+    # Read all Comments XML files and concatenate them into a single DataFrame
+    return load_shards(shard_paths, pd.read_xml, max_workers=max_workers, schema=COMMENTS_SCHEMA)
@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+
+
+def _convert_column(column: pd.Series, dtype) -> pd.Series:
+    if isinstance(dtype, pd.CategoricalDtype):
+        # Codes outside the categories become missing
+        return pd.to_numeric(column, errors='coerce').astype(dtype)
+    if str(dtype).startswith("datetime64"):
+        return pd.to_datetime(column, format="ISO8601", errors='coerce').astype(dtype)
+    return pd.to_numeric(column, errors='coerce').astype(dtype)
+
+
+def apply_schema(frame: pd.DataFrame, schema: dict) -> pd.DataFrame:
+    """
+    Casts the columns of a frame to the dtypes of a schema from Domain/Constants/DataSchemas.
+
+    Text columns parsed from the dump (e.g. by iterparse or pd.read_xml) are converted to
+    nullable integers, categories and dates; unparsable values become missing. Columns the
+    schema does not list, and columns that already have their dtype, are left untouched,
+    so applying a schema twice costs nothing.
+
+    Args:
+        frame (pd.DataFrame): The imported data.
+        schema (dict): Mapping of column name to pandas dtype.
+
+    Returns:
+        pd.DataFrame: The frame with typed columns.
+    """
+    converted = {
+        name: _convert_column(frame[name], dtype)
+        for name, dtype in schema.items()
+        if name in frame.columns and frame[name].dtype != dtype
+    }
+    if not converted:
+        return frame
+    return frame.assign(**converted)
+
+
+def id_array(ids) -> np.ndarray:
+    """
+    Converts a collection of ids (a list, array or Series of ints, floats or strings) to a
+    sorted array of distinct int64 ids, dropping missing and unparsable values, for fast
+    membership filters with isin.
+    """
+    ids = pd.to_numeric(pd.Series(ids).reset_index(drop=True), errors='coerce')
+    return np.unique(ids.dropna().to_numpy(dtype=np.int64))
@@ -1,36 +1,73 @@
 import pandas as pd
 from xml.etree.ElementTree import iterparse
+from Domain.Constants.DataSchemas import POSTS_SCHEMA
+from Domain.Constants.XmlColumns import POSTS_COLUMNS, POSTS_PREPROCESS_COLUMNS
 from Domain.Constants.XmlPaths import POSTS_XML_PATH
+from Services.DataImporterServices.ShardLoaderService import discover_shards, load_shards, shard_paths_in_range
+from Services.DataImporterServices.XmlColumnReaderService import read_xml_columns, select_column_kinds
+from Services.TracingServices.TracingService import traced
 
-def load_posts_data():
+@traced(rows=len)
+def load_posts_data(columnar=False, columns=None, predicate=None, xml_path=POSTS_XML_PATH,
+                    discover=False, max_workers=None):
     """
     Loads and processes large Posts XML files using iterative parsing.
 
     This method reads Posts XML files iteratively to handle large datasets efficiently
     and returns the combined DataFrame.
 
+    Args:
+        columnar (bool): When True, only the requested attributes are parsed straight into
+                         typed column buffers instead of collecting every row's attribute
+                         dictionary, keeping peak memory proportional to the retained columns.
+        columns (list, optional): Attributes to keep; defaults to POSTS_PREPROCESS_COLUMNS
+                                  in columnar mode. Implies columnar mode.
+        predicate (callable, optional): Row filter applied to the raw attributes (e.g. a RowFilter
+                                        on PostTypeId and OwnerUserId). Implies columnar mode.
+        xml_path (str): Shard path template with a '{}' placeholder for the shard number.
+        discover (bool): When True, every shard matching xml_path is found on disk and the shards
+                         are parsed in parallel worker processes instead of the fixed shard range.
+        max_workers (int, optional): Worker processes used in discovery mode, None for one per CPU core.
+
     Returns:
-        pd.DataFrame: DataFrame containing the combined posts data.
+        pd.DataFrame: DataFrame containing the combined posts data, typed with POSTS_SCHEMA.
+    """
+    # Collect the Posts XML files to read
+    if discover:
+        shard_paths = discover_shards(xml_path)
+    else:
+        shard_paths = shard_paths_in_range(xml_path, range(0, 1))
+        max_workers = 1
+
+    if columnar or columns is not None or predicate is not None:
+        column_kinds = select_column_kinds(POSTS_COLUMNS, columns or POSTS_PREPROCESS_COLUMNS)
+
+        # Read every XML file into typed columns and concatenate them once
+        return load_shards(shard_paths, read_xml_columns, column_kinds, predicate,
+                           max_workers=max_workers, schema=POSTS_SCHEMA)
+
+    return load_shards(shard_paths, _read_posts_rows, max_workers=max_workers, schema=POSTS_SCHEMA)
+
+
+def _read_posts_rows(xml_file_path):
+    """
+    Parses a single Posts XML file into a DataFrame holding every row attribute.
     """
     # Initialize an empty list to store parsed records
     all_posts_data = []
 
-    # Iterate through multiple XML files
-    for i in range(0, 1):
-        xml_file_path = POSTS_XML_PATH.format(i)
-
-        # Parse XML iteratively
-        for event, element in iterparse(xml_file_path, events=("end",)):
-            # Process only 'row' elements
-            if element.tag == "row":
-                # Extract attributes as a dictionary
-                row_data = element.attrib
+    # Parse XML iteratively
+    for event, element in iterparse(xml_file_path, events=("end",)):
+        # Process only 'row' elements
+        if element.tag == "row":
+            # Extract attributes as a dictionary
+            row_data = element.attrib
 
-                # Append the dictionary to the list
-                all_posts_data.append(row_data)
+            # Append the dictionary to the list
+            all_posts_data.append(row_data)
 
-                # Clear the element to free memory
-                element.clear()
+            # Clear the element to free memory
+            element.clear()
 
     # Convert the list of dictionaries into a DataFrame
     posts_df = pd.DataFrame(all_posts_data)
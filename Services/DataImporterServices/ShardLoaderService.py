@@ -0,0 +1,112 @@
+import glob
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import pandas as pd
+
+from Services.DataImporterServices.DataSchemaService import apply_schema
+from Services.DataImporterServices.XmlColumnReaderService import iter_xml_column_chunks
+
+
+def shard_paths_in_range(path_template, shard_numbers):
+    """
+    Formats the shard path template for a fixed range of shard numbers.
+
+    Args:
+        path_template (str): Path with a '{}' placeholder for the shard number (e.g. XmlPaths constants).
+        shard_numbers (iterable): Shard numbers to include.
+
+    Returns:
+        list: Paths of the requested shards.
+    """
+    return [path_template.format(i) for i in shard_numbers]
+
+
+def discover_shards(path_template):
+    """
+    Finds every shard on disk matching a path template such as "C:/Data/Posts-{}.xml".
+
+    Args:
+        path_template (str): Path with a '{}' placeholder for the shard number.
+
+    Returns:
+        list: Paths of the matching shards, ordered by their numeric shard number.
+
+    Raises:
+        FileNotFoundError: If no shard matches the template.
+    """
+    prefix, suffix = path_template.split("{}", 1)
+    shard_number_pattern = re.compile(re.escape(os.path.normpath(prefix)) + r"(\d+)" + re.escape(suffix) + "$")
+
+    numbered_paths = []
+    for path in glob.glob(glob.escape(prefix) + "*" + glob.escape(suffix)):
+        match = shard_number_pattern.match(os.path.normpath(path))
+        if match:
+            numbered_paths.append((int(match.group(1)), path))
+
+    if not numbered_paths:
+        raise FileNotFoundError(f"No shards found matching {path_template}")
+
+    return [path for _, path in sorted(numbered_paths)]
+
+
+def _read_shard(path, reader, schema, reader_args):
+    frame = reader(path, *reader_args)
+    return frame if schema is None else apply_schema(frame, schema)
+
+
+def load_shards(shard_paths, reader, *reader_args, max_workers=1, schema=None):
+    """
+    Parses every shard with the given reader and merges the results with a single concat.
+
+    With a schema, every shard is typed as soon as it is parsed, inside its worker, so
+    only the compact typed columns are sent back and concatenated.
+
+    With more than one worker the shards are parsed in separate processes. Results are
+    collected in shard order, so the output does not depend on which worker finishes first.
+
+    Args:
+        shard_paths (list): Paths of the shards to parse.
+        reader (callable): Module-level function called as reader(path, *reader_args), returning a DataFrame.
+        *reader_args: Extra arguments passed to the reader; they must be picklable for parallel loading.
+        max_workers (int, optional): Number of worker processes, None for one per CPU core.
+        schema (dict, optional): Column dtypes from Domain/Constants/DataSchemas applied to every shard.
+
+    Returns:
+        pd.DataFrame: The combined data of all shards.
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(shard_paths))
+
+    if max_workers <= 1:
+        frames = [_read_shard(path, reader, schema, reader_args) for path in shard_paths]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            frames = list(executor.map(_read_shard, shard_paths, repeat(reader), repeat(schema), repeat(reader_args)))
+
+    return pd.concat(frames, ignore_index=True)
+
+
+def iter_shard_chunks(shard_paths, column_kinds, predicate=None, chunk_size=100_000, schema=None):
+    """
+    Streams the shards one after another as DataFrames of at most chunk_size rows.
+
+    Unlike load_shards the data is never combined, so memory stays bounded by one chunk
+    and dumps larger than RAM can be processed in a single pass.
+
+    Args:
+        shard_paths (list): Paths of the shards to parse.
+        column_kinds (dict): Mapping of attribute name to buffer kind ("int" or "str").
+        predicate (callable, optional): Row filter applied to the raw attributes.
+        chunk_size (int): Maximum number of rows per chunk.
+        schema (dict, optional): Column dtypes from Domain/Constants/DataSchemas applied to every chunk.
+
+    Yields:
+        pd.DataFrame: The chunks, in shard order.
+    """
+    for path in shard_paths:
+        for chunk in iter_xml_column_chunks(path, column_kinds, predicate, chunk_size):
+            yield chunk if schema is None else apply_schema(chunk, schema)
@@ -1,26 +1,66 @@
 import pandas as pd
+from Domain.Constants.DataSchemas import USERS_SCHEMA
+from Domain.Constants.XmlColumns import USERS_COLUMNS
 from Domain.Constants.XmlPaths import USERS_XML_PATH
+from Services.DataImporterServices.ShardLoaderService import (discover_shards, iter_shard_chunks, load_shards,
+                                                              shard_paths_in_range)
+from Services.DataImporterServices.XmlColumnReaderService import read_xml_columns, select_column_kinds
+from Services.TracingServices.TracingService import traced
 
-def load_users_data():
+@traced(rows=len)
+def load_users_data(columns=None, predicate=None, xml_path=USERS_XML_PATH, discover=False, max_workers=None):
     """
     Loads the data from multiple Users XML files and returns them as a single pandas DataFrame.
 
     This method reads multiple Users XML files (e.g., Users-1.xml, Users-2.xml, ...)
     and concatenates them into one DataFrame.
 
+    Args:
+        columns (list, optional): Attributes to keep. When given, only these attributes are parsed.
+        predicate (callable, optional): Row filter applied to the raw attributes before a row is
+                                        materialized (e.g. a RowFilter).
+        xml_path (str): Shard path template with a '{}' placeholder for the shard number.
+        discover (bool): When True, every shard matching xml_path is found on disk and the shards
+                         are parsed in parallel worker processes instead of the fixed shard range.
+        max_workers (int, optional): Worker processes used in discovery mode, None for one per CPU core.
+
     Returns:
-        pd.DataFrame: A DataFrame containing all the users data combined.
+        pd.DataFrame: A DataFrame containing all the users data combined, typed with USERS_SCHEMA.
     """
-    # Initialize an empty list to store DataFrames
-    all_users_data = []
+    # Collect the Users XML files to read
+    if discover:
+        shard_paths = discover_shards(xml_path)
+    else:
+        shard_paths = shard_paths_in_range(xml_path, range(1, 2))
+        max_workers = 1
+
+    # Push the projection and the row filter down into the XML parsing when requested
+    if columns is not None or predicate is not None:
+        column_kinds = select_column_kinds(USERS_COLUMNS, columns)
+        return load_shards(shard_paths, read_xml_columns, column_kinds, predicate,
+                           max_workers=max_workers, schema=USERS_SCHEMA)
+
+    # Read all Users XML files and concatenate them into a single DataFrame
+    return load_shards(shard_paths, pd.read_xml, max_workers=max_workers, schema=USERS_SCHEMA)
 
-    # Read multiple Users XML files
-    for i in range(1, 2):
-        users_df = pd.read_xml(USERS_XML_PATH.format(i))
-        all_users_data.append(users_df)
 
-    # Concatenate all the data into a single DataFrame
-    combined_users_df = pd.concat(all_users_data, ignore_index=True)
+def iter_users_data(columns=None, predicate=None, xml_path=USERS_XML_PATH, discover=False, chunk_size=100_000):
+    """
+    Streams the Users XML files as DataFrames of at most chunk_size rows, shard after shard,
+    so users dumps larger than RAM can be preprocessed with bounded memory.
+
+    Args:
+        columns (list, optional): Attributes to keep. All attributes when None.
+        predicate (callable, optional): Row filter applied to the raw attributes before a row is
+                                        materialized (e.g. a RowFilter).
+        xml_path (str): Shard path template with a '{}' placeholder for the shard number.
+        discover (bool): When True, every shard matching xml_path is found on disk instead of
+                         the fixed shard range.
+        chunk_size (int): Maximum number of rows per chunk.
 
-    # Return the combined DataFrame
-    return combined_users_df
\ No newline at end of file
+    Yields:
+        pd.DataFrame: Chunks of the users data, typed with USERS_SCHEMA.
+    """
+    shard_paths = discover_shards(xml_path) if discover else shard_paths_in_range(xml_path, range(1, 2))
+    column_kinds = select_column_kinds(USERS_COLUMNS, columns)
+    yield from iter_shard_chunks(shard_paths, column_kinds, predicate, chunk_size, schema=USERS_SCHEMA)
@@ -0,0 +1,190 @@
+import numpy as np
+import pandas as pd
+from lxml import etree
+
+
+class ColumnBuffer:
+    """
+    Growable typed buffer collecting the values of a single XML attribute.
+
+    Integer columns are stored in an int64 array with a separate missing-value mask,
+    text columns in an object array, so no per-row dictionaries are ever kept.
+    """
+    def __init__(self, kind: str, initial_capacity: int = 4096):
+        if kind not in ("int", "str"):
+            raise ValueError(f"Unsupported column kind: {kind}")
+
+        self.kind = kind
+        self._size = 0
+        self._values = np.empty(initial_capacity, dtype=np.int64 if kind == "int" else object)
+        self._missing = np.zeros(initial_capacity, dtype=bool) if kind == "int" else None
+
+    def __len__(self):
+        return self._size
+
+    def _grow(self):
+        capacity = max(1, len(self._values) * 2)
+        self._values = np.resize(self._values, capacity)
+        if self._missing is not None:
+            self._missing = np.resize(self._missing, capacity)
+
+    def append(self, raw_value):
+        if self._size == len(self._values):
+            self._grow()
+
+        if self.kind == "int":
+            if raw_value is None or raw_value == "":
+                self._values[self._size] = 0
+                self._missing[self._size] = True
+            else:
+                self._values[self._size] = int(raw_value)
+                self._missing[self._size] = False
+        else:
+            self._values[self._size] = raw_value
+
+        self._size += 1
+
+    def to_array(self):
+        """
+        Returns the collected values trimmed to their length, as a nullable Int64 array
+        for integer columns and an object array for text columns.
+        """
+        values = self._values[:self._size].copy()
+        if self.kind == "int":
+            return pd.arrays.IntegerArray(values, self._missing[:self._size].copy())
+        return values
+
+
+class RowFilter:
+    """
+    Row predicate evaluated on the raw XML attributes before anything is materialized.
+
+    A row is kept only when every configured attribute is present and its value is one of
+    the allowed values. Allowed values are compared as the text stored in the dump, so
+    integer ids (including float-typed ids such as 42.0) match their XML representation.
+    Being a plain class, it can be pickled and shipped to worker processes.
+    """
+    def __init__(self, allowed_values: dict):
+        self.allowed_values = {
+            name: frozenset(_attribute_text(value) for value in values)
+            for name, values in allowed_values.items()
+        }
+
+    def __call__(self, attributes) -> bool:
+        for name, allowed in self.allowed_values.items():
+            if attributes.get(name) not in allowed:
+                return False
+        return True
+
+
+def _attribute_text(value) -> str:
+    # Normalize integral numbers so 42, np.int64(42) and 42.0 all become "42"
+    if isinstance(value, (int, np.integer)):
+        return str(int(value))
+    if isinstance(value, (float, np.floating)) and float(value).is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def select_column_kinds(schema, columns=None):
+    """
+    Builds the attribute-to-kind mapping for the requested columns.
+
+    Args:
+        schema (dict): Mapping of every known attribute to its buffer kind.
+        columns (list, optional): Attributes to keep. All schema attributes when None.
+
+    Returns:
+        dict: Mapping of the requested attributes to their buffer kind, unknown ones as text.
+    """
+    if columns is None:
+        return dict(schema)
+    return {name: schema.get(name, "str") for name in columns}
+
+
+def _iter_row_attributes(xml_file_path, predicate=None):
+    """
+    Yields the raw attribute mapping of every <row> element accepted by the predicate.
+
+    The mapping is only valid until the next row is requested: every parsed element is
+    cleared and its already processed siblings are detached from the tree, so memory
+    stays constant instead of growing with the document size.
+    """
+    for event, element in etree.iterparse(xml_file_path, events=("end",), tag="row"):
+        attributes = element.attrib
+        if predicate is None or predicate(attributes):
+            yield attributes
+
+        # Clear the element and drop the preceding siblings to free memory
+        element.clear(keep_tail=True)
+        while element.getprevious() is not None:
+            del element.getparent()[0]
+
+
+def _buffers_to_frame(buffers):
+    # Build the DataFrame from the buffers, releasing each buffer once it has been converted
+    columns = {}
+    for name in list(buffers):
+        columns[name] = buffers.pop(name).to_array()
+
+    return pd.DataFrame(columns)
+
+
+def read_xml_columns(xml_file_path, column_kinds, predicate=None):
+    """
+    Streams the <row> elements of a Stack Exchange XML dump straight into typed column buffers.
+
+    Only the requested attributes of the rows accepted by the predicate are read. Every
+    parsed element is cleared and its already processed siblings are detached from the
+    tree, so memory stays proportional to the retained columns instead of the document size.
+
+    Args:
+        xml_file_path (str): Path to the XML file.
+        column_kinds (dict): Mapping of attribute name to buffer kind ("int" or "str").
+        predicate (callable, optional): Called with the raw attribute mapping of each row;
+                                        rows for which it returns False are skipped.
+
+    Returns:
+        pd.DataFrame: DataFrame with one column per requested attribute.
+    """
+    buffers = {name: ColumnBuffer(kind) for name, kind in column_kinds.items()}
+
+    for attributes in _iter_row_attributes(xml_file_path, predicate):
+        for name, buffer in buffers.items():
+            buffer.append(attributes.get(name))
+
+    return _buffers_to_frame(buffers)
+
+
+def iter_xml_column_chunks(xml_file_path, column_kinds, predicate=None, chunk_size=100_000):
+    """
+    Streams the <row> elements of a Stack Exchange XML dump as DataFrames of at most chunk_size rows,
+    so memory stays proportional to one chunk of the retained columns.
+
+    Args:
+        xml_file_path (str): Path to the XML file.
+        column_kinds (dict): Mapping of attribute name to buffer kind ("int" or "str").
+        predicate (callable, optional): Called with the raw attribute mapping of each row;
+                                        rows for which it returns False are skipped.
+        chunk_size (int): Maximum number of rows per chunk.
+
+    Yields:
+        pd.DataFrame: DataFrames with one column per requested attribute.
+    """
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be at least 1")
+
+    buffers = {name: ColumnBuffer(kind, min(chunk_size, 4096)) for name, kind in column_kinds.items()}
+    rows = 0
+    for attributes in _iter_row_attributes(xml_file_path, predicate):
+        for name, buffer in buffers.items():
+            buffer.append(attributes.get(name))
+        rows += 1
+
+        if rows == chunk_size:
+            yield _buffers_to_frame(buffers)
+            buffers = {name: ColumnBuffer(kind, min(chunk_size, 4096)) for name, kind in column_kinds.items()}
+            rows = 0
+
+    if rows:
+        yield _buffers_to_frame(buffers)
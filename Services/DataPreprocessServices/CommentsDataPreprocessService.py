@@ -1,6 +1,10 @@
 import pandas as pd
-from Services.TextCleanUpServices.TextCleanService import clean_text
+from Domain.Constants.DataSchemas import COMMENTS_SCHEMA
+from Services.DataImporterServices.DataSchemaService import apply_schema
+from Services.TextCleanUpServices.TextCleanService import clean_texts
+from Services.TracingServices.TracingService import traced
 
+@traced(rows=len)
 def preprocess_comments_data(comments_df):
     """
     Preprocesses the comments data by keeping only relevant columns, cleaning the 'Text' column,
@@ -13,13 +17,13 @@ def preprocess_comments_data(comments_df):
         pd.DataFrame: The preprocessed DataFrame with selected columns and cleaned 'Text' column,
                       and only comments from reputable users.
     """
-    # Select only the relevant columns
-    comments_df = comments_df[['Id', 'PostId', 'Score', 'Text', 'UserId']]
+    # Select only the relevant columns, typed when the comments were not imported through the schema
+    comments_df = apply_schema(comments_df[['Id', 'PostId', 'Score', 'Text', 'UserId']], COMMENTS_SCHEMA)
 
     # Drop rows where 'UserId' is missing (optional)
     comments_df = comments_df.dropna(subset=['UserId'])
 
     # Clean the 'Text' column to remove HTML tags and unwanted whitespace characters
-    comments_df['Text'] = comments_df['Text'].apply(clean_text)
+    comments_df['Text'] = clean_texts(comments_df['Text'])
 
     return comments_df
@@ -1,8 +1,12 @@
 import pandas as pd
 
-from Services.TextCleanUpServices.TextCleanService import clean_text
+from Domain.Constants.DataSchemas import POSTS_SCHEMA
+from Services.DataImporterServices.DataSchemaService import apply_schema, id_array
+from Services.TextCleanUpServices.TextCleanService import clean_texts
+from Services.TracingServices.TracingService import traced
 
 
+@traced(rows=len)
 def preprocess_posts_data(posts_df, reputable_user_ids):
     """
     Preprocesses the posts data to filter relevant columns, keep posts
@@ -10,25 +14,26 @@ def preprocess_posts_data(posts_df, reputable_user_ids):
 
     Args:
         posts_df (pd.DataFrame): The DataFrame containing posts data.
-        reputable_user_ids (list): A list of AccountIds representing reputable users.
+        reputable_user_ids (list or np.ndarray): The AccountIds of reputable users.
 
     Returns:
         pd.DataFrame: The preprocessed DataFrame containing only relevant columns
                       and posts created by reputable users with PostTypeId 1 or 2.
     """
-    # Filter the DataFrame to include only reputable users and PostTypeId 1 or 2
-    posts_df['OwnerUserId'] = posts_df['OwnerUserId'].astype(str)
-    reputable_user_ids = [str(user_id) for user_id in reputable_user_ids]
+    # Type the columns when the posts were not imported through the schema
+    posts_df = apply_schema(posts_df, POSTS_SCHEMA)
 
+    # Filter the DataFrame to include only reputable users and PostTypeId 1 or 2
+    # Both filters compare integers, missing owners and post types never match
     posts_df = posts_df[
-        (posts_df['OwnerUserId'].isin(reputable_user_ids)) &
-        (posts_df['PostTypeId'].isin(["1", "2"]))
+        (posts_df['OwnerUserId'].isin(id_array(reputable_user_ids))) &
+        (posts_df['PostTypeId'].isin([1, 2]))
     ]
 
     # Retain only the specified columns
     posts_df = posts_df[['Id', 'PostTypeId', 'Score', 'Title', 'OwnerUserId', 'AnswerCount', 'Body']]
 
     # Remove html content - not relevant
-    posts_df['Body'] = posts_df['Body'].apply(clean_text)
+    posts_df['Body'] = clean_texts(posts_df['Body'])
 
     return posts_df
\ No newline at end of file
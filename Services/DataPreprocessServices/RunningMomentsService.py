@@ -0,0 +1,79 @@
+import numpy as np
+
+
+class RunningMoments:
+    """
+    Per-feature mean and variance of a stream of batches, merged batch by batch with
+    Chan's parallel algorithm, so one pass over data of any size yields the statistics of
+    SimpleImputer(strategy='mean') followed by StandardScaler.
+
+    Missing values (NaN) are left out of the means, like SimpleImputer. After mean
+    imputation they sit exactly at the mean, so they add nothing to the squared deviations
+    but still count towards the population variance StandardScaler divides by.
+    """
+    def __init__(self, n_features: int):
+        self.n_features = n_features
+        self.n_rows = 0
+        self._counts = np.zeros(n_features, dtype=np.int64)
+        self._means = np.zeros(n_features, dtype=np.float64)
+        self._m2 = np.zeros(n_features, dtype=np.float64)
+
+    def update(self, batch) -> None:
+        batch = np.asarray(batch, dtype=np.float64)
+        if batch.ndim != 2 or batch.shape[1] != self.n_features:
+            raise ValueError(f"Expected batches with {self.n_features} features, got shape {batch.shape}")
+        self.n_rows += batch.shape[0]
+
+        present = ~np.isnan(batch)
+        batch_counts = present.sum(axis=0)
+        observed = batch_counts > 0
+        if not observed.any():
+            return
+
+        # Mean and squared deviations of the batch, ignoring its missing values
+        batch_means = np.zeros(self.n_features)
+        batch_means[observed] = np.where(present, batch, 0.0).sum(axis=0)[observed] / batch_counts[observed]
+        deviations = np.where(present, batch - batch_means, 0.0)
+        batch_m2 = (deviations ** 2).sum(axis=0)
+
+        # Merge the batch into the running moments
+        counts = self._counts + batch_counts
+        delta = batch_means - self._means
+        weight = np.divide(batch_counts, counts, out=np.zeros(self.n_features), where=counts > 0)
+        self._means = self._means + delta * weight
+        self._m2 = self._m2 + batch_m2 + delta ** 2 * self._counts * weight
+        self._counts = counts
+
+    @property
+    def means(self) -> np.ndarray:
+        """
+        Imputation means; features that were never observed impute to 0.
+        """
+        return self._means.copy()
+
+    @property
+    def variances(self) -> np.ndarray:
+        """
+        Population variances of the features after mean imputation.
+        """
+        if self.n_rows == 0:
+            return np.zeros(self.n_features)
+        return self._m2 / self.n_rows
+
+    @property
+    def scales(self) -> np.ndarray:
+        """
+        Standard deviations used for scaling, 1 for constant features like StandardScaler.
+        """
+        scales = np.sqrt(self.variances)
+        scales[scales < 10 * np.finfo(np.float64).eps] = 1.0
+        return scales
+
+    def standardize(self, batch) -> np.ndarray:
+        """
+        Imputes the missing values of a batch with the means and standardizes it.
+        """
+        batch = (np.asarray(batch, dtype=np.float64) - self._means) / self.scales
+        # An imputed value is the mean, which standardizes to 0
+        batch[np.isnan(batch)] = 0.0
+        return batch
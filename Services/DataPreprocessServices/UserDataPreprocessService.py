@@ -1,26 +1,44 @@
+import os
+import tempfile
+
+import numpy as np
 import pandas as pd
 from sklearn.impute import SimpleImputer
 from sklearn.preprocessing import StandardScaler
-from Services.DataDimsReductionServices.UserDimsReductionService import apply_pca_on_user_df
+from Domain.Constants.DataSchemas import USERS_SCHEMA
+from Services.DataImporterServices.DataSchemaService import apply_schema
+from Services.DataDimsReductionServices.UserDimsReductionService import (apply_incremental_pca_on_user_features,
+                                                                         apply_pca_on_user_df)
+from Services.DataPreprocessServices.RunningMomentsService import RunningMoments
+from Services.TracingServices.TracingService import traced
+
+# Features the users are reduced from, 'AccountId' is kept aside
+USER_FEATURES = ['Reputation', 'UpVotes']
 
-def preprocess_users_data(users_df):
+@traced(rows=len)
+def preprocess_users_data(users_df, min_reputation=50, n_components=1):
     """
     Preprocesses the user data to select relevant columns, apply scaling for PCA,
     and retain the original AccountId (not scaled) while excluding rows with AccountId < 1.
 
     Args:
         users_df (pd.DataFrame): The DataFrame containing users data.
+        min_reputation (int): Users with a lower Reputation are removed.
+        n_components (int): The number of principal components to keep.
 
     Returns:
         pd.DataFrame: The preprocessed DataFrame containing only relevant columns for PCA,
                       with the original 'AccountId' kept intact, and rows with AccountId < 1 removed
-                      and Reputation lower than 50.
+                      and Reputation lower than min_reputation.
     """
+    # Type the columns when the users were not imported through the schema
+    users_df = apply_schema(users_df, USERS_SCHEMA)
+
     # Filter out rows where AccountId is less than 1
     users_df = users_df[users_df['AccountId'] >= 1]
 
-    # Filter out rows where Reputation is less than 50
-    users_df = users_df[users_df['Reputation'] >= 50]
+    # Filter out rows where Reputation is less than min_reputation
+    users_df = users_df[users_df['Reputation'] >= min_reputation]
 
     # Select only the relevant columns: 'AccountId', 'DisplayName', 'Reputation'
     users_df_selected = users_df[['AccountId', 'DisplayName', 'Reputation', 'UpVotes']]
@@ -43,6 +61,63 @@ def preprocess_users_data(users_df):
     scaled_data = scalar.fit_transform(features_to_scale)
 
     # Apply PCA and include 'AccountId'
-    users_reduced_df = apply_pca_on_user_df(scaled_data, account_ids, n_components=1)
+    users_reduced_df = apply_pca_on_user_df(scaled_data, account_ids, n_components=n_components)
+
+    return users_reduced_df
+
+
+@traced(rows=len)
+def preprocess_users_data_streaming(users_chunks, min_reputation=50, n_components=1, batch_size=100_000,
+                                    spill_dir=None):
+    """
+    Streaming variant of preprocess_users_data for users dumps larger than RAM.
+
+    The chunks are read once: the features of the kept users are spilled to a temporary
+    file while their imputation means and scaler statistics are accumulated as running
+    moments. IncrementalPCA is then fitted batch by batch on the memory-mapped features
+    and a second pass transforms them, so memory stays bounded by one batch plus the result.
+
+    Args:
+        users_chunks (iterable): DataFrames with 'AccountId', 'Reputation' and 'UpVotes' columns
+                                 (e.g. from iter_users_data).
+        min_reputation (int): Users with a lower Reputation are removed.
+        n_components (int): The number of principal components to keep.
+        batch_size (int): Rows per IncrementalPCA batch.
+        spill_dir (str, optional): Directory of the temporary feature file, the system default when None.
+
+    Returns:
+        pd.DataFrame: The principal components of the kept users ('Reputation', 'PC2', ...)
+                      with their original 'AccountId'.
+    """
+    moments = RunningMoments(len(USER_FEATURES))
+
+    with tempfile.TemporaryDirectory(dir=spill_dir) as spill_path:
+        features_path = os.path.join(spill_path, "features.bin")
+        account_ids_path = os.path.join(spill_path, "account_ids.bin")
+
+        # First pass: filter every chunk, spill its features and update the running moments
+        with open(features_path, "wb") as features_file, open(account_ids_path, "wb") as account_ids_file:
+            for chunk in users_chunks:
+                chunk = apply_schema(chunk, USERS_SCHEMA)
+                chunk = chunk[(chunk['AccountId'] >= 1) & (chunk['Reputation'] >= min_reputation)]
+
+                features = chunk[USER_FEATURES].to_numpy(dtype=np.float64, na_value=np.nan)
+                moments.update(features)
+                features.tofile(features_file)
+                chunk['AccountId'].to_numpy(dtype=np.int64).tofile(account_ids_file)
+
+        if moments.n_rows == 0:
+            raise ValueError(f"No users with AccountId >= 1 and Reputation >= {min_reputation} to reduce")
+
+        features = np.memmap(features_path, dtype=np.float64, mode='r', shape=(moments.n_rows, len(USER_FEATURES)))
+        account_ids = np.fromfile(account_ids_path, dtype=np.int64)
+
+        # Fit and transform batch by batch on the spilled features
+        users_reduced_df = apply_incremental_pca_on_user_features(
+            features, account_ids, moments, n_components=n_components, batch_size=batch_size
+        )
+
+        # Release the mapping before the temporary directory is removed
+        del features
 
     return users_reduced_df
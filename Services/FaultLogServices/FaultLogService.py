@@ -0,0 +1,89 @@
+import time
+from typing import List, Optional, Sequence, TextIO
+
+import numpy as np
+
+from Domain.Constants.FaultResults import FAULT_RESULT_DTYPE, STATUS_OUTCOMES
+from Domain.Models.ServerFleet import ServerFleet
+from Presentation.ServerStatusShow.ServerStatusRenderer import MODE_AUTO, ServerStatusRenderer
+from Presentation.ServerStatusShow.ServerStatusUI import show_servers_status
+
+
+def save_fault_log(path: str, batches: Sequence[np.ndarray], servers: List) -> None:
+    """
+    Saves the handle_faults results of a run and the names of its servers as an .npz file.
+    """
+    faults = np.concatenate(batches) if len(batches) else np.empty(0, dtype=FAULT_RESULT_DTYPE)
+    if isinstance(servers, ServerFleet):
+        server_names = servers.names
+    else:
+        server_names = np.array([server.naziv for server in servers], dtype=str)
+
+    with open(path, "wb") as log_file:
+        np.savez(log_file, faults=faults, server_names=server_names)
+    print(f"💾 Fault log with {len(faults):,} faults written to {path}")
+
+
+def load_fault_log(path: str):
+    """
+    Returns:
+        tuple: (faults as a FAULT_RESULT_DTYPE array, server names)
+    """
+    with np.load(path) as fault_log:
+        return fault_log['faults'], fault_log['server_names']
+
+
+def _recorded(faults: np.ndarray) -> np.ndarray:
+    # Faults without a valid post were never recorded on a server
+    return faults[faults['post_id'] >= 0]
+
+
+def fleet_from_fault_log(faults: np.ndarray, server_names: np.ndarray) -> ServerFleet:
+    recorded = _recorded(faults)
+    fleet = ServerFleet(server_names.tolist())
+    fleet.add_faults(recorded['server_index'], recorded['post_id'])
+    return fleet
+
+
+def print_fault_outcomes(faults: np.ndarray) -> None:
+    outcomes = np.bincount(faults['status'], minlength=len(STATUS_OUTCOMES))
+    print(f"Faults: {len(faults):,}, " + ", ".join(
+        f"{outcome.replace('_', ' ')}: {int(count):,}" for outcome, count in zip(STATUS_OUTCOMES, outcomes)))
+
+
+def show_fault_log_status(path: str, mode: str = MODE_AUTO) -> ServerFleet:
+    """
+    Prints the servers' status at the end of a saved run.
+    """
+    faults, server_names = load_fault_log(path)
+    fleet = fleet_from_fault_log(faults, server_names)
+    if len(fleet) <= 10 and mode == MODE_AUTO:
+        show_servers_status(fleet)
+    else:
+        ServerStatusRenderer(fleet, mode).render()
+        print()
+    print_fault_outcomes(faults)
+    return fleet
+
+
+def replay_fault_log(path: str, faults_per_frame: int = 1000, frame_interval: float = 0.05,
+                     mode: str = MODE_AUTO, stream: Optional[TextIO] = None) -> ServerFleet:
+    """
+    Replays a saved run on the terminal, adding faults_per_frame faults to the servers
+    every frame_interval seconds and redrawing only the servers that changed.
+    """
+    faults, server_names = load_fault_log(path)
+    recorded = _recorded(faults)
+    fleet = ServerFleet(server_names.tolist())
+    renderer = ServerStatusRenderer(fleet, mode, stream)
+
+    renderer.render()
+    for start in range(0, len(recorded), faults_per_frame):
+        frame = recorded[start:start + faults_per_frame]
+        fleet.add_faults(frame['server_index'], frame['post_id'])
+        renderer.render()
+        time.sleep(frame_interval)
+
+    print()
+    print_fault_outcomes(faults)
+    return fleet
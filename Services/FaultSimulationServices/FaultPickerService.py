@@ -1,3 +1,128 @@
-def pick_a_server_fault(posts):
-    # Pick single random row
-    return posts.sample(n=1)
\ No newline at end of file
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class AliasTable:
+    """
+    Walker/Vose alias table for O(1) sampling from a fixed discrete distribution.
+    """
+    def __init__(self, weights):
+        weights = np.asarray(weights, dtype=np.float64)
+        if weights.ndim != 1 or len(weights) == 0:
+            raise ValueError("Weights must be a non-empty 1D array")
+        if np.any(weights < 0) or not np.all(np.isfinite(weights)) or weights.sum() <= 0:
+            raise ValueError("Weights must be finite, non-negative and not all zero")
+
+        n = len(weights)
+        scaled = weights * (n / weights.sum())
+        self.probabilities = np.ones(n)
+        self.aliases = np.arange(n)
+
+        small = [i for i in range(n) if scaled[i] < 1.0]
+        large = [i for i in range(n) if scaled[i] >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self.probabilities[less] = scaled[less]
+            self.aliases[less] = more
+            scaled[more] -= 1.0 - scaled[less]
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        columns = rng.integers(0, len(self.probabilities), size)
+        keep = rng.random(size) < self.probabilities[columns]
+        return np.where(keep, columns, self.aliases[columns])
+
+
+class FaultSource:
+    """
+    Reproducible stream of (post row, server index) faults.
+
+    Faults are pre-drawn in large blocks with a seeded NumPy Generator, uniformly or
+    from weighted distributions through alias tables, and handed out as plain ints
+    without building a DataFrame per fault.
+    """
+    def __init__(self, n_posts: int, n_servers: int, seed: Optional[int] = None,
+                 post_weights=None, server_weights=None, block_size: int = 65536):
+        if n_posts < 1 or n_servers < 1:
+            raise ValueError("At least one post and one server are required")
+
+        self.n_posts = n_posts
+        self.n_servers = n_servers
+        self.block_size = block_size
+        self._rng = np.random.default_rng(seed)
+        self._post_table = AliasTable(post_weights) if post_weights is not None else None
+        self._server_table = AliasTable(server_weights) if server_weights is not None else None
+        if self._post_table is not None and len(self._post_table.probabilities) != n_posts:
+            raise ValueError("post_weights must have one weight per post")
+        if self._server_table is not None and len(self._server_table.probabilities) != n_servers:
+            raise ValueError("server_weights must have one weight per server")
+
+        self._post_rows = np.empty(0, dtype=np.int64)
+        self._server_indices = np.empty(0, dtype=np.int64)
+        self._position = 0
+
+    @classmethod
+    def from_posts(cls, posts: pd.DataFrame, n_servers: int, seed: Optional[int] = None,
+                   weight_by_score: bool = False, server_failure_probabilities=None, block_size: int = 65536):
+        """
+        Creates a fault source over the rows of a posts frame.
+
+        Args:
+            posts (pd.DataFrame): Posts to draw faults from.
+            n_servers (int): Number of servers in the cluster.
+            seed (int, optional): Seed of the random generator.
+            weight_by_score (bool): Draw posts proportionally to their non-negative Score plus one.
+            server_failure_probabilities (array-like, optional): Relative failure probability per server.
+            block_size (int): Number of faults drawn at once.
+
+        Returns:
+            FaultSource: The configured fault source.
+        """
+        post_weights = None
+        if weight_by_score:
+            scores = pd.to_numeric(posts['Score'], errors='coerce').fillna(0).to_numpy(dtype=np.float64)
+            post_weights = np.clip(scores, 0, None) + 1
+
+        return cls(len(posts), n_servers, seed, post_weights, server_failure_probabilities, block_size)
+
+    def _draw_indices(self, table: Optional[AliasTable], n_values: int, size: int) -> np.ndarray:
+        if table is None:
+            return self._rng.integers(0, n_values, size)
+        return table.sample(self._rng, size)
+
+    def _refill(self) -> None:
+        self._post_rows = self._draw_indices(self._post_table, self.n_posts, self.block_size)
+        self._server_indices = self._draw_indices(self._server_table, self.n_servers, self.block_size)
+        self._position = 0
+
+    def next_fault(self) -> Tuple[int, int]:
+        """
+        Returns the next (post row, server index) fault.
+        """
+        if self._position >= len(self._post_rows):
+            self._refill()
+        position = self._position
+        self._position += 1
+        return int(self._post_rows[position]), int(self._server_indices[position])
+
+    def draw(self, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the next n faults as (post rows, server indices) arrays.
+        """
+        post_rows = np.empty(n, dtype=np.int64)
+        server_indices = np.empty(n, dtype=np.int64)
+        filled = 0
+        while filled < n:
+            if self._position >= len(self._post_rows):
+                self._refill()
+            count = min(n - filled, len(self._post_rows) - self._position)
+            post_rows[filled:filled + count] = self._post_rows[self._position:self._position + count]
+            server_indices[filled:filled + count] = self._server_indices[self._position:self._position + count]
+            self._position += count
+            filled += count
+        return post_rows, server_indices
@@ -0,0 +1,82 @@
+import gc
+import threading
+import time
+
+# Garbage collection modes
+GC_OFF = "off"
+GC_GENERATIONAL = "generational"
+GC_EVERY_N_FAULTS = "every_n_faults"
+
+
+class GcPolicy:
+    """
+    Controls when the garbage collector runs during a simulation and measures its cost.
+
+    - GC_OFF: automatic collection is disabled for the duration of the run.
+    - GC_GENERATIONAL: Python's normal generational collector runs on its own.
+    - GC_EVERY_N_FAULTS: automatic collection is disabled and a full collection runs
+      after every collect_every handled faults.
+
+    Time spent in every collection, automatic or explicit, is measured through gc.callbacks.
+    """
+    def __init__(self, mode: str = GC_GENERATIONAL, collect_every: int = 10_000):
+        if mode not in (GC_OFF, GC_GENERATIONAL, GC_EVERY_N_FAULTS):
+            raise ValueError(f"Unknown GC mode: {mode}")
+        if collect_every < 1:
+            raise ValueError("collect_every must be at least 1")
+
+        self.mode = mode
+        self.collect_every = collect_every
+        self.collections = 0
+        self.gc_seconds = 0.0
+        self._faults_since_collect = 0
+        self._collection_starts = {}
+        self._lock = threading.Lock()
+        self._installed = False
+        self._was_enabled = True
+
+    def install(self) -> None:
+        if self._installed:
+            return
+        self._was_enabled = gc.isenabled()
+        gc.callbacks.append(self._on_gc)
+        if self.mode in (GC_OFF, GC_EVERY_N_FAULTS):
+            gc.disable()
+        self._installed = True
+
+    def uninstall(self) -> None:
+        if not self._installed:
+            return
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+        if self._was_enabled:
+            gc.enable()
+        self._installed = False
+
+    def on_faults(self, count: int = 1) -> None:
+        """
+        Records handled faults and runs a full collection when the policy asks for one.
+        """
+        if self.mode != GC_EVERY_N_FAULTS:
+            return
+        with self._lock:
+            self._faults_since_collect += count
+            if self._faults_since_collect < self.collect_every:
+                return
+            self._faults_since_collect = 0
+        gc.collect()
+
+    def _on_gc(self, phase, info) -> None:
+        thread_id = threading.get_ident()
+        if phase == "start":
+            self._collection_starts[thread_id] = time.perf_counter()
+        else:
+            started = self._collection_starts.pop(thread_id, None)
+            if started is not None:
+                with self._lock:
+                    self.collections += 1
+                    self.gc_seconds += time.perf_counter() - started
+
+    def print_report(self) -> None:
+        print(f"\n🧹 Garbage collection ({self.mode}): {self.collections} collections, "
+              f"{self.gc_seconds * 1000:.1f} ms total")
@@ -0,0 +1,63 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from Services.MetricsServices.MetricsRegistryService import MetricsRegistry
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class MetricsHttpServer:
+    """
+    Serves a metrics registry on localhost: /metrics in the Prometheus text format
+    and /metrics.json as JSON. Requests are handled on a daemon thread.
+    """
+    def __init__(self, registry: MetricsRegistry, port: int, host: str = "127.0.0.1"):
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self._server = None
+        self._thread = None
+
+    def start(self) -> None:
+        if self._server is not None:
+            return
+
+        registry = self.registry
+
+        class MetricsRequestHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path == "/metrics":
+                    body = registry.render_prometheus().encode("utf-8")
+                    content_type = PROMETHEUS_CONTENT_TYPE
+                elif self.path == "/metrics.json":
+                    body = json.dumps(registry.to_dict()).encode("utf-8")
+                    content_type = "application/json"
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                # Keep scrapes out of the simulation output
+                pass
+
+        self._server = ThreadingHTTPServer((self.host, self.port), MetricsRequestHandler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        print(f"📈 Metrics available at http://{self.host}:{self.port}/metrics")
+
+    def stop(self) -> None:
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join(timeout=5)
+        self._server = None
+        self._thread = None
@@ -0,0 +1,203 @@
+import bisect
+import json
+import math
+import threading
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+import numpy as np
+
+# Latency bucket upper bounds in seconds, from 1 microsecond to 100 seconds at about 12% resolution
+LATENCY_BUCKET_BOUNDS = np.geomspace(1e-6, 100.0, 161).tolist()
+
+EXPORTED_QUANTILES = (0.5, 0.9, 0.99)
+
+
+def _format_labels(label_names: Tuple[str, ...], label_values: Tuple, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape_label(value)}"' for name, value in zip(label_names, label_values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape_label(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+class Counter:
+    """
+    Monotonic counter, optionally split by label values.
+    """
+    metric_type = "counter"
+
+    def __init__(self, name: str, help_text: str, label_names: Tuple[str, ...] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = tuple(labels.get(name, "") for name in self.label_names)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(tuple(labels.get(name, "") for name in self.label_names), 0)
+
+    def samples(self) -> Iterable[Tuple[Tuple, float]]:
+        with self._lock:
+            return list(self._values.items())
+
+    def prometheus_lines(self) -> list[str]:
+        return [f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}"
+                for key, value in self.samples()]
+
+    def to_dict(self) -> dict:
+        return {'type': self.metric_type, 'help': self.help_text,
+                'values': [{'labels': dict(zip(self.label_names, key)), 'value': value}
+                           for key, value in self.samples()]}
+
+
+class Gauge(Counter):
+    """
+    Value that can go up and down. A gauge with a callback computes its samples when
+    it is collected, as (label values, value) pairs.
+    """
+    metric_type = "gauge"
+
+    def __init__(self, name: str, help_text: str, label_names: Tuple[str, ...] = (),
+                 callback: Optional[Callable[[], Iterable[Tuple[Tuple, float]]]] = None):
+        super().__init__(name, help_text, label_names)
+        self._callback = callback
+
+    def set(self, value: float, **labels) -> None:
+        key = tuple(labels.get(name, "") for name in self.label_names)
+        with self._lock:
+            self._values[key] = value
+
+    def samples(self) -> Iterable[Tuple[Tuple, float]]:
+        if self._callback is not None:
+            return list(self._callback())
+        return super().samples()
+
+
+class LatencyHistogram:
+    """
+    Latency distribution over fixed logarithmic buckets.
+
+    Observations cost one binary search, and quantiles are interpolated within their
+    bucket. It is exported in the Prometheus summary format with the p50, p90 and p99
+    quantiles, the sum and the count.
+    """
+    metric_type = "summary"
+
+    def __init__(self, name: str, help_text: str, bounds: Optional[list] = None):
+        self.name = name
+        self.help_text = help_text
+        self._bounds = list(bounds or LATENCY_BUCKET_BOUNDS)
+        self._counts = [0] * (len(self._bounds) + 1)
+        self._sum = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+    def observe(self, seconds: float) -> None:
+        bucket = bisect.bisect_left(self._bounds, seconds)
+        with self._lock:
+            self._counts[bucket] += 1
+            self._sum += seconds
+            self._count += 1
+
+    def quantile(self, q: float) -> float:
+        with self._lock:
+            counts = np.array(self._counts, dtype=np.int64)
+            count = self._count
+        if count == 0:
+            return math.nan
+
+        cumulative = np.cumsum(counts)
+        rank = q * count
+        bucket = int(np.searchsorted(cumulative, rank, side='left'))
+        if bucket >= len(self._bounds):
+            return self._bounds[-1]
+
+        # Linear interpolation inside the bucket
+        lower = self._bounds[bucket - 1] if bucket > 0 else 0.0
+        upper = self._bounds[bucket]
+        below = cumulative[bucket - 1] if bucket > 0 else 0
+        fraction = (rank - below) / counts[bucket] if counts[bucket] else 1.0
+        return lower + (upper - lower) * min(max(fraction, 0.0), 1.0)
+
+    def prometheus_lines(self) -> list[str]:
+        lines = [f"{self.name}{{quantile=\"{q}\"}} {_format_value(self.quantile(q))}" for q in EXPORTED_QUANTILES]
+        lines.append(f"{self.name}_sum {_format_value(self._sum)}")
+        lines.append(f"{self.name}_count {self._count}")
+        return lines
+
+    def to_dict(self) -> dict:
+        result = {'type': self.metric_type, 'help': self.help_text, 'count': self._count, 'sum': self._sum}
+        for q in EXPORTED_QUANTILES:
+            value = self.quantile(q)
+            result[f"p{round(q * 100)}"] = None if math.isnan(value) else value
+        return result
+
+
+class MetricsRegistry:
+    """
+    Named collection of metrics that renders them in the Prometheus text format or as JSON.
+    """
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric):
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric):
+                    raise ValueError(f"Metric {metric.name} is already registered as a {existing.metric_type}")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, help_text: str, label_names: Tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter(name, help_text, label_names))
+
+    def gauge(self, name: str, help_text: str, label_names: Tuple[str, ...] = (),
+              callback: Optional[Callable] = None) -> Gauge:
+        return self._register(Gauge(name, help_text, label_names, callback))
+
+    def histogram(self, name: str, help_text: str) -> LatencyHistogram:
+        return self._register(LatencyHistogram(name, help_text))
+
+    def render_prometheus(self) -> str:
+        lines = []
+        for metric in list(self._metrics.values()):
+            lines.append(f"# HELP {metric.name} {metric.help_text}")
+            lines.append(f"# TYPE {metric.name} {metric.metric_type}")
+            lines.extend(metric.prometheus_lines())
+        return "\n".join(lines) + "\n"
+
+    def to_dict(self) -> dict:
+        return {name: metric.to_dict() for name, metric in list(self._metrics.items())}
+
+    def dump_json(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as json_file:
+            json.dump(self.to_dict(), json_file, indent=2)
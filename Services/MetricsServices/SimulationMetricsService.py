@@ -0,0 +1,79 @@
+import time
+from typing import Callable, List, Optional
+
+import numpy as np
+
+from Domain.Models.ServerFleet import ServerFleet, fault_counts_of
+from Services.MetricsServices.MetricsRegistryService import MetricsRegistry
+
+DEFAULT_METRICS_PORT = 9108
+
+
+class SimulationMetrics:
+    """
+    Metrics of a fault simulation: faults generated, resolution outcomes, fault handling
+    and monitor tick latencies, and per-server fault counts and rates.
+
+    Per-server values are read from the servers when the metrics are collected, so the
+    fault handling path only updates a few counters. They are labelled by server id, which
+    is unique, with the server name as an extra label.
+    """
+    def __init__(self, servers: List, registry: Optional[MetricsRegistry] = None,
+                 clock: Optional[Callable[[], float]] = None):
+        self.servers = servers
+        self._server_labels = None
+        self.registry = registry or MetricsRegistry()
+        self._start = time.monotonic()
+        # Seconds of simulated uptime, wall-clock time unless a virtual clock is given
+        self.clock = clock or (lambda: time.monotonic() - self._start)
+
+        self.faults_generated = self.registry.counter(
+            "faults_generated_total", "Faults drawn and recorded on a server")
+        self.fault_outcomes = self.registry.counter(
+            "faults_handled_total", "Handled faults by resolution outcome", ("outcome",))
+        self.handle_fault_seconds = self.registry.histogram(
+            "handle_fault_seconds", "Latency of detecting and resolving one fault")
+        self.handle_faults_batch_seconds = self.registry.histogram(
+            "handle_faults_batch_seconds", "Latency of handling one vectorized batch of faults")
+        self.monitor_tick_seconds = self.registry.histogram(
+            "monitor_tick_seconds", "Duration of one monitor status update")
+        self.registry.gauge(
+            "uptime_seconds", "Simulated seconds since the metrics were created",
+            callback=lambda: [((), self.clock())])
+        self.registry.gauge(
+            "server_faults", "Faults recorded per server", ("server_id", "server"),
+            callback=self._server_fault_samples)
+        self.registry.gauge(
+            "server_fault_rate_per_hour", "Faults per hour of uptime per server", ("server_id", "server"),
+            callback=self._server_rate_samples)
+
+    def record_outcome(self, outcome: str, count: int = 1) -> None:
+        if count:
+            self.fault_outcomes.inc(count, outcome=outcome)
+
+    def _server_label_values(self) -> list:
+        # Ids and names do not change, so the labels are only rebuilt when the cluster changes size
+        if self._server_labels is None or len(self._server_labels) != len(self.servers):
+            if isinstance(self.servers, ServerFleet):
+                self._server_labels = [(self.servers.server_id(index), name)
+                                       for index, name in enumerate(self.servers.names.tolist())]
+            else:
+                self._server_labels = [(server.id_servera, server.naziv) for server in self.servers]
+        return self._server_labels
+
+    def _server_fault_samples(self):
+        fault_counts = fault_counts_of(self.servers)
+        return [(labels, int(count)) for labels, count in zip(self._server_label_values(), fault_counts.tolist())]
+
+    def _server_rate_samples(self):
+        uptime = self.clock()
+        fault_counts = fault_counts_of(self.servers)
+        rates = fault_counts * 3600.0 / uptime if uptime > 0 else np.zeros(len(fault_counts))
+        return [(labels, rate) for labels, rate in zip(self._server_label_values(), rates.tolist())]
+
+    def print_latency_summary(self) -> None:
+        print("\n⏱️ Latency:")
+        for histogram in (self.handle_fault_seconds, self.handle_faults_batch_seconds, self.monitor_tick_seconds):
+            if histogram.count:
+                print(f"{histogram.name}: p50 {histogram.quantile(0.5) * 1000:.3f} ms, "
+                      f"p99 {histogram.quantile(0.99) * 1000:.3f} ms ({histogram.count} samples)")
@@ -0,0 +1,200 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from Domain.Constants.FaultResults import (FAULT_PARTIALLY_RESOLVED, FAULT_RESOLVED, FAULT_RESULT_DTYPE,
+                                           FAULT_UNRESOLVED, STATUS_OUTCOMES, STATUS_PARTIALLY_RESOLVED,
+                                           STATUS_RESOLVED, STATUS_UNRESOLVED)
+from Services.DataCacheServices.GroupingArtifactStoreService import GroupingArtifactStore
+from Services.FaultLogServices.FaultLogService import save_fault_log
+from Services.FaultSimulationServices.FaultPickerService import FaultSource
+from Services.ParallelSimulationServices.SharedArrayStoreService import SharedArrayStore, load_shared_arrays
+from Services.ServerWorkSimulationWithFaultsServices.FaultBatchResolverService import (FaultBatchResolver,
+                                                                                      add_faults_to_servers)
+
+# Name of the shared array the workers write their fault results into
+FAULT_OUTPUT = "faults"
+
+
+def partition_servers(n_servers: int, n_workers: int) -> List[tuple]:
+    """
+    Splits the fleet into n_workers contiguous partitions of nearly equal size.
+
+    Returns:
+        list: (first server index, number of servers) of every partition.
+    """
+    partitions = np.array_split(np.arange(n_servers), n_workers)
+    return [(int(partition[0]), len(partition)) for partition in partitions if len(partition)]
+
+
+def split_faults(n_faults: int, partition_sizes) -> np.ndarray:
+    """
+    Splits n_faults between the partitions in proportion to their number of servers,
+    which is each partition's expected share of a uniform fault stream.
+    """
+    partition_sizes = np.asarray(partition_sizes, dtype=np.int64)
+    shares = n_faults * partition_sizes / partition_sizes.sum()
+    counts = np.floor(shares).astype(np.int64)
+
+    # Hand the remaining faults to the partitions with the largest remainders
+    remaining = n_faults - int(counts.sum())
+    counts[np.argsort(counts - shares, kind='stable')[:remaining]] += 1
+    return counts
+
+
+def _simulate_partition(paths: dict, first_server: int, n_servers: int, n_faults: int,
+                        seed: np.random.SeedSequence, batch_size: int, output_start: int):
+    """
+    Runs in a worker process: draws and resolves the faults of one partition of the fleet
+    against the memory-mapped indexes.
+
+    Returns:
+        tuple: (fault count per server of the partition, count per status code, seconds spent)
+    """
+    arrays = load_shared_arrays(paths, writable=(FAULT_OUTPUT,))
+    output = arrays.pop(FAULT_OUTPUT, None)
+    resolver = FaultBatchResolver.from_arrays(arrays)
+
+    fault_seed, resolution_seed = seed.spawn(2)
+    fault_source = FaultSource(resolver.n_posts, n_servers, seed=fault_seed)
+    rng = np.random.default_rng(resolution_seed)
+
+    fault_counts = np.zeros(n_servers, dtype=np.int64)
+    outcomes = np.zeros(len(STATUS_OUTCOMES), dtype=np.int64)
+    started = time.perf_counter()
+    for start in range(0, n_faults, batch_size):
+        post_rows, local_servers = fault_source.draw(min(batch_size, n_faults - start))
+        results = resolver.resolve(post_rows, local_servers + first_server, rng)
+
+        fault_counts += np.bincount(local_servers[results['post_id'] >= 0], minlength=n_servers)
+        outcomes += np.bincount(results['status'], minlength=len(outcomes))
+        if output is not None:
+            output[output_start + start:output_start + start + len(results)] = results
+
+    if output is not None:
+        output.flush()
+    return fault_counts, outcomes, time.perf_counter() - started
+
+
+def run_parallel_simulation(users_data: pd.DataFrame,
+                            posts_data: pd.DataFrame,
+                            comments_data: pd.DataFrame,
+                            servers_cluster: List,
+                            n_faults: int,
+                            n_workers: Optional[int] = None,
+                            batch_size: int = 100_000,
+                            artifact_store: Optional[GroupingArtifactStore] = None,
+                            seed: Optional[int] = None,
+                            record_faults: Optional[bool] = None,
+                            fault_log_path: Optional[str] = None,
+                            shared_dir: Optional[str] = None) -> dict:
+    """
+    Simulates n_faults faults on several worker processes, each owning a contiguous
+    partition of the fleet.
+
+    The coordinator groups the comments and builds the candidate and lookup indexes once. It then
+    places their arrays in a SharedArrayStore, which every worker memory-maps instead of copying.
+    Each worker draws its partition's share of the faults from its own seeded fault
+    source and resolves them in batches with the same FaultBatchResolver as
+    FaultSimulator.handle_faults. The coordinator merges the per-server fault counts and
+    the resolution outcomes.
+
+    Args:
+        n_faults (int): Total number of faults to simulate.
+        n_workers (int, optional): Worker processes, one per CPU core by default, at most one per server.
+        batch_size (int): Faults resolved per batch in a worker.
+        artifact_store (GroupingArtifactStore, optional): Reuses trained grouping models.
+        seed (int, optional): Seed of the grouping models and of every worker's fault stream.
+        record_faults (bool, optional): Workers write every fault result into a shared array, and the
+                                        coordinator records the faults on the servers afterwards. When False,
+                                        only the counts are merged and the servers are left untouched. By
+                                        default the faults are recorded only when fault_log_path is given.
+        fault_log_path (str, optional): Saves every handled fault to this file for replay. Requires record_faults.
+        shared_dir (str, optional): Directory of the shared array files, the system temporary directory by default.
+
+    Returns:
+        dict: Run statistics (wall seconds including the merge, merge seconds, faults, faults per
+              second, resolution outcomes and the fault count of every server).
+    """
+    if record_faults is None:
+        record_faults = fault_log_path is not None
+    if fault_log_path is not None and not record_faults:
+        raise ValueError("A fault log requires record_faults")
+    if len(servers_cluster) == 0 or posts_data.empty:
+        raise ValueError("At least one server and one post are required")
+    if batch_size < 1:
+        raise ValueError("Batch size must be at least 1")
+
+    # The simulator pulls in scikit-learn and SciPy, the workers only need NumPy
+    from Services.ServerWorkSimulationWithFaultsServices.ServerWorkSimulationWithFaultsService import (
+        FaultSimulator)
+
+    simulator = FaultSimulator(artifact_store, seed=seed, verbose=False)
+    print("\n⏳ Processing comment data...")
+    simulator.group_similar_comments(comments_data)
+    simulator.build_candidate_index(comments_data)
+    simulator.build_lookup_indexes(users_data, comments_data, posts_data)
+    print("✅ Comment processing complete")
+
+    partitions = partition_servers(len(servers_cluster), n_workers or os.cpu_count() or 1)
+    worker_faults = split_faults(n_faults, [size for _, size in partitions])
+    output_starts = np.concatenate(([0], np.cumsum(worker_faults)[:-1]))
+    worker_seeds = np.random.SeedSequence(seed).spawn(len(partitions))
+
+    server_fault_counts = np.zeros(len(servers_cluster), dtype=np.int64)
+    outcomes = np.zeros(len(STATUS_OUTCOMES), dtype=np.int64)
+    with SharedArrayStore(simulator.batch_resolver().to_arrays(), shared_dir) as shared:
+        output = shared.create_output(FAULT_OUTPUT, (n_faults,), FAULT_RESULT_DTYPE) if record_faults else None
+
+        print(f"\n▶️ Simulating {n_faults:,} faults on {len(partitions)} worker processes...")
+        wall_start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=len(partitions)) as executor:
+            futures = [
+                executor.submit(_simulate_partition, shared.paths, first_server, size, int(faults), worker_seed,
+                                batch_size, int(output_start))
+                for (first_server, size), faults, worker_seed, output_start
+                in zip(partitions, worker_faults, worker_seeds, output_starts)
+            ]
+            worker_results = [future.result() for future in futures]
+        merge_start = time.perf_counter()
+
+        # Merge the partitions
+        for (first_server, size), (fault_counts, worker_outcomes, _) in zip(partitions, worker_results):
+            server_fault_counts[first_server:first_server + size] += fault_counts
+            outcomes += worker_outcomes
+
+        if output is not None:
+            # Recorded straight from the mapping, which is released before the shared files are removed
+            add_faults_to_servers(servers_cluster, output)
+            if fault_log_path is not None:
+                save_fault_log(fault_log_path, [output], servers_cluster)
+            del output
+
+        # The merge runs serially in the coordinator and counts towards the throughput
+        merge_seconds = time.perf_counter() - merge_start
+        wall_seconds = time.perf_counter() - wall_start
+
+    simulator.cleanup()
+
+    stats = {
+        'wall_seconds': wall_seconds,
+        'merge_seconds': merge_seconds,
+        'workers': len(partitions),
+        'faults': n_faults,
+        'faults_per_second': n_faults / max(wall_seconds, 1e-9),
+        'worker_seconds': [seconds for _, _, seconds in worker_results],
+        FAULT_RESOLVED: int(outcomes[STATUS_RESOLVED]),
+        FAULT_PARTIALLY_RESOLVED: int(outcomes[STATUS_PARTIALLY_RESOLVED]),
+        FAULT_UNRESOLVED: int(outcomes[STATUS_UNRESOLVED]),
+        'server_fault_counts': server_fault_counts
+    }
+    print(f"\n🏁 Simulated {n_faults:,} faults in {wall_seconds:.1f}s "
+          f"({stats['faults_per_second']:,.0f} faults/s on {len(partitions)} workers, "
+          f"{merge_seconds:.2f}s merging)")
+    print(f"Faults: {n_faults}, resolved: {stats[FAULT_RESOLVED]}, "
+          f"partially resolved: {stats[FAULT_PARTIALLY_RESOLVED]}, unresolved: {stats[FAULT_UNRESOLVED]}")
+    return stats
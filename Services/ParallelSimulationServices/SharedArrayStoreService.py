@@ -0,0 +1,57 @@
+import os
+import tempfile
+from typing import Iterable, Optional
+
+import numpy as np
+
+
+class SharedArrayStore:
+    """
+    NumPy arrays shared with worker processes through memory-mapped .npy files.
+
+    Every array is written once to a temporary directory. Workers memory-map the files, so
+    all processes read the same pages of the OS page cache. Nothing is pickled or copied per
+    worker, and this works with both the fork and the spawn start methods. Writable output arrays
+    let workers write their results in place, each worker to its own slice.
+    """
+    def __init__(self, arrays: dict, directory: Optional[str] = None):
+        self._directory = tempfile.TemporaryDirectory(prefix="server_faults_shared_", dir=directory)
+        self.paths = {}
+        for name, array in arrays.items():
+            self.paths[name] = self._path(name)
+            np.save(self.paths[name], np.asarray(array, order='C'))
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self._directory.name, f"{name}.npy")
+
+    def create_output(self, name: str, shape, dtype) -> np.memmap:
+        """
+        Creates a writable shared array and returns the coordinator's mapping of it.
+        """
+        self.paths[name] = self._path(name)
+        return np.lib.format.open_memmap(self.paths[name], mode='w+', dtype=dtype, shape=shape)
+
+    def close(self) -> None:
+        """
+        Removes the files. Every mapping must have been released first.
+        """
+        self._directory.cleanup()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+def load_shared_arrays(paths: dict, writable: Iterable[str] = ()) -> dict:
+    """
+    Memory-maps the arrays of a SharedArrayStore in a worker process, read-only
+    except for the named writable ones.
+    """
+    writable = set(writable)
+    return {
+        name: np.load(path, mmap_mode='r+' if name in writable else 'r')
+        for name, path in paths.items()
+    }
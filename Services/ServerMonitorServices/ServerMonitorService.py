@@ -1,22 +1,61 @@
 import threading
 import time
-from typing import List
+from typing import List, Optional
 import pandas as pd
-from threading import Event
-from datetime import datetime
+from threading import Condition, Event
+from datetime import datetime, timedelta
+import numpy as np
 from Presentation.ServerStatusShow.ServerStatusUI import show_servers_status
+from Presentation.ServerStatusShow.ServerStatusRenderer import ServerStatusRenderer
 import gc
-from Services.ServerWorkSimulationWithFaultsServices.ServerWorkSimulationWithFaultsService import FaultSimulator
+from Domain.Constants.FaultResults import (
+    FAULT_PARTIALLY_RESOLVED, FAULT_RESOLVED, FAULT_UNRESOLVED, STATUS_PARTIALLY_RESOLVED, STATUS_RESOLVED,
+    STATUS_UNRESOLVED)
+from Domain.Models.ServerFleet import fault_counts_of
+from Services.ServerMonitorServices.StatusHistoryService import StatusHistory
+from Services.DataCacheServices.GroupingArtifactStoreService import GroupingArtifactStore
+from Services.GarbageCollectionServices.GcPolicyService import GcPolicy
+from Services.MetricsServices.MetricsHttpServerService import MetricsHttpServer
+from Services.MetricsServices.SimulationMetricsService import SimulationMetrics
+from Services.SimulationEngineServices.DiscreteEventEngineService import EventScheduler
+from Services.FaultLogServices.FaultLogService import save_fault_log
 
 class ServerMonitor:
-    def __init__(self, servers: List, update_interval: int = 5):
+    def __init__(self, servers: List, update_interval: int = 5, history_capacity: Optional[int] = None,
+                 downsample_factor: int = 10, live_view: bool = False,
+                 metrics: Optional[SimulationMetrics] = None, coarse_history_capacity: Optional[int] = None):
         self.servers = servers
         self.update_interval = update_interval
+        self._metrics = metrics
+        self._renderer = ServerStatusRenderer(servers) if live_view else None
         self._stop_event = Event()
+        self._wake_condition = Condition()
+        self._faults_pending = False
         self._monitor_thread = None
         self._start_time = None
         self._total_uptime = 0
-        self._status_history = []
+        # Capacities left as None are sized from the fleet so the history stays within a fixed memory budget
+        self._status_history = StatusHistory(len(servers), history_capacity, downsample_factor,
+                                             coarse_history_capacity)
+
+    @property
+    def status_history(self) -> StatusHistory:
+        return self._status_history
+
+    def server_fault_series(self, server_index: int):
+        """
+        Returns (timestamps, fault counts) of one server's recent snapshots as views.
+        """
+        return self._status_history.timestamps(), self._status_history.series(server_index)
+
+    def notify_fault(self):
+        """
+        Wakes the monitor thread so the new fault is recorded in the status history
+        without waiting for the next periodic update.
+        """
+        with self._wake_condition:
+            self._faults_pending = True
+            self._wake_condition.notify()
 
     def start_monitoring(self):
         if self._monitor_thread is None or not self._monitor_thread.is_alive():
@@ -28,13 +67,22 @@ class ServerMonitor:
             print("\n🔄 Server monitoring started...")
             print(f"ℹ️ Monitoring {len(self.servers)} servers with {self.update_interval}s interval")
 
-    def stop_monitoring(self):
+    def stop_monitoring(self, uptime_seconds: Optional[float] = None):
+        """
+        Stops the monitor thread and prints the summary. Virtual-clock runs pass the
+        simulated duration as uptime_seconds so fault rates are in simulated time.
+        """
         print("\n⏹️ Stopping server monitoring...")
         self._stop_event.set()
+        with self._wake_condition:
+            self._wake_condition.notify()
         if self._monitor_thread and self._monitor_thread.is_alive():
             self._monitor_thread.join(timeout=5)
 
-        if self._start_time:
+        if uptime_seconds is not None:
+            self._total_uptime = uptime_seconds
+            print(f"Total monitoring time: {self._total_uptime:.1f} simulated seconds")
+        elif self._start_time:
             self._total_uptime = (datetime.now() - self._start_time).total_seconds()
             print(f"Total monitoring time: {self._total_uptime:.1f} seconds")
 
@@ -45,50 +93,73 @@ class ServerMonitor:
     def _print_monitoring_summary(self):
         print("\n📊 Monitoring Summary:")
         for server in self.servers:
-            fault_count = len(server.lista_otkaza)
+            fault_count = server.broj_otkaza
             print(f"\nServer: {server.naziv} (ID: {server.id_servera})")
             print(f"Total faults: {fault_count}")
             if self._total_uptime > 0:
                 faults_per_hour = (fault_count * 3600) / self._total_uptime
                 print(f"Fault rate: {faults_per_hour:.2f} faults/hour")
 
+    def record_status(self, timestamp: Optional[datetime] = None, show: bool = True):
+        """
+        Takes a snapshot of the servers' fault counts, optionally printing the status.
+        """
+        started = time.perf_counter()
+        timestamp = timestamp or datetime.now()
+        self._status_history.append(timestamp.timestamp(), fault_counts_of(self.servers))
+
+        if show and self._renderer is not None:
+            # Redraw the cells that changed since the last update
+            self._renderer.render()
+        elif show:
+            # Print current status
+            print("\n📡 Server Status Update:")
+            show_servers_status(self.servers)
+
+        if self._metrics is not None:
+            self._metrics.monitor_tick_seconds.observe(time.perf_counter() - started)
+
     def _monitor_loop(self):
-        last_check = time.time()
+        next_update = time.monotonic() + self.update_interval
         while not self._stop_event.is_set():
             try:
-                current_time = time.time()
-                if current_time - last_check >= self.update_interval:
-                    status = {
-                        'timestamp': datetime.now(),
-                        'server_states': [
-                            {
-                                'id': server.id_servera,
-                                'name': server.naziv,
-                                'faults': len(server.lista_otkaza)
-                            }
-                            for server in self.servers
-                        ]
-                    }
-                    self._status_history.append(status)
-
-                    # Print current status
-                    print("\n📡 Server Status Update:")
-                    show_servers_status(self.servers)
-                    last_check = current_time
-
-                # Small sleep to prevent CPU hogging
-                time.sleep(0.1)
+                # Block until the next update is due, a fault arrives or monitoring stops
+                with self._wake_condition:
+                    self._wake_condition.wait_for(
+                        lambda: self._faults_pending or self._stop_event.is_set(),
+                        timeout=max(next_update - time.monotonic(), 0)
+                    )
+                    faults_pending = self._faults_pending
+                    self._faults_pending = False
+
+                if self._stop_event.is_set():
+                    break
+
+                current_time = time.monotonic()
+                if current_time >= next_update:
+                    self.record_status()
+                    next_update = current_time + self.update_interval
+                elif faults_pending:
+                    # Snapshot the new fault without printing between periodic updates
+                    self.record_status(show=False)
 
             except Exception as e:
                 print(f"❌ Error in monitor loop: {str(e)}")
                 break
-            finally:
-                gc.collect()
 
 
 class SimulationManager:
-    def __init__(self, simulation_interval: int = 3):
+    def __init__(self, simulation_interval: int = 3, artifact_store: Optional[GroupingArtifactStore] = None,
+                 seed: Optional[int] = None, gc_policy: Optional[GcPolicy] = None,
+                 metrics_port: Optional[int] = None, metrics_json_path: Optional[str] = None):
         self.simulation_interval = simulation_interval
+        self.artifact_store = artifact_store
+        self.seed = seed
+        self.gc_policy = gc_policy or GcPolicy()
+        self.metrics_port = metrics_port
+        self.metrics_json_path = metrics_json_path
+        self.metrics = None
+        self._metrics_server = None
         self._stop_event = Event()
         self._simulator = None
         self._monitor = None
@@ -103,12 +174,16 @@ class SimulationManager:
         """
         try:
             print("\n🚀 Starting simulation...")
-            self._simulator = FaultSimulator()
-            self._monitor = ServerMonitor(servers_cluster)
+            self.gc_policy.install()
+            self._start_metrics(servers_cluster)
+            self._simulator = self._create_simulator()
+            self._monitor = ServerMonitor(servers_cluster, metrics=self.metrics)
 
             # Initial grouping of comments
             print("\n⏳ Processing comment data...")
             grouped_comments = self._simulator.group_similar_comments(comments_data)
+            self._simulator.build_candidate_index(comments_data)
+            self._simulator.build_lookup_indexes(users_data, comments_data, posts_data)
             print("✅ Comment processing complete")
 
             # Start monitoring
@@ -123,8 +198,8 @@ class SimulationManager:
                     servers_cluster,
                     grouped_comments
                 )
-                time.sleep(self.simulation_interval)
-                gc.collect()
+                self._monitor.notify_fault()
+                self._stop_event.wait(self.simulation_interval)
 
         except KeyboardInterrupt:
             print("\n⚠️ Received shutdown signal...")
@@ -138,16 +213,181 @@ class SimulationManager:
         self._stop_event.set()
         self._cleanup()
 
-    def _cleanup(self):
+    def run_virtual_simulation(self,
+                               users_data: pd.DataFrame,
+                               posts_data: pd.DataFrame,
+                               comments_data: pd.DataFrame,
+                               servers_cluster: List,
+                               duration: float,
+                               fault_interval: float = 7.0,
+                               monitor_interval: float = 5.0,
+                               resolution_delay: float = 0.0,
+                               poisson_arrivals: bool = True,
+                               realtime: bool = False,
+                               speed: float = 1.0,
+                               verbose: bool = False,
+                               faults_per_tick: int = 1,
+                               fault_log_path: Optional[str] = None) -> dict:
+        """
+        Discrete-event simulation runner on a virtual clock.
+
+        Fault arrivals, fault resolutions and monitor snapshots are scheduled events that
+        run as fast as the CPU allows, or paced at speed times real time with realtime=True.
+
+        Args:
+            duration (float): Simulated time to run for, in seconds.
+            fault_interval (float): Mean simulated seconds between faults.
+            monitor_interval (float): Simulated seconds between monitor snapshots.
+            resolution_delay (float): Simulated seconds between a fault and its resolution.
+            poisson_arrivals (bool): Exponential inter-arrival times instead of a fixed interval.
+            realtime (bool): Pace the run against the wall clock.
+            speed (float): Virtual seconds per wall-clock second when paced.
+            verbose (bool): Print every fault and monitor snapshot.
+            faults_per_tick (int): Faults handled per arrival event. Above 1, each arrival is
+                                   handled as one vectorized batch and resolved immediately.
+            fault_log_path (str, optional): Saves every handled fault to this file for replay.
+                                            Requires faults_per_tick above 1.
+
+        Returns:
+            dict: Run statistics (simulated and wall seconds, events, faults and resolution outcomes).
+        """
+        # A zero interval would reschedule its event at the same virtual time forever
+        if fault_interval <= 0:
+            raise ValueError("fault_interval must be positive")
+        if monitor_interval <= 0:
+            raise ValueError("monitor_interval must be positive")
+        if speed <= 0:
+            raise ValueError("speed must be positive")
+        if fault_log_path is not None and faults_per_tick <= 1:
+            raise ValueError("A fault log requires faults_per_tick above 1")
+
+        scheduler = EventScheduler(realtime=realtime, speed=speed)
+        fault_log = []
+        stats = {
+            'simulated_seconds': 0.0,
+            'wall_seconds': 0.0,
+            'events': 0,
+            'faults': 0,
+            FAULT_RESOLVED: 0,
+            FAULT_PARTIALLY_RESOLVED: 0,
+            FAULT_UNRESOLVED: 0
+        }
+
+        try:
+            print("\n🚀 Starting virtual-clock simulation...")
+            self.gc_policy.install()
+            self._start_metrics(servers_cluster, clock=lambda: scheduler.now)
+            self._simulator = self._create_simulator(verbose=verbose)
+            self._monitor = ServerMonitor(servers_cluster, monitor_interval, metrics=self.metrics)
+
+            # Initial grouping of comments
+            print("\n⏳ Processing comment data...")
+            self._simulator.group_similar_comments(comments_data)
+            self._simulator.build_candidate_index(comments_data)
+            self._simulator.build_lookup_indexes(users_data, comments_data, posts_data)
+            print("✅ Comment processing complete")
+
+            simulator = self._simulator
+            monitor = self._monitor
+            arrival_rng = np.random.default_rng(self.seed)
+            start_time = datetime.now()
+
+            def next_arrival_delay():
+                return arrival_rng.exponential(fault_interval) if poisson_arrivals else fault_interval
+
+            def on_fault_arrival():
+                if faults_per_tick > 1:
+                    results = simulator.handle_faults(users_data, comments_data, posts_data, servers_cluster,
+                                                      n_faults=faults_per_tick)
+                    # Like detect_fault, faults on posts without a valid id are not counted
+                    valid = results['post_id'] >= 0
+                    outcomes = np.bincount(results['status'][valid], minlength=3)
+                    if fault_log_path is not None:
+                        fault_log.append(results)
+                    stats['faults'] += int(valid.sum())
+                    stats[FAULT_UNRESOLVED] += int(outcomes[STATUS_UNRESOLVED])
+                    stats[FAULT_PARTIALLY_RESOLVED] += int(outcomes[STATUS_PARTIALLY_RESOLVED])
+                    stats[FAULT_RESOLVED] += int(outcomes[STATUS_RESOLVED])
+                else:
+                    detected = simulator.detect_fault(posts_data, servers_cluster)
+                    if detected is not None:
+                        stats['faults'] += 1
+                        scheduler.schedule(resolution_delay, on_fault_resolution, detected[0])
+                scheduler.schedule(next_arrival_delay(), on_fault_arrival)
+
+            def on_fault_resolution(fault_id):
+                stats[simulator.resolve_fault(fault_id, users_data, comments_data, posts_data)] += 1
+
+            def on_monitor_snapshot():
+                monitor.record_status(start_time + timedelta(seconds=scheduler.now), show=verbose)
+                scheduler.schedule(monitor_interval, on_monitor_snapshot)
+
+            scheduler.schedule(next_arrival_delay(), on_fault_arrival)
+            scheduler.schedule(monitor_interval, on_monitor_snapshot)
+
+            print(f"\n▶️ Simulating {duration:,.0f} seconds of faults...")
+            wall_start = time.perf_counter()
+            stats['events'] = scheduler.run(until=duration, stop_event=self._stop_event)
+            stats['wall_seconds'] = time.perf_counter() - wall_start
+            stats['simulated_seconds'] = scheduler.now
+
+            print(f"\n🏁 Simulated {stats['simulated_seconds']:,.0f}s in {stats['wall_seconds']:.1f}s "
+                  f"({stats['events'] / max(stats['wall_seconds'], 1e-9):,.0f} events/s)")
+            print(f"Faults: {stats['faults']}, resolved: {stats[FAULT_RESOLVED]}, "
+                  f"partially resolved: {stats[FAULT_PARTIALLY_RESOLVED]}, unresolved: {stats[FAULT_UNRESOLVED]}")
+
+            if fault_log_path is not None:
+                save_fault_log(fault_log_path, fault_log, servers_cluster)
+
+        except KeyboardInterrupt:
+            print("\n⚠️ Received shutdown signal...")
+        except Exception as e:
+            print(f"\n❌ Simulation error: {str(e)}")
+        finally:
+            self._cleanup(uptime_seconds=scheduler.now)
+
+        return stats
+
+    def _create_simulator(self, **options):
+        # The simulator pulls in scikit-learn and SciPy, so it is only imported once a simulation starts
+        from Services.ServerWorkSimulationWithFaultsServices.ServerWorkSimulationWithFaultsService import (
+            FaultSimulator)
+        return FaultSimulator(self.artifact_store, seed=self.seed, gc_policy=self.gc_policy, metrics=self.metrics,
+                              **options)
+
+    def _start_metrics(self, servers_cluster: List, clock=None):
+        self.metrics = SimulationMetrics(servers_cluster, clock=clock)
+        if self.metrics_port is not None:
+            self._metrics_server = MetricsHttpServer(self.metrics.registry, self.metrics_port)
+            try:
+                self._metrics_server.start()
+            except OSError as e:
+                # A busy port only costs the metrics endpoint, not the simulation
+                print(f"⚠️ Could not serve metrics on port {self.metrics_port}: {e}")
+                self._metrics_server = None
+
+    def _cleanup(self, uptime_seconds: Optional[float] = None):
         if self._monitor:
-            self._monitor.stop_monitoring()
+            self._monitor.stop_monitoring(uptime_seconds)
             self._monitor = None
 
+        if self.metrics is not None:
+            self.metrics.print_latency_summary()
+            if self.metrics_json_path:
+                self.metrics.registry.dump_json(self.metrics_json_path)
+                print(f"📈 Metrics written to {self.metrics_json_path}")
+            self.metrics = None
+        if self._metrics_server is not None:
+            self._metrics_server.stop()
+            self._metrics_server = None
+
         if self._simulator:
             self._simulator.cleanup()
             self._simulator = None
 
+        self.gc_policy.uninstall()
         gc.collect()
+        self.gc_policy.print_report()
         print("\n✅ Simulation cleanup complete")
 
 
@@ -155,9 +395,34 @@ def run_simulation(users_data: pd.DataFrame,
                    posts_data: pd.DataFrame,
                    comments_data: pd.DataFrame,
                    servers_cluster: List,
-                   simulation_interval: int = 7) -> None:
+                   simulation_interval: int = 7,
+                   artifact_store: Optional[GroupingArtifactStore] = None,
+                   seed: Optional[int] = None,
+                   gc_policy: Optional[GcPolicy] = None,
+                   metrics_port: Optional[int] = None,
+                   metrics_json_path: Optional[str] = None) -> None:
     """
     Wrapper function.
     """
-    manager = SimulationManager(simulation_interval)
-    manager.run_simulation(users_data, posts_data, comments_data, servers_cluster)
\ No newline at end of file
+    manager = SimulationManager(simulation_interval, artifact_store, seed, gc_policy, metrics_port, metrics_json_path)
+    manager.run_simulation(users_data, posts_data, comments_data, servers_cluster)
+
+
+def run_virtual_simulation(users_data: pd.DataFrame,
+                           posts_data: pd.DataFrame,
+                           comments_data: pd.DataFrame,
+                           servers_cluster: List,
+                           duration: float,
+                           artifact_store: Optional[GroupingArtifactStore] = None,
+                           seed: Optional[int] = None,
+                           gc_policy: Optional[GcPolicy] = None,
+                           metrics_port: Optional[int] = None,
+                           metrics_json_path: Optional[str] = None,
+                           **engine_options) -> dict:
+    """
+    Wrapper function for the virtual-clock simulation.
+    """
+    manager = SimulationManager(artifact_store=artifact_store, seed=seed, gc_policy=gc_policy,
+                                metrics_port=metrics_port, metrics_json_path=metrics_json_path)
+    return manager.run_virtual_simulation(users_data, posts_data, comments_data, servers_cluster,
+                                          duration, **engine_options)
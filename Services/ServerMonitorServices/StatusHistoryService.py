@@ -0,0 +1,133 @@
+from typing import Optional
+
+import numpy as np
+
+# Bytes both rings of a StatusHistory may use together when their capacities are not given
+DEFAULT_HISTORY_BUDGET_BYTES = 64 * 2 ** 20
+MAX_DEFAULT_CAPACITY = 1024
+
+
+class _RingBuffer:
+    """
+    Fixed-capacity ring of (timestamp, per-server fault counts) rows.
+
+    Every row is written twice, at its slot and at slot + capacity, so the retained rows
+    are always one contiguous block and can be returned as views without copying.
+    """
+    def __init__(self, capacity: int, n_servers: int):
+        if capacity < 1:
+            raise ValueError("Capacity must be at least 1")
+
+        self.capacity = capacity
+        self.size = 0
+        self._next_slot = 0
+        self._timestamps = np.zeros(2 * capacity, dtype=np.float64)
+        self._counts = np.zeros((2 * capacity, n_servers), dtype=np.int64)
+
+    def append(self, timestamp: float, fault_counts):
+        """
+        Writes a row and returns the evicted (timestamp, counts) row, or None while not full.
+        """
+        slot = self._next_slot
+        evicted = None
+        if self.size == self.capacity:
+            evicted = (self._timestamps[slot], self._counts[slot].copy())
+
+        self._timestamps[slot] = self._timestamps[slot + self.capacity] = timestamp
+        self._counts[slot] = self._counts[slot + self.capacity] = fault_counts
+
+        self._next_slot = (slot + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+        return evicted
+
+    def _window(self) -> slice:
+        end = (self._next_slot - 1) % self.capacity + 1 + self.capacity
+        return slice(end - self.size, end)
+
+    def timestamps(self) -> np.ndarray:
+        return self._timestamps[self._window()]
+
+    def counts(self) -> np.ndarray:
+        return self._counts[self._window()]
+
+
+def ring_capacity_for_budget(n_servers: int, budget_bytes: int) -> int:
+    """
+    Returns the largest ring capacity, at most MAX_DEFAULT_CAPACITY, whose doubled
+    timestamp and count rows fit in budget_bytes, and at least 1.
+    """
+    row_bytes = 2 * (np.dtype(np.float64).itemsize + max(n_servers, 1) * np.dtype(np.int64).itemsize)
+    return int(min(MAX_DEFAULT_CAPACITY, max(1, budget_bytes // row_bytes)))
+
+
+class StatusHistory:
+    """
+    Bounded history of server fault counts.
+
+    Recent snapshots are kept at full resolution in a fixed-capacity ring buffer. Snapshots
+    evicted from it are downsampled into a coarser ring that keeps one snapshot out of every
+    downsample_factor, so memory stays constant however long the monitor runs. Queries
+    return read-only views in chronological order without copying.
+
+    Capacities left as None split budget_bytes evenly between the two rings, so large
+    fleets keep fewer snapshots instead of allocating gigabytes (up to 1024 per ring).
+    """
+    def __init__(self, n_servers: int, capacity: Optional[int] = None, downsample_factor: int = 10,
+                 coarse_capacity: Optional[int] = None, budget_bytes: int = DEFAULT_HISTORY_BUDGET_BYTES):
+        if downsample_factor < 1:
+            raise ValueError("Downsample factor must be at least 1")
+
+        if capacity is None:
+            capacity = ring_capacity_for_budget(n_servers, budget_bytes // 2)
+        if coarse_capacity is None:
+            coarse_capacity = ring_capacity_for_budget(n_servers, budget_bytes // 2)
+
+        self.n_servers = n_servers
+        self.downsample_factor = downsample_factor
+        self._recent = _RingBuffer(capacity, n_servers)
+        self._coarse = _RingBuffer(coarse_capacity, n_servers)
+        self._evicted = 0
+
+    def __len__(self):
+        return self._recent.size
+
+    def append(self, timestamp: float, fault_counts) -> None:
+        """
+        Records the fault counts of every server at a timestamp in epoch seconds.
+        """
+        evicted = self._recent.append(timestamp, fault_counts)
+        if evicted is not None:
+            self._evicted += 1
+            # Counts are cumulative, so the last snapshot of a bucket represents it
+            if self._evicted % self.downsample_factor == 0:
+                self._coarse.append(*evicted)
+
+    @staticmethod
+    def _read_only(array: np.ndarray) -> np.ndarray:
+        view = array.view()
+        view.flags.writeable = False
+        return view
+
+    def timestamps(self) -> np.ndarray:
+        return self._read_only(self._recent.timestamps())
+
+    def counts(self) -> np.ndarray:
+        """
+        Returns the recent snapshots as a (snapshots, servers) view.
+        """
+        return self._read_only(self._recent.counts())
+
+    def series(self, server_index: int) -> np.ndarray:
+        """
+        Returns the recent fault counts of one server as a strided view.
+        """
+        return self._read_only(self._recent.counts()[:, server_index])
+
+    def coarse_timestamps(self) -> np.ndarray:
+        return self._read_only(self._coarse.timestamps())
+
+    def coarse_counts(self) -> np.ndarray:
+        return self._read_only(self._coarse.counts())
+
+    def coarse_series(self, server_index: int) -> np.ndarray:
+        return self._read_only(self._coarse.counts()[:, server_index])
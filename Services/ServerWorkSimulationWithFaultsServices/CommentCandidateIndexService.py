@@ -0,0 +1,110 @@
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+
+class CommentCandidateIndex:
+    """
+    Post to comments adjacency with a ranked top-k candidate list per post.
+
+    Comments are sorted by PostId and stored in CSR form: the candidates of the i-th post
+    in post_ids are candidate_ids[offsets[i]:offsets[i + 1]], best first. Resolving a post
+    is a binary search over the post ids plus an O(k) slice, independent of the total
+    number of comments.
+    """
+    def __init__(self, post_ids, comment_ids, ranking_scores, tie_break_scores=None, top_k: int = 5):
+        if top_k < 1:
+            raise ValueError("top_k must be at least 1")
+
+        post_ids = np.asarray(post_ids, dtype=np.int64)
+        comment_ids = np.asarray(comment_ids, dtype=np.int64)
+        ranking_scores = np.asarray(ranking_scores, dtype=np.float64)
+        if tie_break_scores is None:
+            tie_break_scores = np.zeros(len(comment_ids))
+        tie_break_scores = np.asarray(tie_break_scores, dtype=np.float64)
+
+        # Sort by post, then best ranking score, then best tie-break score, then lowest comment id
+        order = np.lexsort((comment_ids, -tie_break_scores, -ranking_scores, post_ids))
+        sorted_post_ids = post_ids[order]
+
+        self.post_ids, group_starts, group_sizes = np.unique(
+            sorted_post_ids, return_index=True, return_counts=True
+        )
+
+        # Keep the first top_k comments of every post
+        rank_in_post = np.arange(len(order)) - np.repeat(group_starts, group_sizes)
+        kept = rank_in_post < top_k
+        self.candidate_ids = comment_ids[order][kept]
+        self.offsets = np.zeros(len(self.post_ids) + 1, dtype=np.int64)
+        np.cumsum(np.minimum(group_sizes, top_k), out=self.offsets[1:])
+
+        self.comment_ids = comment_ids
+        self.top_k = top_k
+
+    @classmethod
+    def from_comments(cls, comments: pd.DataFrame, ensemble_scores=None, top_k: int = 5):
+        """
+        Builds the index from a comments frame.
+
+        Args:
+            comments (pd.DataFrame): Comments with 'Id', 'PostId' and 'Score' columns.
+            ensemble_scores (np.ndarray, optional): Per-comment ensemble score, aligned with the rows
+                                                    of comments. Comment 'Score' breaks ties.
+            top_k (int): Number of candidates kept per post.
+
+        Returns:
+            CommentCandidateIndex: The built index.
+        """
+        post_ids = pd.to_numeric(comments['PostId'], errors='coerce').fillna(-1).to_numpy(dtype=np.int64)
+        comment_ids = pd.to_numeric(comments['Id'], errors='coerce').fillna(-1).to_numpy(dtype=np.int64)
+        scores = pd.to_numeric(comments['Score'], errors='coerce').fillna(0).to_numpy(dtype=np.float64)
+        if ensemble_scores is None:
+            ensemble_scores = np.zeros(len(comments))
+
+        return cls(post_ids, comment_ids, ensemble_scores, scores, top_k)
+
+    @classmethod
+    def from_arrays(cls, post_ids, candidate_ids, offsets, comment_ids, top_k: int):
+        """
+        Wraps the arrays of an already built index without copying or re-sorting them,
+        e.g. arrays memory-mapped by a worker process.
+        """
+        index = cls.__new__(cls)
+        index.post_ids = post_ids
+        index.candidate_ids = candidate_ids
+        index.offsets = offsets
+        index.comment_ids = comment_ids
+        index.top_k = int(top_k)
+        return index
+
+    def __len__(self):
+        return len(self.post_ids)
+
+    def candidates_for(self, post_id: int) -> np.ndarray:
+        """
+        Returns the ranked candidate comment ids of a post, empty when the post has no comments.
+        """
+        position = np.searchsorted(self.post_ids, post_id)
+        if position == len(self.post_ids) or self.post_ids[position] != post_id:
+            return self.candidate_ids[:0]
+        return self.candidate_ids[self.offsets[position]:self.offsets[position + 1]]
+
+    def best_for(self, post_id: int) -> Optional[int]:
+        """
+        Returns the best ranked comment id of a post, or None when the post has no comments.
+        """
+        candidates = self.candidates_for(post_id)
+        return int(candidates[0]) if len(candidates) else None
+
+    def best_for_many(self, post_ids) -> np.ndarray:
+        """
+        Returns the best ranked comment id of many posts at once, -1 for posts without comments.
+        """
+        post_ids = np.asarray(post_ids, dtype=np.int64)
+        if len(self.post_ids) == 0:
+            return np.full(len(post_ids), -1, dtype=np.int64)
+
+        positions = np.minimum(np.searchsorted(self.post_ids, post_ids), len(self.post_ids) - 1)
+        found = self.post_ids[positions] == post_ids
+        return np.where(found, self.candidate_ids[self.offsets[positions]], -1)
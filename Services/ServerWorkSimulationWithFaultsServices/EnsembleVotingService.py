@@ -0,0 +1,59 @@
+import numpy as np
+
+
+def hard_majority_vote(predictions: np.ndarray) -> np.ndarray:
+    """
+    Picks the label predicted by most models for every row in a single vectorized pass.
+
+    Ties are broken in favour of the lowest label, the same result as
+    np.bincount(row).argmax() applied row by row.
+
+    Args:
+        predictions (np.ndarray): Integer matrix of shape (n_rows, n_models) with each model's labels.
+
+    Returns:
+        np.ndarray: The winning label of every row.
+    """
+    predictions = np.asarray(predictions)
+    if predictions.ndim != 2:
+        raise ValueError("Predictions must be a 2D array of shape (n_rows, n_models)")
+    if predictions.shape[1] == 0:
+        raise ValueError("Predictions must contain at least one model")
+
+    # votes[i, j] is the number of models agreeing with model j on row i
+    votes = np.zeros(predictions.shape, dtype=np.int32)
+    for model_index in range(predictions.shape[1]):
+        votes += predictions == predictions[:, model_index:model_index + 1]
+
+    # Among the labels with the most votes keep the lowest one
+    most_votes = votes.max(axis=1, keepdims=True)
+    no_candidate = np.iinfo(predictions.dtype).max if np.issubdtype(predictions.dtype, np.integer) else np.inf
+    candidates = np.where(votes == most_votes, predictions, no_candidate)
+    return candidates.min(axis=1).astype(predictions.dtype, copy=False)
+
+
+def soft_vote(probabilities: list, model_classes: list) -> np.ndarray:
+    """
+    Picks the label with the highest probability averaged over all models.
+
+    Models may have been trained on different subsets of the labels; their probability
+    columns are aligned on the union of all labels. Ties go to the lowest label.
+
+    Args:
+        probabilities (list): One (n_rows, n_model_classes) predict_proba matrix per model.
+        model_classes (list): The classes_ array matching each probability matrix.
+
+    Returns:
+        np.ndarray: The winning label of every row.
+    """
+    if not probabilities:
+        raise ValueError("At least one probability matrix is required")
+
+    all_classes = np.unique(np.concatenate([np.asarray(classes) for classes in model_classes]))
+    averaged = np.zeros((probabilities[0].shape[0], len(all_classes)))
+    for model_probabilities, classes in zip(probabilities, model_classes):
+        averaged[:, np.searchsorted(all_classes, classes)] += model_probabilities
+    averaged /= len(probabilities)
+
+    # argmax returns the first maximum, i.e. the lowest label on ties
+    return all_classes[np.argmax(averaged, axis=1)]
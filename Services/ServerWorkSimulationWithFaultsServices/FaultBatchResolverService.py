@@ -0,0 +1,131 @@
+from typing import List
+
+import numpy as np
+
+from Domain.Constants.FaultResults import (FAULT_RESULT_DTYPE, STATUS_PARTIALLY_RESOLVED, STATUS_RESOLVED,
+                                           STATUS_UNRESOLVED)
+from Domain.Models.ServerFleet import ServerFleet
+from Services.ServerWorkSimulationWithFaultsServices.CommentCandidateIndexService import CommentCandidateIndex
+from Services.ServerWorkSimulationWithFaultsServices.IdIndexService import IdIndex
+
+
+class FaultBatchResolver:
+    """
+    Resolves batches of faults with NumPy operations on the candidate and lookup indexes.
+
+    It only holds plain arrays, never the DataFrames or the trained models, so worker
+    processes can rebuild it from memory-mapped arrays (see to_arrays and from_arrays)
+    and resolve faults exactly like FaultSimulator.handle_faults.
+    """
+    def __init__(self, post_id_values: np.ndarray, candidate_index: CommentCandidateIndex,
+                 comment_index: IdIndex, user_index: IdIndex, comment_user_ids: np.ndarray):
+        self.post_id_values = post_id_values
+        self.candidate_index = candidate_index
+        self.comment_index = comment_index
+        self.user_index = user_index
+        self.comment_user_ids = comment_user_ids
+
+    @property
+    def n_posts(self) -> int:
+        return len(self.post_id_values)
+
+    def to_arrays(self) -> dict:
+        """
+        Returns every array the resolver is made of, by name.
+        """
+        comment_keys, comment_rows = self.comment_index.to_arrays()
+        user_keys, user_rows = self.user_index.to_arrays()
+        return {
+            'post_id_values': self.post_id_values,
+            'candidate_post_ids': self.candidate_index.post_ids,
+            'candidate_ids': self.candidate_index.candidate_ids,
+            'candidate_offsets': self.candidate_index.offsets,
+            'candidate_comment_ids': self.candidate_index.comment_ids,
+            'candidate_top_k': np.array(self.candidate_index.top_k),
+            'comment_keys': comment_keys,
+            'comment_rows': comment_rows,
+            'user_keys': user_keys,
+            'user_rows': user_rows,
+            'comment_user_ids': self.comment_user_ids
+        }
+
+    @classmethod
+    def from_arrays(cls, arrays: dict):
+        """
+        Rebuilds a resolver from the arrays returned by to_arrays, without copying them.
+        """
+        candidate_index = CommentCandidateIndex.from_arrays(
+            arrays['candidate_post_ids'], arrays['candidate_ids'], arrays['candidate_offsets'],
+            arrays['candidate_comment_ids'], int(arrays['candidate_top_k'])
+        )
+        return cls(
+            arrays['post_id_values'],
+            candidate_index,
+            IdIndex.from_arrays(arrays['comment_keys'], arrays['comment_rows']),
+            IdIndex.from_arrays(arrays['user_keys'], arrays['user_rows']),
+            arrays['comment_user_ids']
+        )
+
+    def resolve(self, post_rows, server_indices, rng: np.random.Generator) -> np.ndarray:
+        """
+        Resolves a batch of faults, given as the rows of the faulty posts and the indices of the faulty servers.
+
+        Returns:
+            np.ndarray: Structured array of FAULT_RESULT_DTYPE with one entry per fault.
+        """
+        post_rows = np.asarray(post_rows, dtype=np.int64)
+        server_indices = np.asarray(server_indices, dtype=np.int64)
+
+        results = np.empty(len(post_rows), dtype=FAULT_RESULT_DTYPE)
+        results['post_id'] = self.post_id_values[post_rows]
+        results['server_index'] = server_indices
+        valid = results['post_id'] >= 0
+
+        # Best candidate per post, falling back to a random comment for posts without comments
+        comment_ids = self.candidate_index.best_for_many(results['post_id'])
+        missing = comment_ids < 0
+        if missing.any() and len(self.candidate_index.comment_ids) > 0:
+            random_rows = rng.integers(0, len(self.candidate_index.comment_ids), int(missing.sum()))
+            comment_ids[missing] = self.candidate_index.comment_ids[random_rows]
+        results['comment_id'] = comment_ids
+
+        # Comment and author lookups
+        comment_rows = self.comment_index.lookup_many(comment_ids)
+        found_comments = comment_rows >= 0
+        user_ids = np.where(found_comments, self.comment_user_ids[np.maximum(comment_rows, 0)], -1)
+        user_rows = np.where(user_ids >= 0, self.user_index.lookup_many(user_ids), -1)
+        results['user_row'] = user_rows
+
+        results['status'] = np.where(
+            comment_ids < 0, STATUS_UNRESOLVED,
+            np.where(user_rows >= 0, STATUS_RESOLVED, STATUS_PARTIALLY_RESOLVED)
+        )
+        results['status'][~valid] = STATUS_UNRESOLVED
+
+        return results
+
+
+def add_faults_to_servers(servers: List, results: np.ndarray) -> np.ndarray:
+    """
+    Records the faults of a batch with a valid post on their servers, grouped per server.
+
+    Returns:
+        np.ndarray: Number of faults recorded per server.
+    """
+    valid = results['post_id'] >= 0
+    valid_servers = results['server_index'][valid]
+    valid_fault_ids = results['post_id'][valid]
+
+    per_server = np.bincount(valid_servers, minlength=len(servers))
+    if isinstance(servers, ServerFleet):
+        servers.add_faults(valid_servers, valid_fault_ids)
+    else:
+        order = np.argsort(valid_servers, kind='stable')
+        grouped_fault_ids = np.split(valid_fault_ids[order], np.cumsum(per_server)[:-1])
+        # Through dodaj_otkaz, since lista_otkaza is a copy for the views of a fleet
+        for server_index in np.flatnonzero(per_server):
+            server = servers[server_index]
+            for fault_id in grouped_fault_ids[server_index].tolist():
+                server.dodaj_otkaz(fault_id)
+
+    return per_server
@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+
+
+class IdIndex:
+    """
+    Maps integer ids to row positions of a DataFrame column.
+
+    The ids are kept in a sorted int64 array, so a lookup is a binary search instead of
+    a boolean scan over the whole frame. Missing ids are ignored and duplicated ids
+    resolve to their first row, like frame[frame[column] == id].iloc[0].
+    """
+    def __init__(self, ids):
+        values = pd.to_numeric(pd.Series(ids).reset_index(drop=True), errors='coerce')
+        valid = values.notna().to_numpy()
+        keys = values[valid].to_numpy(dtype=np.int64)
+        rows = np.flatnonzero(valid)
+
+        order = np.argsort(keys, kind='stable')
+        self._keys, first = np.unique(keys[order], return_index=True)
+        self._rows = rows[order][first]
+
+    @classmethod
+    def from_arrays(cls, keys, rows):
+        """
+        Wraps the sorted keys and row positions of another index (see to_arrays) without copying them,
+        e.g. arrays memory-mapped by a worker process.
+        """
+        index = cls.__new__(cls)
+        index._keys = keys
+        index._rows = rows
+        return index
+
+    def to_arrays(self):
+        """
+        Returns the (sorted keys, row positions) arrays the index is made of.
+        """
+        return self._keys, self._rows
+
+    def __len__(self):
+        return len(self._keys)
+
+    def lookup(self, key) -> int:
+        """
+        Returns the row position of the id, or -1 when the id is missing.
+        """
+        try:
+            key = int(key)
+        except (TypeError, ValueError):
+            return -1
+
+        position = np.searchsorted(self._keys, key)
+        if position < len(self._keys) and self._keys[position] == key:
+            return int(self._rows[position])
+        return -1
+
+    def lookup_many(self, keys) -> np.ndarray:
+        """
+        Returns the row positions of many ids at once, -1 for missing ids.
+        """
+        keys = np.asarray(keys, dtype=np.int64)
+        positions = np.minimum(np.searchsorted(self._keys, keys), max(len(self._keys) - 1, 0))
+        if len(self._keys) == 0:
+            return np.full(len(keys), -1, dtype=np.int64)
+        found = self._keys[positions] == keys
+        return np.where(found, self._rows[positions], -1)
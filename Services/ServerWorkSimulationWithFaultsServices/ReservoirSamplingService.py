@@ -0,0 +1,45 @@
+import numpy as np
+
+
+class ReservoirSampler:
+    """
+    Keeps a uniform random sample of bounded size from a stream of items (Algorithm R).
+
+    Items are added batch by batch with NumPy operations, so memory stays capped at
+    the reservoir capacity no matter how many items pass through.
+    """
+    def __init__(self, capacity: int, random_state=None):
+        if capacity < 1:
+            raise ValueError("Reservoir capacity must be at least 1")
+
+        self.capacity = capacity
+        self._items = np.empty(capacity, dtype=np.int64)
+        self._size = 0
+        self._seen = 0
+        self._rng = np.random.default_rng(random_state)
+
+    def __len__(self):
+        return self._size
+
+    def add(self, items) -> None:
+        items = np.asarray(items, dtype=np.int64)
+
+        # Fill the free slots first
+        free = min(self.capacity - self._size, len(items))
+        self._items[self._size:self._size + free] = items[:free]
+        self._size += free
+        self._seen += free
+
+        remaining = items[free:]
+        if len(remaining) == 0:
+            return
+
+        # The k-th item of the stream replaces a random slot with probability capacity / k
+        stream_positions = self._seen + np.arange(1, len(remaining) + 1)
+        slots = (self._rng.random(len(remaining)) * stream_positions).astype(np.int64)
+        accepted = slots < self.capacity
+        self._items[slots[accepted]] = remaining[accepted]
+        self._seen += len(remaining)
+
+    def sample(self) -> np.ndarray:
+        return self._items[:self._size].copy()
@@ -1,58 +1,139 @@
-import random
-from typing import List, Optional, Any
-from datetime import datetime
+import time
+from typing import List, Optional, Any, Tuple
 import numpy as np
 import pandas as pd
 from sklearn.linear_model import SGDClassifier, LogisticRegression
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.preprocessing import LabelEncoder
 from scipy.sparse import csr_matrix, hstack, vstack
-import weakref
 from threading import Event
 
+from Domain.Constants.FaultResults import (
+    FAULT_PARTIALLY_RESOLVED, FAULT_RESOLVED, FAULT_RESULT_DTYPE, FAULT_UNRESOLVED, STATUS_PARTIALLY_RESOLVED,
+    STATUS_RESOLVED, STATUS_UNRESOLVED)
 from Domain.Models.Comment import Comment
-from Services.FaultSimulationServices.FaultPickerService import pick_a_server_fault
+from Services.DataCacheServices.GroupingArtifactStoreService import GroupingArtifactStore
+from Services.FaultSimulationServices.FaultPickerService import FaultSource
+from Services.GarbageCollectionServices.GcPolicyService import GcPolicy
+from Services.MetricsServices.SimulationMetricsService import SimulationMetrics
+from Services.TracingServices.TracingService import traced
+from Services.ServerWorkSimulationWithFaultsServices.CommentCandidateIndexService import CommentCandidateIndex
+from Services.ServerWorkSimulationWithFaultsServices.FaultBatchResolverService import (FaultBatchResolver,
+                                                                                      add_faults_to_servers)
+from Services.ServerWorkSimulationWithFaultsServices.IdIndexService import IdIndex
+from Services.ServerWorkSimulationWithFaultsServices.EnsembleVotingService import hard_majority_vote, soft_vote
+from Services.ServerWorkSimulationWithFaultsServices.ReservoirSamplingService import ReservoirSampler
 import gc
 
+
 class SafeLabelEncoder(LabelEncoder):
+    """
+    LabelEncoder that assigns new codes to unseen labels instead of failing.
+
+    Labels are looked up through a hash index, so transform is linear in the number of
+    values. Unseen labels are appended after the known classes in sorted order, which keeps
+    the codes of previously seen labels stable. New labels go to a small overflow table that
+    is merged into the index once it grows, so incremental growth is amortized O(1) per label.
+    """
     def __init__(self):
         super().__init__()
         self.classes_ = np.array([])
 
+    @property
+    def classes_(self):
+        if self._classes_cache is None:
+            self._classes_cache = np.array(self._labels, dtype=str) if self._labels else np.array([])
+        return self._classes_cache
+
+    @classes_.setter
+    def classes_(self, classes):
+        self._labels = [str(label) for label in classes]
+        self._classes_cache = None
+        self._index = pd.Index(self._labels, dtype=object)
+        self._new_labels = {}
+
+    def __sklearn_is_fitted__(self):
+        return True
+
     def fit(self, y):
         # Convert values to strings for handling
-        y = y.astype(str)
+        y = np.asarray(y).astype(str)
         return super().fit(y)
 
+    def fit_transform(self, y):
+        return self.fit(y).transform(y)
+
     def transform(self, y):
         # Convert values to strings for handling
-        y = y.astype(str)
-
-        # Handle unseen labels by adding them to the encoder
-        unseen = np.setdiff1d(np.unique(y), self.classes_)
-        if len(unseen) > 0:
-            self.classes_ = np.concatenate([self.classes_, unseen])
-        return np.array([np.where(self.classes_ == item)[0][0] for item in y])
+        y = np.asarray(y).astype(str)
+
+        codes = self._index.get_indexer(y)
+        missing = codes < 0
+        if not missing.any():
+            return codes
+
+        # Resolve the labels missing from the index through the overflow table,
+        # assigning new codes to unseen labels in sorted order
+        missing_labels, inverse = np.unique(y[missing], return_inverse=True)
+        missing_codes = np.empty(len(missing_labels), dtype=np.intp)
+        for position, label in enumerate(missing_labels.tolist()):
+            code = self._new_labels.get(label)
+            if code is None:
+                code = len(self._labels)
+                self._labels.append(label)
+                self._new_labels[label] = code
+            missing_codes[position] = code
+        codes[missing] = missing_codes[inverse]
+        self._classes_cache = None
+
+        # Merge the overflow table into the index once it is a sizeable share of the classes
+        if len(self._new_labels) > max(1024, len(self._index) // 2):
+            self._index = pd.Index(self._labels, dtype=object)
+            self._new_labels = {}
+
+        return codes
 
 
 class FaultSimulator:
-    def __init__(self):
+    def __init__(self, artifact_store: Optional[GroupingArtifactStore] = None,
+                 fault_source: Optional[FaultSource] = None, seed: Optional[int] = None,
+                 verbose: bool = True, gc_policy: Optional[GcPolicy] = None,
+                 metrics: Optional[SimulationMetrics] = None):
+        self.verbose = verbose
+        self._gc_policy = gc_policy
+        self._metrics = metrics
         self._stop_event = Event()
+        self._artifact_store = artifact_store
+        self._fault_source = fault_source
+        # Only the default uniform source may be recreated when the posts or the cluster change size
+        self._default_fault_source = fault_source is None
         self._models = {}
         self._last_faulty_server = None
         self._fault_counts = {}
         self._total_faults = 0
         self._resolved_faults = 0
         self._label_encoders = {}
+        self._comment_scores = None
+        self._candidate_index = None
+        self._comment_index = None
+        self._user_index = None
+        self._post_index = None
+        self._post_id_values = None
+        self._indexed_posts = None
+        self._comment_user_ids = None
+        self._rng = np.random.default_rng(seed)
 
     def cleanup(self):
         self._stop_event.set()
-        for model_key in list(self._models.keys()):
-            model = self._models[model_key]()  # Actual object from weak ref
-            if model is not None:
-                del model
         self._models.clear()
         self._label_encoders.clear()
+        self._comment_scores = None
+        self._candidate_index = None
+        self._comment_index = None
+        self._user_index = None
+        self._post_index = None
+        self._post_id_values = None
+        self._indexed_posts = None
         gc.collect()
 
     @staticmethod
@@ -63,9 +144,9 @@ class FaultSimulator:
             end_idx = min(start_idx + batch_size, len(data))
             chunk = data.iloc[start_idx:end_idx].copy()
             result_chunks.append(chunk)
-            gc.collect()
         return pd.concat(result_chunks) if result_chunks else pd.DataFrame()
 
+    @traced(rows=lambda features: features.shape[0])
     def _prepare_features(self, comments: pd.DataFrame, batch_size: int = 1000) -> csr_matrix | Any:
         """
         Feature preparation using sparse matrices and batching with label encoding
@@ -95,213 +176,385 @@ class FaultSimulator:
             ])
 
             features_list.append(chunk_features)
-            gc.collect()
 
         # Combine all chunks
         if features_list:
             return vstack(features_list, format='csr')
         return csr_matrix((0, 2))
 
-    def group_similar_comments(self, comments: pd.DataFrame) -> np.ndarray:
+    @traced(rows=len)
+    def group_similar_comments(self, comments: pd.DataFrame, voting: str = 'hard', epochs: int = 1,
+                               batch_size: int = 1000, sample_size: int = 100_000) -> np.ndarray:
         """
         Grouping of similar comments with label handling
+
+        SGD is trained out-of-core with partial_fit over every batch of the feature matrix
+        for the given number of epochs. LogisticRegression and RandomForest cannot be fit
+        incrementally, so they are fit on a reservoir sample of at most sample_size rows.
+        Every row is then predicted and the three models are combined by hard majority
+        voting or, with voting='soft', by averaging their predicted probabilities.
+        Ties go to the lowest label.
+
+        Every comment also gets an ensemble score, the share of the three models whose
+        prediction for it is its own post's group. It is computed on the training labels, so
+        it measures how well the models fit that comment (0, 1/3, 2/3 or 1) rather than the
+        confidence of the voted group. It only ranks the resolution candidates of each post.
+
+        With an artifact store, the trained models, label encoders, group labels and scores are
+        saved under a fingerprint of the comments and the hyperparameters, and later runs
+        with the same inputs load them instead of retraining.
         """
         if not isinstance(comments, pd.DataFrame):
             raise ValueError("Comments must be a pandas DataFrame")
+        if voting not in ('hard', 'soft'):
+            raise ValueError("Voting must be either 'hard' or 'soft'")
+        if epochs < 1:
+            raise ValueError("Epochs must be at least 1")
 
         try:
-            batch_size = 1000
+            # Initialize classifiers
+            sgd = SGDClassifier(loss='log_loss', max_iter=5, tol=1e-2, random_state=42, n_jobs=8)
+            logistic = LogisticRegression(max_iter=5, solver='sag', n_jobs=8)
+            rf = RandomForestClassifier(n_estimators=4, max_depth=5, n_jobs=8)
+            models = {
+                'sgd_classifier': sgd,
+                'logistic_classifier': logistic,
+                'rf_classifier': rf
+            }
+
+            # Reuse the artifacts of a previous run on the same data and hyperparameters
+            artifact_key = None
+            if self._artifact_store is not None:
+                params = {
+                    'voting': voting,
+                    'epochs': epochs,
+                    'batch_size': batch_size,
+                    'sample_size': sample_size,
+                    'models': {name: model.get_params() for name, model in models.items()}
+                }
+                artifact_key = self._artifact_store.fingerprint(comments, params)
+                artifacts = self._artifact_store.load(artifact_key)
+                if artifacts is not None:
+                    self._models.update(artifacts['models'])
+                    self._label_encoders.update(artifacts['label_encoders'])
+                    self._comment_scores = artifacts['scores']
+                    print("⚡ Loaded trained grouping models from the artifact store")
+                    return artifacts['groups']
+
             features = self._prepare_features(comments, batch_size)
+            n_rows = features.shape[0]
 
             # Convert PostId to numeric categories
             if 'PostId' not in self._label_encoders:
                 self._label_encoders['PostId'] = SafeLabelEncoder()
 
             # Ensure PostId is handled
-            comments['PostId'] = comments['PostId'].fillna(-1).astype(str)
-            labels = self._label_encoders['PostId'].fit_transform(comments['PostId'])
+            post_ids = comments['PostId'].fillna(-1).astype(str)
+            labels = self._label_encoders['PostId'].fit_transform(post_ids)
             unique_classes = np.unique(labels)
 
             if len(unique_classes) < 2:
                 return np.zeros(len(comments), dtype=np.int32)
 
-            # Initialize classifiers
-            sgd = SGDClassifier(loss='log_loss', max_iter=5, tol=1e-2, random_state=42, n_jobs=8)
-            logistic = LogisticRegression(max_iter=5, solver='sag', n_jobs=8)
-            rf = RandomForestClassifier(n_estimators=4, max_depth=5, n_jobs=8)
+            self._models.update(models)
+
+            # Stream every batch through SGD, sampling rows for the non-incremental models
+            reservoir = ReservoirSampler(sample_size, random_state=42)
+            for epoch in range(epochs):
+                epoch_start = time.perf_counter()
+                for start_idx in range(0, n_rows, batch_size):
+                    end_idx = min(start_idx + batch_size, n_rows)
+                    batch_features = features[start_idx:end_idx]
+                    batch_labels = labels[start_idx:end_idx]
+
+                    if epoch == 0 and start_idx == 0:
+                        sgd.partial_fit(batch_features, batch_labels, classes=unique_classes)
+                    else:
+                        sgd.partial_fit(batch_features, batch_labels)
+
+                    if epoch == 0:
+                        reservoir.add(np.arange(start_idx, end_idx))
+
+                epoch_seconds = max(time.perf_counter() - epoch_start, 1e-9)
+                print(f"⌛ Training epoch {epoch + 1}/{epochs}: {n_rows / epoch_seconds:,.0f} rows/s")
+
+            sample_rows = np.sort(reservoir.sample())
+            logistic.fit(features[sample_rows], labels[sample_rows])
+            rf.fit(features[sample_rows], labels[sample_rows])
+
+            # Predict every row in batches
+            predictions = np.zeros((n_rows, 3), dtype=np.int32)
+            final_predictions = np.zeros(n_rows, dtype=np.int32)
+            for start_idx in range(0, n_rows, batch_size):
+                end_idx = min(start_idx + batch_size, n_rows)
+                batch_features = features[start_idx:end_idx]
 
-            self._models.update({
-                'sgd_classifier': weakref.ref(sgd),
-                'logistic_classifier': weakref.ref(logistic),
-                'rf_classifier': weakref.ref(rf)
-            })
+                for model_index, model in enumerate(models.values()):
+                    predictions[start_idx:end_idx, model_index] = model.predict(batch_features)
 
-            # Train classifiers in batches
-            predictions = np.zeros((len(comments), 3), dtype=np.int32)
+                if voting == 'soft':
+                    final_predictions[start_idx:end_idx] = soft_vote(
+                        [model.predict_proba(batch_features) for model in models.values()],
+                        [model.classes_ for model in models.values()]
+                    )
 
-            training_iterations = 2
-            for start_idx in range(0, training_iterations): # 1
-                print(f"⌛ Training model {start_idx + 1}/{training_iterations}")
-                end_idx = min(start_idx + batch_size, features.shape[0])
-                batch_features = features[start_idx:end_idx]
-                batch_labels = labels[start_idx:end_idx]
-
-                if start_idx == 0:
-                    sgd.partial_fit(batch_features, batch_labels, classes=unique_classes)
-                    logistic.fit(batch_features, batch_labels)
-                    rf.fit(batch_features, batch_labels)
-                else:
-                    sgd.partial_fit(batch_features, batch_labels)
-
-                predictions[start_idx:end_idx, 0] = sgd.predict(batch_features)
-                predictions[start_idx:end_idx, 1] = logistic.predict(batch_features)
-                predictions[start_idx:end_idx, 2] = rf.predict(batch_features)
-
-                gc.collect()
-
-            # Majority voting algorithm
-            final_predictions = np.zeros(len(comments), dtype=np.int32)
-            for i in range(0, len(comments), batch_size):
-                end_idx = min(i + batch_size, len(comments))
-                batch_pred = predictions[i:end_idx]
-                final_predictions[i:end_idx] = np.apply_along_axis(
-                    lambda x: np.bincount(x).argmax(),
-                    axis=1,
-                    arr=batch_pred
+            # Majority voting over all rows in one vectorized pass
+            if voting == 'hard':
+                final_predictions = hard_majority_vote(predictions)
+
+            # Ensemble score of a comment: share of the models fitting its own post's group (a training-fit measure)
+            self._comment_scores = (predictions == labels.reshape(-1, 1)).mean(axis=1)
+
+            if artifact_key is not None:
+                self._artifact_store.save(
+                    artifact_key, final_predictions, models, self._label_encoders, self._comment_scores
                 )
-                gc.collect()
 
             return final_predictions
 
         finally:
+            # One full collection once the training intermediates are released
             gc.collect()
 
-    @staticmethod
-    def predict_best_comment(self, posts: pd.DataFrame, comments: pd.DataFrame) -> Optional[int]:
-        try:
-            comment_id = comments['Id'].sample(n=1).iloc[0]
-            return  comment_id
-
-            # Batch size
-            batch_size = 1000
-            features = self._prepare_features(comments, batch_size)
+    @traced()
+    def build_candidate_index(self, comments: pd.DataFrame, top_k: int = 5) -> CommentCandidateIndex:
+        """
+        Builds the per-post candidate index used to resolve faults, ranking each post's
+        comments by their ensemble score from group_similar_comments (the share of models
+        fitting the comment's own post) and then by Score.
+        """
+        ensemble_scores = self._comment_scores
+        if ensemble_scores is not None and len(ensemble_scores) != len(comments):
+            ensemble_scores = None
 
-            # Binary target
-            posts['Id'] = pd.to_numeric(posts['Id'], errors='coerce').fillna(-1)
-            median_id = posts['Id'].median()
-            best_comment_index = comment_id
+        self._candidate_index = CommentCandidateIndex.from_comments(comments, ensemble_scores, top_k)
+        return self._candidate_index
 
-            target = (posts['Id'] > median_id).astype(int)
-            unique_classes = np.array([0, 1])
+    @traced()
+    def build_lookup_indexes(self, users: pd.DataFrame, comments: pd.DataFrame, posts: pd.DataFrame) -> None:
+        """
+        Builds the id to row indexes used by handle_fault: comments by Id,
+        users by AccountId and posts by Id.
+        """
+        self._comment_index = IdIndex(comments['Id'])
+        self._user_index = IdIndex(users['AccountId'])
+        self._index_posts(posts)
 
-            if len(np.unique(target)) < 2:
-                return best_comment_index
+        # Plain int64 id column for the vectorized batch path, -1 for missing ids
+        self._comment_user_ids = pd.to_numeric(comments['UserId'], errors='coerce').fillna(-1).to_numpy(dtype=np.int64)
 
-            # Initialize classifiers
-            sgd = SGDClassifier(loss='log_loss', max_iter=5, tol=1e-2, random_state=42)
-            logistic = LogisticRegression(max_iter=50, solver='sag', n_jobs=2)
-            rf = RandomForestClassifier(n_estimators=20, max_depth=5, n_jobs=2)
+    def _index_posts(self, posts: pd.DataFrame) -> None:
+        self._post_index = IdIndex(posts['Id'])
+        self._post_id_values = pd.to_numeric(posts['Id'], errors='coerce').fillna(-1).to_numpy(dtype=np.int64)
+        # The frame the post indexes were built from, to notice when another one is passed
+        self._indexed_posts = (id(posts), len(posts))
 
-            self._models.update({
-                'comment_sgd': weakref.ref(sgd),
-                'comment_logistic': weakref.ref(logistic),
-                'comment_rf': weakref.ref(rf)
-            })
+    def batch_resolver(self) -> FaultBatchResolver:
+        """
+        Returns the vectorized fault resolver over the built candidate and lookup indexes.
+        """
+        if self._candidate_index is None or self._comment_index is None:
+            raise ValueError("The candidate and lookup indexes must be built first")
+        return FaultBatchResolver(self._post_id_values, self._candidate_index, self._comment_index,
+                                  self._user_index, self._comment_user_ids)
 
-            # Train and predict in batches
-            all_probs = np.zeros((len(comments), 3))
+    def predict_best_comment(self, post_id: int) -> Optional[int]:
+        """
+        Returns the best ranked comment of the faulty post with an O(k) index lookup.
+        Posts without comments fall back to a random comment, as before.
+        """
+        if self._candidate_index is None:
+            raise ValueError("The candidate index must be built with build_candidate_index first")
+
+        comment_id = self._candidate_index.best_for(post_id)
+        if comment_id is None and len(self._candidate_index.comment_ids) > 0:
+            random_row = self._rng.integers(len(self._candidate_index.comment_ids))
+            comment_id = int(self._candidate_index.comment_ids[random_row])
+        return comment_id
+
+    def _get_fault_source(self, posts: pd.DataFrame, servers: List) -> FaultSource:
+        source = self._fault_source
+        if source is not None and source.n_posts == len(posts) and source.n_servers == len(servers):
+            return source
+        if not self._default_fault_source:
+            raise ValueError(f"The fault source draws from {source.n_posts} posts and {source.n_servers} servers, "
+                             f"got {len(posts)} posts and {len(servers)} servers")
+
+        # Recreate the default uniform source when the posts or the cluster changed size
+        self._fault_source = FaultSource(len(posts), len(servers), seed=self._rng.integers(2 ** 63))
+        return self._fault_source
+
+    def _print(self, *args) -> None:
+        if self.verbose:
+            print(*args)
+
+    def detect_fault(self, posts: pd.DataFrame, servers: List) -> Optional[Tuple[int, Any]]:
+        """
+        Draws the next fault and records it on the faulty server.
 
-            for start_idx in range(0, features.shape[0], batch_size):
-                end_idx = min(start_idx + batch_size, features.shape[0])
-                batch_features = features[start_idx:end_idx]
-                batch_target = target[start_idx:end_idx]
+        Returns:
+            tuple or None: (fault id, faulty server), or None when no fault could be recorded.
+        """
+        if not servers:
+            self._print("ℹ️ No servers available for fault handling")
+            return None
 
-                if start_idx == 0:
-                    sgd.partial_fit(batch_features, batch_target, classes=unique_classes)
-                    logistic.fit(batch_features, batch_target)
-                    rf.fit(batch_features, batch_target)
-                else:
-                    sgd.partial_fit(batch_features, batch_target)
+        if posts.empty:
+            self._print("No fault detected")
+            return None
 
-                all_probs[start_idx:end_idx, 0] = sgd.predict_proba(batch_features)[:, 1]
-                all_probs[start_idx:end_idx, 1] = logistic.predict_proba(batch_features)[:, 1]
-                all_probs[start_idx:end_idx, 2] = rf.predict_proba(batch_features)[:, 1]
+        # Draw the faulty post and server from the pre-drawn fault stream
+        fault_source = self._get_fault_source(posts, servers)
+        fault_row, faulty_server_index = fault_source.next_fault()
+        faulty_server = servers[faulty_server_index]
+
+        # Update fault tracking
+        self._total_faults += 1
+        server_id = faulty_server.id_servera
+        self._fault_counts[server_id] = self._fault_counts.get(server_id, 0) + 1
+        if self._gc_policy is not None:
+            self._gc_policy.on_faults(1)
+        if self._metrics is not None:
+            self._metrics.faults_generated.inc()
+
+        # Add fault to server
+        try:
+            fault_id = int(posts['Id'].iat[fault_row])
+            faulty_server.dodaj_otkaz(fault_id)
+        except (ValueError, TypeError):
+            self._print("Invalid fault ID detected")
+            return None
 
-                gc.collect()
+        self._print(f"\n⚠️ Fault detected on server {faulty_server.naziv} (ID: {server_id})")
+        self._print(f"Fault ID: {fault_id}")
+        self._print(f"Current server fault count: {faulty_server.broj_otkaza}")
+        self._print(f"Total system faults: {self._total_faults}")
 
-            # Find best comment
-            ensemble_probs = np.mean(all_probs, axis=1)
-            best_comment_idx = np.argmax(ensemble_probs)
+        return fault_id, faulty_server
 
-            return comment_id
+    def resolve_fault(self, fault_id: int, users: pd.DataFrame, comments: pd.DataFrame,
+                      posts: pd.DataFrame) -> str:
+        """
+        Resolves a detected fault from the precomputed candidates of the faulty post.
 
-        except Exception as e:
-            return None
-        finally:
-            gc.collect()
+        Returns:
+            str: FAULT_RESOLVED, FAULT_PARTIALLY_RESOLVED or FAULT_UNRESOLVED.
+        """
+        outcome = self._resolve_fault(fault_id, users, comments, posts)
+        if self._metrics is not None:
+            self._metrics.record_outcome(outcome)
+        return outcome
+
+    def _resolve_fault(self, fault_id: int, users: pd.DataFrame, comments: pd.DataFrame,
+                       posts: pd.DataFrame) -> str:
+        if self._candidate_index is None:
+            self.build_candidate_index(comments)
+        if self._comment_index is None:
+            self.build_lookup_indexes(users, comments, posts)
+        predicted_comment = self.predict_best_comment(fault_id)
+
+        if predicted_comment is None:
+            self._print("\n❌ Fault could not be resolved")
+            self._print("No suitable resolution found")
+            return FAULT_UNRESOLVED
 
+        try:
+            comment_row = self._comment_index.lookup(predicted_comment)
+            if comment_row < 0:
+                raise IndexError("Comment not found")
+            comment_info = comments.iloc[comment_row]
+
+            user_row = self._user_index.lookup(comment_info['UserId'])
+            if user_row < 0:
+                raise IndexError("User not found")
+            user_info = users.iloc[user_row]
+
+            # Preprocessed users keep only the PCA features and AccountId
+            user_name = user_info.get('DisplayName', f"AccountId {int(user_info['AccountId'])}")
+        except IndexError:
+            self._print("\n⚠️ Fault partially resolved - Some information not found")
+            return FAULT_PARTIALLY_RESOLVED
+
+        self._resolved_faults += 1
+        self._print(f"\n✅ Fault successfully resolved!")
+        self._print(f"Resolution provided by user: {user_name}")
+        self._print(f"Total resolved faults: {self._resolved_faults}/{self._total_faults}")
+        self._print(f"Current resolution rate: {(self._resolved_faults / self._total_faults) * 100:.1f}%")
+        return FAULT_RESOLVED
+
+    @traced()
     def handle_fault(self, users: pd.DataFrame, comments: pd.DataFrame,
-                     posts: pd.DataFrame, servers: List, grouped_comments: np.ndarray) -> None:
+                     posts: pd.DataFrame, servers: List, grouped_comments: Optional[np.ndarray] = None) -> None:
         """
         Fault handling with data handling
+
+        Errors are left to the caller, and only faults handled without one are timed.
+        grouped_comments is no longer used, since faults are resolved from the candidate
+        index; it is kept so existing callers still work.
         """
-        try:
-            if not servers:
-                print("ℹ️ No servers available for fault handling")
-                return
-
-            # Select server with fair distribution
-            fault = pick_a_server_fault(posts)
-            if fault is None or fault.empty:
-                print("No fault detected")
-                return
-
-            random.seed(datetime.now().timestamp())
-            faulty_server_index = random.randint(0, len(servers) - 1)
-            faulty_server = servers[faulty_server_index]
-
-            # Update fault tracking
-            self._total_faults += 1
-            server_id = faulty_server.id_servera
-            self._fault_counts[server_id] = self._fault_counts.get(server_id, 0) + 1
-
-            # Add fault to server
-            try:
-                fault_id = int(fault["Id"].iloc[0])
-                faulty_server.dodaj_otkaz(fault_id)
-            except (ValueError, TypeError):
-                print("Invalid fault ID detected")
-                return
-
-            print(f"\n⚠️ Fault detected on server {faulty_server.naziv} (ID: {server_id})")
-            print(f"Fault ID: {fault_id}")
-            print(f"Current server fault count: {len(faulty_server.lista_otkaza)}")
-            print(f"Total system faults: {self._total_faults}")
-
-            # Process prediction in smaller chunks
-            predicted_comment = self.predict_best_comment(
-                self,
-                posts,
-                comments
-            )
-
-            if predicted_comment is not None:
-                try:
-                    comment_info = comments[comments['Id'] == predicted_comment].iloc[0]
-                    user_info = users[users['AccountId'] == comment_info['UserId']].iloc[0]
-
-                    self._resolved_faults += 1
-                    print(f"\n✅ Fault successfully resolved!")
-                    print(f"Resolution provided by user: {user_info['DisplayName']}")
-                    print(f"Total resolved faults: {self._resolved_faults}/{self._total_faults}")
-                    print(f"Current resolution rate: {(self._resolved_faults / self._total_faults) * 100:.1f}%")
-                except IndexError:
-                    print("\n⚠️ Fault partially resolved - Some information not found")
-            else:
-                print("\n❌ Fault could not be resolved")
-                print("No suitable resolution found")
-
-        except Exception as e:
-            print("")
-        finally:
-            gc.collect()
\ No newline at end of file
+        started = time.perf_counter()
+        detected = self.detect_fault(posts, servers)
+        if detected is not None:
+            fault_id, faulty_server = detected
+            self.resolve_fault(fault_id, users, comments, posts)
+
+        if self._metrics is not None:
+            self._metrics.handle_fault_seconds.observe(time.perf_counter() - started)
+
+    @traced(rows=len)
+    def handle_faults(self, users: pd.DataFrame, comments: pd.DataFrame, posts: pd.DataFrame,
+                      servers: List, n_faults: Optional[int] = None, post_rows=None,
+                      server_indices=None) -> np.ndarray:
+        """
+        Handles a batch of faults in one vectorized pass.
+
+        The faults are either given as arrays of post rows and server indices or drawn
+        from the fault source when only n_faults is given. Servers are assigned,
+        candidates resolved and per-server counters updated with NumPy operations.
+
+        Returns:
+            np.ndarray: Structured array of FAULT_RESULT_DTYPE with one entry per fault.
+        """
+        if not servers or posts.empty:
+            return np.empty(0, dtype=FAULT_RESULT_DTYPE)
+        started = time.perf_counter()
+
+        if post_rows is None or server_indices is None:
+            if n_faults is None:
+                raise ValueError("Either n_faults or post_rows and server_indices are required")
+            drawn_rows, drawn_servers = self._get_fault_source(posts, servers).draw(n_faults)
+            post_rows = drawn_rows if post_rows is None else post_rows
+            server_indices = drawn_servers if server_indices is None else server_indices
+        post_rows = np.asarray(post_rows, dtype=np.int64)
+        server_indices = np.asarray(server_indices, dtype=np.int64)
+
+        if self._candidate_index is None:
+            self.build_candidate_index(comments)
+        if self._comment_index is None:
+            self.build_lookup_indexes(users, comments, posts)
+        elif self._indexed_posts != (id(posts), len(posts)):
+            self._index_posts(posts)
+
+        results = self.batch_resolver().resolve(post_rows, server_indices, self._rng)
+        valid = results['post_id'] >= 0
+
+        # Update the counters and the servers' fault lists, grouped per server
+        self._total_faults += int(valid.sum())
+        self._resolved_faults += int(np.count_nonzero(results['status'] == STATUS_RESOLVED))
+        per_server = add_faults_to_servers(servers, results)
+
+        for server_index in np.flatnonzero(per_server):
+            server_id = servers[server_index].id_servera
+            self._fault_counts[server_id] = self._fault_counts.get(server_id, 0) + int(per_server[server_index])
+
+        if self._gc_policy is not None:
+            self._gc_policy.on_faults(len(results))
+        if self._metrics is not None:
+            outcomes = np.bincount(results['status'], minlength=3)
+            self._metrics.faults_generated.inc(int(valid.sum()))
+            self._metrics.record_outcome(FAULT_UNRESOLVED, int(outcomes[STATUS_UNRESOLVED]))
+            self._metrics.record_outcome(FAULT_PARTIALLY_RESOLVED, int(outcomes[STATUS_PARTIALLY_RESOLVED]))
+            self._metrics.record_outcome(FAULT_RESOLVED, int(outcomes[STATUS_RESOLVED]))
+            self._metrics.handle_faults_batch_seconds.observe(time.perf_counter() - started)
+
+        return results
@@ -0,0 +1,109 @@
+import heapq
+import itertools
+import time
+from threading import Event
+from typing import Callable, Optional
+
+
+class VirtualClock:
+    """
+    Simulated time in seconds, advanced by the scheduler as events are processed.
+    """
+    def __init__(self, start: float = 0.0):
+        self.now = start
+
+    def advance_to(self, timestamp: float) -> None:
+        if timestamp < self.now:
+            raise ValueError("The virtual clock cannot move backwards")
+        self.now = timestamp
+
+
+class EventScheduler:
+    """
+    Discrete-event scheduler over a virtual clock.
+
+    Events are kept in a priority queue ordered by virtual time and insertion order, and
+    are processed as fast as the CPU allows. With realtime pacing, processing is slowed
+    down so that virtual time advances at speed times the wall-clock rate.
+    """
+    def __init__(self, clock: Optional[VirtualClock] = None, realtime: bool = False, speed: float = 1.0):
+        if speed <= 0:
+            raise ValueError("Speed must be positive")
+
+        self.clock = clock or VirtualClock()
+        self.realtime = realtime
+        self.speed = speed
+        self.processed_events = 0
+        self._queue = []
+        self._sequence = itertools.count()
+
+    def __len__(self):
+        return len(self._queue)
+
+    @property
+    def now(self) -> float:
+        return self.clock.now
+
+    def schedule_at(self, timestamp: float, callback: Callable, *args) -> None:
+        """
+        Schedules callback(*args) at an absolute virtual time.
+        """
+        if timestamp < self.clock.now:
+            raise ValueError("Events cannot be scheduled in the past")
+        heapq.heappush(self._queue, (timestamp, next(self._sequence), callback, args))
+
+    def schedule(self, delay: float, callback: Callable, *args) -> None:
+        """
+        Schedules callback(*args) after a virtual delay in seconds.
+        """
+        self.schedule_at(self.clock.now + delay, callback, *args)
+
+    def run(self, until: Optional[float] = None, max_events: Optional[int] = None,
+            stop_event: Optional[Event] = None) -> int:
+        """
+        Processes events in time order.
+
+        Args:
+            until (float, optional): Stop before the first event scheduled after this virtual time;
+                                     the clock is then advanced to it.
+            max_events (int, optional): Stop after processing this many events.
+            stop_event (Event, optional): Stop as soon as the event is set.
+
+        Returns:
+            int: Number of events processed by this call.
+        """
+        processed = 0
+        wall_start = time.perf_counter()
+        virtual_start = self.clock.now
+
+        while self._queue:
+            if stop_event is not None and stop_event.is_set():
+                break
+            if max_events is not None and processed >= max_events:
+                break
+
+            timestamp = self._queue[0][0]
+            if until is not None and timestamp > until:
+                break
+
+            if self.realtime:
+                # Wait until the wall clock catches up with the event's virtual time
+                delay = (timestamp - virtual_start) / self.speed - (time.perf_counter() - wall_start)
+                if delay > 0:
+                    if stop_event is not None:
+                        if stop_event.wait(delay):
+                            break
+                    else:
+                        time.sleep(delay)
+
+            timestamp, _, callback, args = heapq.heappop(self._queue)
+            self.clock.advance_to(timestamp)
+            callback(*args)
+            processed += 1
+
+        if until is not None and (stop_event is None or not stop_event.is_set()) \
+                and (max_events is None or processed < max_events) and until > self.clock.now:
+            self.clock.advance_to(until)
+
+        self.processed_events += processed
+        return processed
@@ -0,0 +1,235 @@
+import os
+from xml.sax.saxutils import escape
+
+import numpy as np
+
+# First shard number of each dump, matching the shard ranges the importers read by default
+USERS_FIRST_SHARD = 1
+POSTS_FIRST_SHARD = 0
+COMMENTS_FIRST_SHARD = 1
+
+# Share of users, posts and comments in a Stack Exchange dump
+DUMP_ROW_SHARES = {'n_users': 0.12, 'n_posts': 0.36, 'n_comments': 0.52}
+
+# Words of generated bodies and comments, escaped once as XML attribute text
+TEXT_VOCABULARY = [escape(word, {'"': "&quot;"}) for word in (
+    "server", "fault", "disk", "memory", "kernel", "timeout", "restart", "config", "cache", "thread",
+    "socket", "driver", "update", "error", "log", "network", "latency", "backup", "cluster", "node",
+    "<code>", "</code>", "<p>", "</p>", "<b>", "</b>", "&", "\"quoted\"", "it's", "fix"
+)]
+TAG_VOCABULARY = ["linux", "windows", "networking", "hardware", "raid", "dns", "nginx", "docker", "backup", "ssh"]
+LOCATIONS = ["Belgrade", "Novi Sad", "Berlin", "London", "New York", "Tokyo", "Sydney", "S&#227;o Paulo"]
+
+DUMP_START = np.datetime64("2008-08-01T00:00:00", "ms")
+DUMP_SPAN_MS = np.int64(16 * 365 * 24 * 3600 * 1000)
+
+POST_TYPE_IDS = np.array([1, 2, 3, 4, 5, 6, 7])
+POST_TYPE_SHARES = np.array([0.40, 0.55, 0.01, 0.015, 0.015, 0.005, 0.005])
+
+
+def scale_row_counts(total_rows: int) -> dict:
+    """
+    Splits a total row count between users, posts and comments in the proportions of a
+    real Stack Exchange dump, as the n_users, n_posts and n_comments of generate_dump.
+    """
+    return {count: max(1, int(total_rows * share)) for count, share in DUMP_ROW_SHARES.items()}
+
+
+def _skewed_ids(rng, n_ids: int, size: int, skew: float) -> np.ndarray:
+    """
+    Draws ids in 1..n_ids where a few ids are very popular. The popularity rank follows
+    n_ids * u**skew, and ranks are scattered over the id range with a multiplicative
+    bijection so popular ids are not all adjacent.
+    """
+    ranks = np.minimum((n_ids * rng.random(size) ** skew).astype(np.int64), n_ids - 1)
+    multiplier = 2_654_435_761 % n_ids or 1
+    while np.gcd(multiplier, n_ids) != 1:
+        multiplier += 1
+    return (ranks * multiplier) % n_ids + 1
+
+
+def _dates(rng, ids: np.ndarray, n_total: int) -> np.ndarray:
+    # Creation dates grow with the id, with some jitter
+    offsets = (ids / max(n_total, 1) * DUMP_SPAN_MS).astype(np.int64) + rng.integers(0, 3_600_000, len(ids))
+    return np.datetime_as_string(DUMP_START + np.minimum(offsets, DUMP_SPAN_MS).astype("timedelta64[ms]"), unit="ms")
+
+
+def _texts(rng, size: int, mean_words: float) -> list:
+    lengths = np.maximum(rng.poisson(mean_words, size), 1)
+    words = rng.integers(0, len(TEXT_VOCABULARY), int(lengths.sum()))
+    ends = np.cumsum(lengths)
+    starts = ends - lengths
+    vocabulary = TEXT_VOCABULARY
+    return [" ".join(vocabulary[word] for word in words[start:end]) for start, end in zip(starts, ends)]
+
+
+def _optional(name: str, values, present) -> list:
+    return [f' {name}="{value}"' if keep else "" for value, keep in zip(values, present)]
+
+
+def _users_rows(rng, first_id: int, size: int, n_users: int, skew: float) -> list:
+    ids = np.arange(first_id, first_id + size)
+    reputation = np.maximum(1, np.floor(rng.lognormal(1.0, 2.0, size))).astype(np.int64)
+    up_votes = np.floor(reputation * rng.beta(0.5, 5.0, size)).astype(np.int64)
+    down_votes = rng.geometric(0.7, size) - 1
+    views = rng.geometric(0.05, size) - 1
+    dates = _dates(rng, ids, n_users)
+    locations = _optional("Location", np.array(LOCATIONS)[rng.integers(0, len(LOCATIONS), size)],
+                          rng.random(size) < 0.3)
+    about = _optional("AboutMe", _texts(rng, size, 6), rng.random(size) < 0.1)
+    # A few users have no network account. The pipeline joins posts and comments on
+    # AccountId, so it is kept equal to the user Id
+    accounts = _optional("AccountId", ids, rng.random(size) >= 0.03)
+
+    return [
+        f'  <row Id="{user_id}" Reputation="{rep}" CreationDate="{date}" DisplayName="user{user_id}" '
+        f'LastAccessDate="{date}"{location}{about_me} Views="{view_count}" UpVotes="{up}" DownVotes="{down}"'
+        f'{account} />\n'
+        for user_id, rep, date, location, about_me, view_count, up, down, account in zip(
+            ids.tolist(), reputation.tolist(), dates, locations, about, views.tolist(), up_votes.tolist(),
+            down_votes.tolist(), accounts)
+    ]
+
+
+class _QuestionIds:
+    """
+    Growable array of the question ids written so far, in increasing order.
+    """
+    def __init__(self):
+        self.ids = np.empty(1024, dtype=np.int64)
+        self.size = 0
+
+    def extend(self, new_ids: np.ndarray) -> None:
+        if self.size + len(new_ids) > len(self.ids):
+            grown = np.empty(max(2 * len(self.ids), self.size + len(new_ids)), dtype=np.int64)
+            grown[:self.size] = self.ids[:self.size]
+            self.ids = grown
+        self.ids[self.size:self.size + len(new_ids)] = new_ids
+        self.size += len(new_ids)
+
+
+def _posts_rows(rng, first_id: int, size: int, n_posts: int, n_users: int, skew: float,
+                question_ids: _QuestionIds) -> list:
+    ids = np.arange(first_id, first_id + size)
+    post_types = rng.choice(POST_TYPE_IDS, size, p=POST_TYPE_SHARES)
+    if first_id == 1:
+        # The dump opens with a question so every answer has one to reply to
+        post_types[0] = 1
+    is_question = post_types == 1
+    is_answer = post_types == 2
+
+    # Answers reply to earlier questions, recent and popular questions getting most answers
+    question_ids.extend(ids[is_question])
+    answer_ids = ids[is_answer]
+    questions_before = np.searchsorted(question_ids.ids[:question_ids.size], answer_ids)
+    picks = questions_before - 1 - (questions_before * rng.random(len(answer_ids)) ** skew).astype(np.int64)
+    parents = np.zeros(size, dtype=np.int64)
+    parents[is_answer] = question_ids.ids[np.maximum(picks, 0)]
+
+    scores = (np.floor(rng.lognormal(0.0, 1.5, size)) - rng.geometric(0.8, size) + 1).astype(np.int64)
+    view_counts = np.floor(rng.lognormal(5.0, 1.5, size)).astype(np.int64).tolist()
+    answer_counts = (rng.geometric(0.45, size) - 1).tolist()
+    comment_counts = (rng.geometric(0.4, size) - 1).tolist()
+    owners = _optional("OwnerUserId", _skewed_ids(rng, n_users, size, skew), rng.random(size) >= 0.02)
+    dates = _dates(rng, ids, n_posts)
+    bodies = _texts(rng, size, 40)
+    titles = _texts(rng, size, 8)
+    tags = ["".join(f"&lt;{TAG_VOCABULARY[tag]}&gt;" for tag in rng.integers(0, len(TAG_VOCABULARY), count))
+            for count in rng.integers(1, 4, size)]
+    parents = parents.tolist()
+
+    rows = []
+    for row, (post_id, post_type, date, score, body, owner) in enumerate(zip(
+            ids.tolist(), post_types.tolist(), dates, scores.tolist(), bodies, owners)):
+        if post_type == 1:
+            extra = (f' ViewCount="{view_counts[row]}" Title="{titles[row]}" Tags="{tags[row]}" '
+                     f'AnswerCount="{answer_counts[row]}"')
+        elif post_type == 2:
+            extra = f' ParentId="{parents[row]}"'
+        else:
+            extra = ""
+        rows.append(
+            f'  <row Id="{post_id}" PostTypeId="{post_type}"{extra} CreationDate="{date}" Score="{score}" '
+            f'Body="{body}"{owner} LastActivityDate="{date}" CommentCount="{comment_counts[row]}" '
+            f'ContentLicense="CC BY-SA 4.0" />\n'
+        )
+    return rows
+
+
+def _comments_rows(rng, first_id: int, size: int, n_comments: int, n_posts: int, n_users: int,
+                   skew: float) -> list:
+    ids = np.arange(first_id, first_id + size)
+    post_ids = _skewed_ids(rng, n_posts, size, skew)
+    scores = rng.geometric(0.6, size) - 1
+    texts = _texts(rng, size, 15)
+    dates = _dates(rng, ids, n_comments)
+    # Comments of deleted users keep only their display name
+    has_user = rng.random(size) >= 0.02
+    user_ids = _skewed_ids(rng, n_users, size, skew)
+    users = [f' UserId="{user_id}"' if keep else f' UserDisplayName="user{user_id}"'
+             for user_id, keep in zip(user_ids.tolist(), has_user)]
+
+    return [
+        f'  <row Id="{comment_id}" PostId="{post_id}" Score="{score}" Text="{text}" CreationDate="{date}"'
+        f'{user} ContentLicense="CC BY-SA 4.0" />\n'
+        for comment_id, post_id, score, text, date, user in zip(
+            ids.tolist(), post_ids.tolist(), scores.tolist(), texts, dates, users)
+    ]
+
+
+def _write_dump(output_dir: str, name: str, root_tag: str, first_shard: int, n_rows: int,
+                rows_per_shard: int, chunk_size: int, make_rows) -> list:
+    shard_paths = []
+    for shard_index, shard_start in enumerate(range(0, n_rows, rows_per_shard)):
+        shard_path = os.path.join(output_dir, f"{name}-{first_shard + shard_index}.xml")
+        shard_end = min(shard_start + rows_per_shard, n_rows)
+        with open(shard_path, "w", encoding="utf-8") as xml_file:
+            xml_file.write(f'<?xml version="1.0" encoding="utf-8"?>\n<{root_tag}>\n')
+            for chunk_start in range(shard_start, shard_end, chunk_size):
+                chunk_rows = min(chunk_size, shard_end - chunk_start)
+                xml_file.write("".join(make_rows(chunk_start + 1, chunk_rows)))
+            xml_file.write(f"</{root_tag}>\n")
+        shard_paths.append(shard_path)
+    return shard_paths
+
+
+def generate_dump(output_dir: str, n_users: int, n_posts: int, n_comments: int,
+                  rows_per_shard: int = 1_000_000, skew: float = 3.0, seed: int = 0,
+                  chunk_size: int = 100_000) -> dict:
+    """
+    Writes a synthetic Stack Exchange dump as Users, Posts and Comments XML shards.
+
+    The shards follow the real schema, including optional attributes, HTML-escaped text
+    and answers that point at earlier questions. Their values are skewed like the
+    real data: reputation and scores are heavy-tailed, and a small share of users own
+    most posts and comments and a small share of posts get most comments and answers.
+    Rows are generated and written in chunks, so memory stays flat at any scale.
+
+    Args:
+        output_dir (str): Directory for the shards, named like the XmlPaths templates.
+        n_users (int): Number of users.
+        n_posts (int): Number of posts.
+        n_comments (int): Number of comments.
+        rows_per_shard (int): Maximum rows per shard file.
+        skew (float): Popularity skew of owners and commented posts; 1 is uniform.
+        seed (int): Seed of the generator, equal seeds write identical dumps.
+        chunk_size (int): Rows generated and written at a time.
+
+    Returns:
+        dict: Shard paths of 'users', 'posts' and 'comments'.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    question_ids = _QuestionIds()
+
+    return {
+        'users': _write_dump(
+            output_dir, "Users", "users", USERS_FIRST_SHARD, n_users, rows_per_shard, chunk_size,
+            lambda first_id, size: _users_rows(rng, first_id, size, n_users, skew)),
+        'posts': _write_dump(
+            output_dir, "Posts", "posts", POSTS_FIRST_SHARD, n_posts, rows_per_shard, chunk_size,
+            lambda first_id, size: _posts_rows(rng, first_id, size, n_posts, n_users, skew, question_ids)),
+        'comments': _write_dump(
+            output_dir, "Comments", "comments", COMMENTS_FIRST_SHARD, n_comments, rows_per_shard, chunk_size,
+            lambda first_id, size: _comments_rows(rng, first_id, size, n_comments, n_posts, n_users, skew))
+    }
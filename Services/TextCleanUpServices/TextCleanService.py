@@ -1,9 +1,62 @@
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+WHITESPACE_PATTERN = re.compile(r'[\r\n\t]+')
+
+
 def clean_text(text):
-    import  re
     # Remove HTML tags
-    text = re.sub(r'<[^>]+>', '', text)
+    text = HTML_TAG_PATTERN.sub('', text)
     # Remove \n, \r, and other whitespace characters
-    text = re.sub(r'[\r\n\t]+', ' ', text)
+    text = WHITESPACE_PATTERN.sub(' ', text)
     # Strip leading/trailing spaces
     text = text.strip()
-    return text
\ No newline at end of file
+    return text
+
+
+def clean_texts(texts, max_workers=None, chunk_size=200_000):
+    """
+    Cleans a whole column of texts with the same rules as clean_text.
+
+    The cleaning runs as vectorized pandas string operations. Inputs larger than one chunk
+    are split into chunks that are cleaned in parallel worker processes.
+
+    Args:
+        texts (pd.Series or array-like): The texts to clean. Missing values are kept as missing.
+        max_workers (int, optional): Number of worker processes, None for one per CPU core
+                                     and 1 to always clean in the current process.
+        chunk_size (int): Number of texts handled by a single worker task.
+
+    Returns:
+        pd.Series or np.ndarray: The cleaned texts, a Series with the original index for
+                                 Series input and an object array otherwise.
+    """
+    # Work on Python strings so the results match clean_text exactly
+    series = texts if isinstance(texts, pd.Series) else pd.Series(np.asarray(texts, dtype=object))
+    series = series.astype(object)
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    if max_workers <= 1 or len(series) <= chunk_size:
+        cleaned = _clean_chunk(series)
+    else:
+        chunks = [series.iloc[start:start + chunk_size] for start in range(0, len(series), chunk_size)]
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+            cleaned = pd.concat(list(executor.map(_clean_chunk, chunks)))
+
+    if isinstance(texts, pd.Series):
+        return cleaned
+    return cleaned.to_numpy(dtype=object)
+
+
+def _clean_chunk(series):
+    return (series
+            .str.replace(HTML_TAG_PATTERN, '', regex=True)
+            .str.replace(WHITESPACE_PATTERN, ' ', regex=True)
+            .str.strip())
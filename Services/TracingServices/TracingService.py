@@ -0,0 +1,203 @@
+import atexit
+import functools
+import json
+import multiprocessing
+import os
+import threading
+import time
+import tracemalloc
+from typing import Callable, Optional
+
+# Setting this variable to a file path traces the whole run into that file
+TRACE_ENV_VAR = "SERVER_FAULTS_TRACE"
+
+_tracer = None
+
+
+class _Span:
+    __slots__ = ('tracer', 'name', 'args', 'start_ns', 'start_cpu', 'start_memory', 'peak_memory')
+
+    def __init__(self, tracer, name: str, args: dict):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+
+    def set_rows(self, rows: int) -> None:
+        self.args['rows'] = int(rows)
+
+    def __enter__(self):
+        self.tracer._start_span(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.tracer._end_span(self)
+        return False
+
+
+class _NullSpan:
+    """
+    Span returned while tracing is disabled; entering and leaving it does nothing.
+    """
+    __slots__ = ()
+
+    def set_rows(self, rows: int) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """
+    Records nested spans as Chrome trace events, viewable in chrome://tracing, Perfetto
+    or speedscope as a flame graph.
+
+    Every span records its wall time, the CPU time of its thread, optional row counts and,
+    with trace_memory, the peak memory traced by tracemalloc while it was open. The peak
+    of a span includes the peaks of its children.
+    """
+    def __init__(self, output_path: str, trace_memory: bool = True):
+        self.output_path = output_path
+        self.trace_memory = trace_memory
+        self._events = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._origin_ns = time.perf_counter_ns()
+        self._pid = os.getpid()
+        self._started_tracemalloc = trace_memory and not tracemalloc.is_tracing()
+        if self._started_tracemalloc:
+            tracemalloc.start()
+
+    def _stack(self) -> list:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _start_span(self, span: _Span) -> None:
+        stack = self._stack()
+        if self.trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            # Hand the peak reached so far to the enclosing span, then measure this one from here
+            if stack:
+                stack[-1].peak_memory = max(stack[-1].peak_memory, peak)
+            tracemalloc.reset_peak()
+            span.start_memory = current
+            span.peak_memory = current
+        stack.append(span)
+        span.start_cpu = time.thread_time_ns()
+        span.start_ns = time.perf_counter_ns()
+
+    def _end_span(self, span: _Span) -> None:
+        end_ns = time.perf_counter_ns()
+        cpu_ns = time.thread_time_ns() - span.start_cpu
+        stack = self._stack()
+        stack.pop()
+
+        args = span.args
+        args['cpu_ms'] = cpu_ns / 1e6
+        if self.trace_memory:
+            span.peak_memory = max(span.peak_memory, tracemalloc.get_traced_memory()[1])
+            args['peak_memory_bytes'] = span.peak_memory
+            args['memory_growth_bytes'] = span.peak_memory - span.start_memory
+            if stack:
+                stack[-1].peak_memory = max(stack[-1].peak_memory, span.peak_memory)
+            tracemalloc.reset_peak()
+
+        event = {
+            'name': span.name,
+            'cat': 'pipeline',
+            'ph': 'X',
+            'ts': (span.start_ns - self._origin_ns) / 1000,
+            'dur': (end_ns - span.start_ns) / 1000,
+            'pid': self._pid,
+            'tid': threading.get_ident(),
+            'args': args
+        }
+        with self._lock:
+            self._events.append(event)
+
+    def span(self, name: str, **args) -> _Span:
+        return _Span(self, name, args)
+
+    def write(self) -> None:
+        with self._lock:
+            events = list(self._events)
+        with open(self.output_path, "w", encoding="utf-8") as trace_file:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, trace_file)
+        print(f"🔎 Trace with {len(events)} spans written to {self.output_path}")
+
+
+def enable_tracing(output_path: str, trace_memory: bool = True) -> Tracer:
+    """
+    Starts tracing every instrumented stage. The trace is written when disable_tracing
+    is called or, at the latest, when the interpreter exits.
+    """
+    global _tracer
+    if _tracer is not None:
+        return _tracer
+    _tracer = Tracer(output_path, trace_memory)
+    atexit.register(disable_tracing)
+    return _tracer
+
+
+def disable_tracing() -> None:
+    global _tracer
+    tracer, _tracer = _tracer, None
+    if tracer is None:
+        return
+    atexit.unregister(disable_tracing)
+    tracer.write()
+    if tracer._started_tracemalloc:
+        tracemalloc.stop()
+
+
+def tracing_enabled() -> bool:
+    return _tracer is not None
+
+
+def span(name: str, **args):
+    """
+    Context manager timing a block as a span, a shared no-op object while tracing is disabled.
+    """
+    if _tracer is None:
+        return _NULL_SPAN
+    return _tracer.span(name, **args)
+
+
+def traced(name: Optional[str] = None, rows: Optional[Callable] = None):
+    """
+    Decorator recording every call of a function as a span.
+
+    Args:
+        name (str, optional): Span name, the function's qualified name by default.
+        rows (callable, optional): Computes the span's row count from the function's result (e.g. len).
+    """
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            # Disabled tracing costs this one check
+            if _tracer is None:
+                return func(*args, **kwargs)
+            with _tracer.span(span_name) as current_span:
+                result = func(*args, **kwargs)
+                if rows is not None and result is not None:
+                    current_span.set_rows(rows(result))
+                return result
+
+        return wrapper
+
+    return decorator
+
+
+# Worker processes re-import this module and must not overwrite the main process's trace
+if os.environ.get(TRACE_ENV_VAR) and multiprocessing.parent_process() is None:
+    enable_tracing(os.environ[TRACE_ENV_VAR])